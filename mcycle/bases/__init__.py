@@ -5,4 +5,5 @@ from .cycle import Cycle
 from .flowstate import FlowState, FlowStatePoly, RefData
 from .geom import Geom
 from .solidmaterial import SolidMaterial
+from .solvers import *
 from .utils import *
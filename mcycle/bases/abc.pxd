@@ -1,13 +1,27 @@
+cdef object _stamp(value)
+
+cdef inline object _stampDouble(double value):
+    """Stamp of a double; None if it is nan, so that equal stamps compare equal."""
+    return value if value == value else None
+
 cdef class ABC:
     cdef public tuple _inputs
     cdef public tuple _properties
     cdef public str name
+    cdef public dict _cache
+    cdef public dict _cacheInputs
     cpdef public tuple _inputValues(self)
     cpdef public tuple _propertyValues(self)
 
     cpdef public ABC copy(self)
     cpdef public ABC copyUpdate(self, dict kwargs)
     cpdef public void update(self, dict kwargs)
+    cpdef public tuple _cacheStamp(self)
+    cpdef public tuple _canonicalItems(self)
+    cdef tuple _cacheKey(self, str name)
+    cdef object _cacheGet(self, str name)
+    cdef object _cacheSet(self, str name, object value)
+    cpdef void clearCache(self, tuple keys=*)
     
     cdef public str formatAttrForSummary(self, str attr, list hasSummaryList)
     cdef tuple itup
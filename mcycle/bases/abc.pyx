@@ -2,6 +2,34 @@ from .. import defaults
 from ..defaults import getUnitsFormatted, getDimensions
 from ..logger import log
 
+
+cdef object _stamp(value):
+    """Value identifying the state of a dependency of a cached method: ABC instances by their :meth:`_cacheStamp <ABC._cacheStamp>`, lists and tuples by those of their items, nan by None and other values by themselves, or by their id if they are not hashable."""
+    if isinstance(value, float):
+        return _stampDouble(value)
+    elif isinstance(value, ABC):
+        return (<ABC>value)._cacheStamp()
+    elif isinstance(value, (list, tuple)):
+        return tuple([_stamp(v) for v in value])
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return id(value)
+
+
+def _canonical(value):
+    """Hashable description of value, by which designs are keyed and compared: ABC instances by their class and :meth:`_canonicalItems <ABC._canonicalItems>`, dicts by their items sorted by key, lists and tuples by their items and other values by their repr."""
+    if isinstance(value, ABC):
+        return (type(value).__name__, ) + tuple([(i, _canonical(v)) for i, v in (<ABC>value)._canonicalItems()])
+    elif isinstance(value, dict):
+        return tuple(sorted([(repr(k), _canonical(v)) for k, v in value.items()]))
+    elif isinstance(value, (list, tuple)):
+        return tuple([_canonical(v) for v in value])
+    else:
+        return repr(value)
+
+
 cdef class ABC:
     """Abstract Base Class.
 
@@ -11,6 +39,8 @@ _inputs : tuple of str
     Tuple of constructor argument names. Eg: ('arg1', 'arg2', 'arg3').
 _properties : tuple of str
     Tuple of class property/method names (used by ``mcycle.bases.abc.summary``). Include '()' if the property is a Cython/Python class method, otherwise exclude if it is a Python property (uses the ``@property`` decorator). Eg: ('prop1()', 'prop2()', 'prop3()').
+_cacheInputs : dict
+    Names of the cached methods of the class and the tuple of attribute names each depends on. Eg: {'prop1': ('arg1', 'arg2')}. See :meth:`_cacheGet`.
 name : str, optional
     Descriptive name for the class instance. Defaults to "".
     """
@@ -19,6 +49,8 @@ name : str, optional
         self._inputs = _inputs
         self._properties = _properties
         self.name = name
+        self._cache = {}
+        self._cacheInputs = {}
 
     cpdef public tuple _inputValues(self):
         """tuple : A deep copy of the current values of the input parameters"""
@@ -43,6 +75,10 @@ name : str, optional
                 values.append(getattr(self, p))
         return tuple(values)
 
+    def __reduce__(self):
+        """Pickle support: instances are rebuilt from the current values of ``_inputs``, the same way :meth:`copy` rebuilds them."""
+        return (self.__class__, self._inputValues())
+
     cpdef public ABC copy(self):
         """Return a new copy of a class instance."""
         cdef ABC copy = self.__class__(*self._inputValues())
@@ -85,6 +121,63 @@ kwargs : dict
                     key_attr[int(key_split[1])] = value
             else:
                 setattr(self, key, value)
+        self.clearCache(tuple(kwargs))
+
+    cpdef public tuple _cacheStamp(self):
+        """tuple: State of the instance checked by the cached methods of other instances that depend on it; its id. Subclasses whose state changes in place include it, eg; FlowStates their thermodynamic inputs."""
+        return (id(self), )
+
+    cpdef public tuple _canonicalItems(self):
+        """tuple: (attribute, value) pairs describing the instance for :func:`_canonical`; those of _inputs, except name."""
+        return tuple([(i, getattr(self, i)) for i in self._inputs if i != 'name'])
+
+    cdef tuple _cacheKey(self, str name):
+        """tuple: Stamps of the dependencies of cached method name, listed in _cacheInputs."""
+        return tuple([_stamp(getattr(self, attr)) for attr in self._cacheInputs[name]])
+
+    cdef object _cacheGet(self, str name):
+        """Value stored by the cached method name, or None if there is none or its dependencies have changed since it was stored. A cached method returns this value if it is not None, otherwise it returns the value it calculates through :meth:`_cacheSet`, eg;
+
+    value = self._cacheGet('prop1')
+    if value is None:
+        value = self._cacheSet('prop1', ...)
+    return value
+
+The stored value is cleared by :meth:`update` of any of its dependencies, listed in _cacheInputs. It is also checked against the stamps of the dependencies, so setting them directly, replacing a FlowState or updating its state in place are also detected. Other in place changes of dependencies require :meth:`clearCache`."""
+        cdef tuple entry
+        if self._cache is None or name not in self._cache:
+            return None
+        entry = self._cache[name]
+        if entry[0] == self._cacheKey(name):
+            return entry[1]
+        return None
+
+    cdef object _cacheSet(self, str name, object value):
+        """Stores and returns value as that of the cached method name; see :meth:`_cacheGet`."""
+        if self._cache is None:
+            self._cache = {}
+        self._cache[name] = (self._cacheKey(name), value)
+        return value
+
+    cpdef void clearCache(self, tuple keys=None):
+        """Clears the values stored by the cached methods that depend on any of keys, or all of them if keys is None. Keys may be nested, eg; 'plate.T' clears the methods that depend on 'plate'. Called by :meth:`update`.
+
+Parameters
+-----------
+keys : tuple of str, optional
+    Names of the changed attributes. Defaults to None.
+        """
+        cdef set bases
+        cdef str name
+        if not self._cache:
+            return
+        if keys is None:
+            self._cache = {}
+            return
+        bases = {key.split('.', 1)[0].split('[', 1)[0] for key in keys}
+        for name in list(self._cache):
+            if not bases.isdisjoint(self._cacheInputs.get(name, ())):
+                del self._cache[name]
               
     cdef public str formatAttrForSummary(self, str attr, list hasSummaryList):
         """str: Formats attribute to be used in summary(): gets value and looks up units.
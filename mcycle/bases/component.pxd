@@ -15,6 +15,7 @@ cdef class Component(ABC):
     cpdef public list runUnitsBounds
     cpdef public str notes
     cpdef public Config config
+    cpdef public dict _brackets
     cdef public bint hasInAndOut(self, int flowIndex)
 
     cpdef public double _mWf(self)
@@ -22,7 +23,8 @@ cdef class Component(ABC):
     cpdef public void clearWfFlows(self)
     cpdef public void clearAllFlows(self)
     cpdef public void run(self) except *
-    cpdef double _f_sizeComponent(self, double value, FlowState flowOutTarget, str attr)
+    cdef void _setAttr(self, str attr, double value) except *
+    cpdef double _f_sizeComponent(self, double value, FlowState flowOutTarget, str attr) except *
     cpdef public void size(self) except *
     cpdef public void sizeUnits(self) except *
     
@@ -1,17 +1,32 @@
 from .._constants cimport *
 from .. import defaults
 from ..logger import log
-from .abc cimport ABC
+from .abc cimport ABC, _stamp
 from .flowstate cimport FlowState
 from .config cimport Config
+from .solvers cimport Residual, brentq
 from math import nan
-import scipy.optimize as opt
 
 
 cdef tuple _inputs = ('flowsIn', 'flowsOut', 'ambient', 'sizeAttr', 'sizeBounds', 'sizeUnitsBounds', 'runBounds', 'runUnitsBounds', 'name', 'notes', 'config')
 cdef tuple _properties = ('mWf',)
 
 
+cdef class _SizeResidual(Residual):
+    """Residual of Component.size()."""
+    cdef Component component
+    cdef FlowState flowOutTarget
+    cdef str attr
+
+    def __init__(self, Component component, FlowState flowOutTarget, str attr):
+        self.component = component
+        self.flowOutTarget = flowOutTarget
+        self.attr = attr
+
+    cdef double f(self, double x) except *:
+        return self.component._f_sizeComponent(x, self.flowOutTarget, self.attr)
+
+
 cdef class Component(ABC):
     """Base class for components with incoming and outgoing flows. The first flow in and out (index 0) must be allocated to the working fluid where applicable.
 
@@ -39,6 +54,11 @@ notes : string, optional
     Additional notes on the component such as model numbers. Defaults "no notes".
 config : Config, optional
     Configuration parameters. Defaults to None which sets it to :meth:`defaults.CONFIG <mcycle.defaults.CONFIG>`.
+
+Attributes
+-----------
+_brackets : dict
+    Brackets of the last roots solved by :meth:`find_root <mcycle.bases.solvers.find_root>` for the component, from which the next solution is bracketed. Not copied.
     """
     
     def __init__(self,
@@ -66,6 +86,7 @@ config : Config, optional
         if config is None:
             config = defaults.CONFIG
         self.config = config
+        self._brackets = {}
     
     cpdef public ABC copy(self):
         """Return a new copy of a Component instance. Overrides :meth:`ABC.copy() <mcycle.bases.abc.ABC.copy>`."""
@@ -89,6 +110,10 @@ kwargs : dict
         copy.update(kwargs)
         return copy
 
+    cpdef public tuple _cacheStamp(self):
+        """tuple: State checked by cached methods depending on the Component; its id and the stamps of its incoming, outgoing and ambient FlowStates. Overrides :meth:`ABC._cacheStamp() <mcycle.bases.abc.ABC._cacheStamp>`."""
+        return (id(self), _stamp(self.flowsIn), _stamp(self.flowsOut), _stamp(self.ambient))
+
     cpdef public void clearWfFlows(self):
         self.flowsIn[0] = None
         self.flowsOut[0] = None
@@ -104,8 +129,12 @@ kwargs : dict
         """Compute the outgoing working fluid FlowState from component attributes."""
         pass
 
-    cpdef double _f_sizeComponent(self, double value, FlowState flowOutTarget, str attr):
+    cdef void _setAttr(self, str attr, double value) except *:
+        """Set the float attribute attr to value for the residuals of the solvers. Subclasses set their own attributes directly, falling back to update()."""
         self.update({attr: value})
+
+    cpdef double _f_sizeComponent(self, double value, FlowState flowOutTarget, str attr) except *:
+        self._setAttr(attr, value)
         self.run()
         return getattr(self.flowsOut[0], self.config.tolAttr)() - getattr(flowOutTarget, self.config.tolAttr)()
     
@@ -118,13 +147,14 @@ kwargs : dict
             flowOutTarget = self.flowsOut[0].copy()
 
             tol = self.config.tolAbs + self.config.tolRel * getattr(flowOutTarget, self.config.tolAttr)()
-            sizedValue = opt.brentq(
-                    self._f_sizeComponent,
-                    *self.sizeBounds,
-                    args=(flowOutTarget, attr),
-                    rtol=self.config.tolRel,
-                    xtol=self.config.tolAbs,
-                    maxiter=defaults.MAXITER_COMPONENT)
+            sizedValue = brentq(
+                    _SizeResidual(self, flowOutTarget, attr),
+                    self.sizeBounds[0],
+                    self.sizeBounds[1],
+                    (),
+                    self.config.tolAbs,
+                    self.config.tolRel,
+                    defaults.MAXITER_COMPONENT)
             self.update({attr: sizedValue, 'flowsOut[0]': flowOutTarget})
         except:
             raise StopIteration("{}.size() failed to converge.".format(
@@ -22,14 +22,25 @@ cdef class Config(ABC):
     cpdef public double tolRel
     cpdef public double divT
     cpdef public double divX
+    cpdef public bint divAdaptive
+    cpdef public double tolDiv
+    cpdef public unsigned short maxUnits
     cpdef public unsigned short maxIterComponent
     cpdef public unsigned short maxIterCycle
     cpdef public dict methods
+    cpdef public object executor
+    cdef list _methodsTable
     cpdef public double _tolRel_p 
     cpdef public double _tolRel_T 
     cpdef public double _tolRel_h 
     cpdef public double _tolRel_rho
     
+    cpdef public ABC copy(self)
+    cpdef public ABC copyUpdate(self, dict kwargs)
+    cpdef public tuple _canonicalItems(self)
     cpdef public str lookupMethod(self, str cls, tuple args)# except *
+    cdef object _lookupMethodDict(self, str geom, unsigned char transfer, unsigned char unitPhase, unsigned char flow)
+    cpdef void compileMethods(self)
+    cpdef public void update(self, dict kwargs)
     cpdef void set_method(self, str method, str geom, unsigned char transfer, unsigned char unitPhase, unsigned char flow) except *
 
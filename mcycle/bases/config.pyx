@@ -6,8 +6,17 @@ import copy
 from math import nan, isnan
 
 
-cdef tuple _inputs = ('dpEvap', 'dpCond', 'evenPlatesWf', 'dpFWf', 'dpFSf', 'dpAccWf', 'dpAccSf', 'dpHeadWf', 'dpHeadSf', 'dpPortWf', 'dpPortSf', 'dpPortInFactor', 'dpPortOutFactor', 'g', 'tolAttr', 'tolAbs', 'tolRel', 'divT', 'divX', 'methods', 'name')
+cdef tuple _inputs = ('dpEvap', 'dpCond', 'evenPlatesWf', 'dpFWf', 'dpFSf', 'dpAccWf', 'dpAccSf', 'dpHeadWf', 'dpHeadSf', 'dpPortWf', 'dpPortSf', 'dpPortInFactor', 'dpPortOutFactor', 'maxWalls', 'gravity', 'tolAttr', 'tolAbs', 'tolRel', 'divT', 'divX', 'divAdaptive', 'tolDiv', 'maxUnits', 'maxIterComponent', 'maxIterCycle', 'methods', 'executor', 'name')
 cdef tuple _properties = ('_tolRel_p', '_tolRel_T', '_tolRel_h', '_tolRel_rho')
+# attributes pickled and copied in addition to _inputs (less the executor)
+cdef tuple _stateExtra = ('_tolRel_p', '_tolRel_T', '_tolRel_h', '_tolRel_rho')
+cdef tuple _listGeom = ("GeomHxPlateChevron", "GeomHxPlateFinStraight",
+                        "GeomHxPlateFinOffset", "GeomHxPlateSmooth")
+cdef dict _indexGeom = {geom: i for i, geom in enumerate(_listGeom)}
+# sizes of the transfer, unitPhase and flow axes of the methods table
+cdef unsigned char _nTransfer = TRANSFER_FRICTION + 1
+cdef unsigned char _nUnitPhase = UNITPHASE_ALL_TWOPHASE + 1
+cdef unsigned char _nFlow = SECONDARY_FLUID + 1
         
 cdef class Config(ABC):
     """General configuration parameters containing parameters pertaining to Cycles and Components. Many attributes have a corresponding default value set in :doc:`defaults </defaults>` 
@@ -50,12 +59,20 @@ divT : float, optional
     Temperature difference for unitising single-phase flows. Defaults to 5 [K].
 divX : float, optional
     Quality difference for unitising two-phase flows. Defaults to 0.1.
+divAdaptive : bool, optional
+    If True, heat exchangers are unitised adaptively: units are bisected where the estimated error in their required heat transfer area is largest, instead of being spaced by divT and divX. Defaults to False.
+tolDiv : float, optional
+    Relative tolerance of the estimated error in heat transfer area used when divAdaptive is True. Defaults to 1e-3.
+maxUnits : int, optional
+    Max number of units of a heat exchanger when divAdaptive is True. Defaults to 50.
 maxIterCycle : int, optional
     Max number of iterations for convergence of cycle methods. Defaults to 50.
 maxIterComponent : int, optional
     Max number of iterations for convergence of component methods. Defaults to 50.
 methods : dict, optional
-    Dictionary that stores all information about selection of computational methods.
+    Dictionary that stores all information about selection of computational methods. Use set_method() or update() to change it; if it is edited in place, compileMethods() must be called before the next lookupMethod().
+executor : concurrent.futures.Executor, optional
+    Executor used to size the units of a heat exchanger concurrently. Use a ``ThreadPoolExecutor`` when the property backend releases the GIL, otherwise a ``ProcessPoolExecutor``. Defaults to None (units are sized one after another).
 name : string, optional
     Description of Config object. Defaults to "Config instance".
 
@@ -92,9 +109,13 @@ _tolRel_rho : float, optional
                  double tolRel=nan,
                  double divT=nan,
                  double divX=nan,
+                 bint divAdaptive=False,
+                 double tolDiv=nan,
+                 unsigned short maxUnits=0,
                  unsigned short maxIterComponent=0,
                  unsigned short maxIterCycle=0,
                  dict methods={},
+                 executor=None,
                  str name="Config instance"):
         super().__init__(_inputs, _properties, name)
         # Cycle config parameters
@@ -140,6 +161,13 @@ _tolRel_rho : float, optional
             divX = defaults.DIV_X
         assert divX <= 1
         self.divX = divX
+        self.divAdaptive = divAdaptive
+        if isnan(tolDiv):
+            tolDiv = defaults.TOL_DIV
+        self.tolDiv = tolDiv
+        if maxUnits == 0:
+            maxUnits = defaults.MAX_UNITS
+        self.maxUnits = maxUnits
         #iteration
         if maxIterComponent == 0:
             maxIterComponent = defaults.MAXITER_COMPONENT
@@ -151,12 +179,42 @@ _tolRel_rho : float, optional
         if methods == {}:
             methods = copy.deepcopy(defaults.METHODS)
         self.methods = methods
+        self.executor = executor
         #
         self._tolRel_p = tolRel
         self._tolRel_T = tolRel
         self._tolRel_h = tolRel
         self._tolRel_rho = tolRel
 
+    def __reduce__(self):
+        """Pickle support. The executor is not sent to other processes."""
+        cdef dict state = {}
+        for k in _inputs + _stateExtra:
+            if k != 'executor':
+                state[k] = getattr(self, k)
+        return (Config, (), state)
+
+    def __setstate__(self, dict state):
+        for k, v in state.items():
+            setattr(self, k, v)
+
+    cpdef public ABC copy(self):
+        """Return a new copy of the Config. methods is deep copied; the executor is shared."""
+        cdef Config other = Config()
+        other.__setstate__(copy.deepcopy(self.__reduce__()[2]))
+        other.executor = self.executor
+        return other
+
+    cpdef public ABC copyUpdate(self, dict kwargs):
+        """Create a new copy of the Config then update it using kwargs (as dict)."""
+        cdef ABC other = self.copy()
+        other.update(kwargs)
+        return other
+
+    cpdef public tuple _canonicalItems(self):
+        """tuple: (attribute, value) pairs of the pickled state, except name; the executor is not included."""
+        return tuple([(k, v) for k, v in self.__reduce__()[2].items() if k != 'name'])
+
     @property
     def dpF(self):
         """Returns True if dpFWf and dpFSf are True, else prints their values. Setter sets both to True or False."""
@@ -255,12 +313,11 @@ args : tuple
     - HxPlate or HxUnitPlate: args must be in the form (geom, transfer, phase, flow).
 
         """
-        cdef tuple listGeom
-        cdef str geom, lookup_dict
-        cdef str ret = ''
-        cdef unsigned char transfer, flow, unitPhase, unitPhaseOrig
+        cdef str geom
+        cdef object ret
+        cdef unsigned char transfer, flow, unitPhase
         try:
-            if cls in ["HxPlate","HxUnitPlate", "HxPlate", "HxPlateFin"]:
+            if cls in ["HxPlate","HxUnitPlate", "HxPlate", "HxPlateFin", "HxPlateSurrogate"]:
                 """args must be in the form (geom, transfer, phase, flow)."""
                 if len(args) == 4:
                     geom, transfer, unitPhase, flow = args
@@ -269,47 +326,20 @@ args : tuple
                     log('error', msg)
                     raise IndexError(msg)
 
-                listGeom = ("GeomHxPlateChevron", "GeomHxPlateFinStraight",
-                                   "GeomHxPlateFinOffset", "GeomHxPlateSmooth")
-                if geom not in listGeom:
-                    msg = "'geom' arg must be in {}, (given: {})".format(listGeom, geom)
+                if geom not in _indexGeom:
+                    msg = "'geom' arg must be in {}, (given: {})".format(_listGeom, geom)
                     log('error', msg)
                     raise NotImplementedError(msg)
-                unitPhaseOrig = unitPhase
-                if flow == WORKING_FLUID or flow == SECONDARY_FLUID:
-                    
-                    try:
-                        ret = self.methods[geom][transfer][flow][unitPhase]
-                    except:
-                        if unitPhase in [UNITPHASE_TWOPHASE_CONDENSING, UNITPHASE_TWOPHASE_EVAPORATING]:
-                            unitPhase = UNITPHASE_ALL_TWOPHASE
-                        else:
-                            unitPhase = UNITPHASE_ALL_SINGLEPHASE
-                        try:
-                            ret = self.methods[geom][transfer][flow][unitPhase]
-                        except:
-                            try:
-                                ret = self.methods[geom][transfer][flow][UNITPHASE_ALL]
-                            except:
-                                pass
-                if ret == '': #flow not WORKING_FLUID or SECONDARY_FLUID or all trys above failed
-                    unitPhase = unitPhaseOrig
-                    try:
-                        ret = self.methods[geom][transfer][unitPhase]
-                    except:
-                        if unitPhase in [UNITPHASE_TWOPHASE_CONDENSING, UNITPHASE_TWOPHASE_EVAPORATING]:
-                            unitPhase = UNITPHASE_ALL_TWOPHASE
-                        else:
-                            unitPhase = UNITPHASE_ALL_SINGLEPHASE
-                        try:
-                            ret = self.methods[geom][transfer][unitPhase]
-                        except:
-                            try:
-                                ret = self.methods[geom][transfer][UNITPHASE_ALL]
-                            except:
-                                msg = "lookupMethod(): Could not find method for geom:{}, transfer:{}, phase:{}, searched fallbacks.".format(geom, transfer, unitPhaseOrig)
-                                log('error', msg)
-                                raise KeyError(msg)
+                if self._methodsTable is None:
+                    self.compileMethods()
+                if transfer < _nTransfer and unitPhase < _nUnitPhase and flow < _nFlow:
+                    ret = self._methodsTable[((<unsigned int>_indexGeom[geom] * _nTransfer + transfer) * _nUnitPhase + unitPhase) * _nFlow + flow]
+                else:
+                    ret = self._lookupMethodDict(geom, transfer, unitPhase, flow)
+                if ret is None:
+                    msg = "lookupMethod(): Could not find method for geom:{}, transfer:{}, phase:{}, searched fallbacks.".format(geom, transfer, unitPhase)
+                    log('error', msg)
+                    raise KeyError(msg)
                 return ret
             if cls in ["HxBasic","HxBasicPlanar"]:
                 return None
@@ -320,6 +350,45 @@ args : tuple
         except:
             raise
             
+    cdef object _lookupMethodDict(self, str geom, unsigned char transfer, unsigned char unitPhase, unsigned char flow):
+        """str: Name of method found in methods for the given args by searching the fallbacks: the given unitPhase, then UNITPHASE_ALL_TWOPHASE or UNITPHASE_ALL_SINGLEPHASE, then UNITPHASE_ALL; first for the given flow, then for all flows. Returns None if no method is found."""
+        cdef object methods, methodsFlow, ret
+        cdef unsigned char unitPhaseAll, UP
+        methods = self.methods.get(geom, {}).get(transfer, {})
+        if unitPhase in [UNITPHASE_TWOPHASE_CONDENSING, UNITPHASE_TWOPHASE_EVAPORATING]:
+            unitPhaseAll = UNITPHASE_ALL_TWOPHASE
+        else:
+            unitPhaseAll = UNITPHASE_ALL_SINGLEPHASE
+        if flow == WORKING_FLUID or flow == SECONDARY_FLUID:
+            methodsFlow = methods.get(flow)
+            if type(methodsFlow) is dict:
+                for UP in (unitPhase, unitPhaseAll, UNITPHASE_ALL):
+                    if UP in methodsFlow:
+                        if methodsFlow[UP] != '':
+                            return methodsFlow[UP]
+                        break
+        for UP in (unitPhase, unitPhaseAll, UNITPHASE_ALL):
+            ret = methods.get(UP)
+            if type(ret) is str:
+                return ret
+        return None
+
+    cpdef void compileMethods(self):
+        """Compiles methods into the flat table used by lookupMethod(), indexed by (geom, transfer, unitPhase, flow) with all fallbacks already resolved. set_method() and update() clear the table so that it is recompiled by the next lookupMethod(); this must be called directly after methods is modified in place."""
+        cdef str geom
+        cdef unsigned char transfer, unitPhase, flow
+        self._methodsTable = [self._lookupMethodDict(geom, transfer, unitPhase, flow) for geom in _listGeom for transfer in range(_nTransfer) for unitPhase in range(_nUnitPhase) for flow in range(_nFlow)]
+
+    cpdef public void update(self, dict kwargs):
+        """Update (multiple) class variables from a dictionary of keyword arguments. The methods table is recompiled by the next lookupMethod().
+
+Parameters
+-----------
+kwargs : dict
+    Dictionary of attributes and their updated value."""
+        super(Config, self).update(kwargs)
+        self._methodsTable = None
+
     cpdef void set_method(self, str method, str geom, unsigned char transfer, unsigned char unitPhase, unsigned char flow) except *:
         """Set the method for a single geometry, given the transfer type, unitphase and flow.
 
@@ -366,4 +435,5 @@ flows : str
             else:
                 self.methods[geom][transfer].setdefault(flow, {})
                 self.methods[geom][transfer][flow][unitPhase] = method
+        self._methodsTable = None
 
@@ -71,6 +71,7 @@ kwargs : dict
                 store[key] = value
         if store != {}:        
             super(Cycle, self).update(store)
+        self.clearCache(tuple(kwargs))
 
     cpdef public void clearWf_flows(self):
         """Set all working fluid flows (index=0 in flowsIn & flowsOut) to None."""
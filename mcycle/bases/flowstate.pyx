@@ -1,4 +1,4 @@
-from .abc cimport ABC
+from .abc cimport ABC, _stampDouble
 from .. import defaults
 from .._constants cimport *
 from ..logger import log
@@ -111,6 +111,10 @@ import mcycle
     cdef public bint isMixture(self):
         "bool: True if fluid is a mixture, False if fluid is pure or pseudo-pure."
         return '&' in self.fluid
+
+    cpdef public tuple _cacheStamp(self):
+        """tuple: State checked by cached methods depending on the FlowState; its id, mass flow rate and the inputs of its current state. Overrides :meth:`ABC._cacheStamp() <mcycle.bases.abc.ABC._cacheStamp>`."""
+        return (id(self), _stampDouble(self.m), self._inputPair, _stampDouble(self._input1), _stampDouble(self._input2), self._iphase)
     
     def __eq__(self, other):
         cdef list inputValues = list(self._inputValues())
@@ -1,4 +1,4 @@
-from .abc cimport ABC
+from .abc cimport ABC, _stamp
 from .. import defaults
 
 cdef tuple _inputs = ('validClasses',)
@@ -17,6 +17,10 @@ validClasses : tuple of str
         super().__init__(_inputs, _properties, name)
         self.validClasses = validClasses
         
+    cpdef public tuple _cacheStamp(self):
+        """tuple: State checked by cached methods depending on the geometry; its id and the values of its inputs, so that attributes set in place are also detected. Overrides :meth:`ABC._cacheStamp() <mcycle.bases.abc.ABC._cacheStamp>`."""
+        return (id(self), ) + tuple([_stamp(getattr(self, i)) for i in self._inputs])
+
     cpdef bint validClass(self, str cls):
         """bool: Returns True if geometry is valid for the given class."""
         if cls in self.validClasses:
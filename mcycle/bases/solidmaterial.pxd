@@ -5,6 +5,8 @@ cdef class SolidMaterial(ABC):
     cpdef public double rho
     cpdef public dict data
     cdef dict _c
+    cdef double _kT
+    cdef double _kValue
     cpdef public int deg
     cpdef public double T
     cpdef public str notes
@@ -1,11 +1,13 @@
 from .abc cimport ABC
 from .config cimport Config
 from .. import defaults
+from math import nan
 import numpy as np
 
 cdef tuple _inputs = ('rho', 'data', 'deg', 'T', 'name', 'notes', 'config')
 cdef tuple _properties = ('k()',)
 cdef list propertiesList = ['k']
+cdef dict _fits = {}
 
 cdef class SolidMaterial(ABC):
     """Essential properties for solid component materials.
@@ -36,7 +38,8 @@ config : Config, optional
         self.rho = rho
         self.data = {'T': data['T'], 'k': []} 
         self.deg = deg
-        self._c = {}    
+        self._c = {}
+        self._kT = nan
         cdef str prop
         cdef size_t lenDataT = len(data['T'])
         if data.keys() == self.data.keys():
@@ -55,32 +58,46 @@ config : Config, optional
         self.config = config
 
     cpdef public void populate_c(self):
+        """Fit the polynomial coefficients of the properties to data, if deg is not negative, and clear the stored value of k. Fits are shared between materials with the same data and deg, so copies and library materials are not refitted. Must be called if data is edited in place."""
         self._c = {}
+        self._kT = nan
         cdef str key
+        cdef tuple fitKey
         if self.deg < 0:
             pass
         else:
             for key in propertiesList:
-                self._c[key] = list(
-                    np.polyfit(self.data['T'], self.data[key], self.deg))
+                fitKey = (tuple(self.data['T']), tuple(self.data[key]), self.deg)
+                if fitKey not in _fits:
+                    _fits[fitKey] = list(
+                        np.polyfit(self.data['T'], self.data[key], self.deg))
+                self._c[key] = _fits[fitKey]
 
     
     cpdef public void update(self, dict kwargs):
-        """Update (multiple) class variables from a dictionary of keyword arguments.
+        """Update (multiple) class variables from a dictionary of keyword arguments. Clears the stored value of k, and refits the properties if data or deg are updated, including nested keys such as 'data.k'.
 
 Parameters
 -----------
 kwargs : dict
     Dictionary of attributes and their updated value."""
+        cdef str key
         super(SolidMaterial, self).update(kwargs)
-        self.populate_c()
+        self._kT = nan
+        for key in kwargs:
+            if key.startswith('data') or key.startswith('deg'):
+                self.populate_c()
+                break
         
     cpdef public double k(self):
-        """float: Thermal conductivity [W/m.K]."""
-        if self.deg == -1:
-            return np.interp(self.T, self.data['T'], self.data['k'])
-        else:
-            return np.polyval(self._c['k'], self.T)
+        """float: Thermal conductivity [W/m.K]. The value is stored and only recomputed once T changes, :meth:`update` is called or :meth:`populate_c` is called."""
+        if self.T != self._kT:
+            if self.deg == -1:
+                self._kValue = np.interp(self.T, self.data['T'], self.data['k'])
+            else:
+                self._kValue = np.polyval(self._c['k'], self.T)
+            self._kT = self.T
+        return self._kValue
 
     def summary(self,
                 bint printSummary=True,
@@ -0,0 +1,12 @@
+cdef class Residual:
+    cdef object _exc
+    cdef double f(self, double x) except *
+
+cdef class PyResidual(Residual):
+    cdef object func
+    cdef tuple args
+
+cpdef double brentq(f, double a, double b, tuple args=*, double xtol=*, double rtol=*, unsigned int maxIter=*) except *
+cpdef double secant(f, double x0, double x1=*, tuple args=*, double xtol=*, double rtol=*, unsigned int maxIter=*) except *
+cpdef tuple bracket_root(f, double a, double b, tuple args=*, double lower=*, double upper=*, unsigned int maxIter=*, bint quiet=*)
+cpdef double find_root(f, double a, double b, tuple args=*, double lower=*, double upper=*, double rtol=*, double xtol=*, dict cache=*, str key=*) except *
@@ -0,0 +1,276 @@
+from scipy.optimize cimport cython_optimize
+from ..logger import log
+from math import inf, nan, isnan
+
+cdef double _bracketGrowth = 1.6
+cdef double _bracketStepRel = 0.01
+cdef double _secantStep = 1e-4
+cdef str msg
+
+
+cdef class Residual:
+    """Residual f(x) of a root-finding problem, evaluated at C level by the solvers of this module. Subclasses implement :meth:`f` with typed access to the component being solved, so that no Python call is made per iteration. Residuals may also be called from Python, f(x)."""
+
+    cdef double f(self, double x) except *:
+        """float: Residual at x."""
+        msg = "{}.f() is not implemented".format(self.__class__.__name__)
+        log("error", msg)
+        raise NotImplementedError(msg)
+
+    def __call__(self, double x):
+        return self.f(x)
+
+
+cdef class PyResidual(Residual):
+    """Residual of a Python callable, func(x, \*args).
+
+Parameters
+-----------
+func : callable
+    Function of x, func(x, \*args).
+args : tuple, optional
+    Extra arguments of func. Defaults to ().
+    """
+
+    def __init__(self, func, tuple args=()):
+        self.func = func
+        self.args = args
+
+    cdef double f(self, double x) except *:
+        return self.func(x, *self.args)
+
+
+cdef Residual _asResidual(f, tuple args):
+    """Residual: f if it is a Residual, else a PyResidual of f and args."""
+    if isinstance(f, Residual):
+        return <Residual>f
+    return PyResidual(f, args)
+
+
+cdef double _callback(double x, void *params) noexcept:
+    """C callback of scipy.optimize.cython_optimize. Exceptions raised by the residual are stored to be raised by the solver, and 0 is returned so the solver stops."""
+    cdef Residual res = <Residual>params
+    if res._exc is not None:
+        return 0
+    try:
+        return res.f(x)
+    except BaseException as exc:
+        res._exc = exc
+        return 0
+
+
+cpdef double brentq(f, double a, double b, tuple args=(), double xtol=2e-12, double rtol=8.881784197001252e-16, unsigned int maxIter=100) except *:
+    """float: Root of f in the bracket [a, b] by Brent's method, solved by scipy.optimize.cython_optimize.brentq. A :meth:`Residual` is evaluated without returning to Python; any other callable is called as f(x, \*args). Raises ValueError if f(a) and f(b) have the same sign and RuntimeError if the root does not converge within maxIter iterations.
+
+Parameters
+-----------
+f : Residual or callable
+    Residual function.
+a, b : float
+    Bracket of the root.
+args : tuple, optional
+    Extra arguments of f if it is not a Residual. Defaults to ().
+xtol, rtol : float, optional
+    Absolute and relative tolerances of the root. Defaults to the defaults of scipy.optimize.brentq.
+maxIter : int, optional
+    Maximum number of iterations. Defaults to 100.
+    """
+    cdef Residual res = _asResidual(f, args)
+    cdef cython_optimize.zeros_full_output out
+    cdef double root
+    res._exc = None
+    root = cython_optimize.brentq(_callback, a, b, <void*>res, xtol, rtol, maxIter, &out)
+    if res._exc is not None:
+        exc = res._exc
+        res._exc = None
+        raise exc
+    if out.error_num == -1:
+        msg = "brentq(): f(a) and f(b) must have different signs (given: a={}, b={})".format(a, b)
+        log("error", msg)
+        raise ValueError(msg)
+    elif out.error_num == -2:
+        msg = "brentq(): failed to converge after {} iterations (last value: {})".format(out.iterations, root)
+        log("error", msg)
+        raise RuntimeError(msg)
+    return root
+
+
+cpdef double secant(f, double x0, double x1=nan, tuple args=(), double xtol=1.48e-8, double rtol=0, unsigned int maxIter=50) except *:
+    """float: Root of f by the secant method started from x0 and x1, converged when successive estimates differ by less than xtol + rtol * \|x\|. A :meth:`Residual` is evaluated without returning to Python. Raises RuntimeError if the root does not converge within maxIter iterations.
+
+Parameters
+-----------
+f : Residual or callable
+    Residual function.
+x0 : float
+    Initial estimate of the root.
+x1 : float, optional
+    Second estimate of the root. If nan, x0 is perturbed as by scipy.optimize.newton. Defaults to nan.
+args : tuple, optional
+    Extra arguments of f if it is not a Residual. Defaults to ().
+xtol, rtol : float, optional
+    Absolute and relative tolerances of the root. Default to those of scipy.optimize.newton.
+maxIter : int, optional
+    Maximum number of iterations. Defaults to 50.
+    """
+    cdef Residual res = _asResidual(f, args)
+    cdef double q0, q1, x
+    cdef unsigned int i
+    if isnan(x1):
+        x1 = x0 * (1 + _secantStep) + (_secantStep if x0 >= 0 else -_secantStep)
+    q0 = res.f(x0)
+    q1 = res.f(x1)
+    if abs(q1) < abs(q0):
+        x0, x1, q0, q1 = x1, x0, q1, q0
+    for i in range(maxIter):
+        if q1 == q0:
+            if x1 != x0:
+                msg = "secant(): tolerance reached before convergence (last values: {})".format([x0, x1])
+                log("error", msg)
+                raise RuntimeError(msg)
+            return (x0 + x1) / 2
+        if abs(q1) > abs(q0):
+            x = (-q0 / q1 * x1 + x0) / (1 - q0 / q1)
+        else:
+            x = (-q1 / q0 * x0 + x1) / (1 - q1 / q0)
+        if abs(x - x1) <= xtol + rtol * abs(x1):
+            return x
+        x0, q0 = x1, q1
+        x1 = x
+        q1 = res.f(x1)
+    msg = "secant(): failed to converge after {} iterations (last value: {})".format(maxIter, x1)
+    log("error", msg)
+    raise RuntimeError(msg)
+
+
+cdef double _f_bracket(Residual f, double x) except *:
+    """float: f(x), or nan if f raises for x."""
+    try:
+        return f.f(x)
+    except AssertionError as err:
+        raise err
+    except Exception:
+        return nan
+
+
+cpdef tuple bracket_root(f, double a, double b, tuple args=(), double lower=-inf, double upper=inf, unsigned int maxIter=50, bint quiet=False):
+    """tuple of float: Bracket (a, b) containing a root of f, found from the hint [a, b]. While f has the same sign at both ends, the end with the smallest \|f\| is moved outwards by a step that grows geometrically. Steps never reach the physical limits lower and upper, instead halving the distance remaining to them. If f fails or returns nan at a point, the point is taken as a new limit and the bracket contracts back towards the last valid end.
+
+Parameters
+-----------
+f : Residual or callable
+    Residual function, called as f(x, \*args) if it is not a Residual.
+a, b : float
+    Hint of the bracket. Ends outside [lower, upper] are moved inside.
+args : tuple, optional
+    Extra arguments of f if it is not a Residual. Defaults to ().
+lower, upper : float, optional
+    Physical limits of x, which are never evaluated, eg; the outgoing enthalpy of a heat exchanger at which its outlet reaches the incoming temperature of the other flow. Defaults to -inf and inf.
+maxIter : int, optional
+    Maximum number of evaluations of f. Defaults to 50.
+quiet : bool, optional
+    If True, failing to find a bracket is logged at debug level instead of error level, eg; when the caller retries from another hint. Defaults to False.
+    """
+    cdef Residual res = _asResidual(f, args)
+    cdef double fa, fb, step, x, fx
+    cdef unsigned int i
+    if a > b:
+        a, b = b, a
+    if not lower < upper:
+        msg = "bracket_root(): lower limit must be less than upper limit (given: {}, {})".format(lower, upper)
+        log("error", msg)
+        raise ValueError(msg)
+    if a >= upper or b <= lower:
+        a, b = nan, nan
+    if not b < upper:
+        b = nan
+    if not a > lower:
+        a = nan
+    if isnan(a) and isnan(b):
+        if lower == -inf or upper == inf:
+            msg = "bracket_root(): hint is outside limits (given: {}, limits: {})".format([a, b], [lower, upper])
+            log("debug" if quiet else "error", msg)
+            raise ValueError(msg)
+        a = lower + (upper - lower) / 4
+        b = upper - (upper - lower) / 4
+    elif isnan(a):
+        a = (lower + b) / 2
+    elif isnan(b):
+        b = (a + upper) / 2
+    step = b - a
+    if not step > 0:
+        step = abs(a) * _bracketStepRel if a != 0 else 1
+    fa = _f_bracket(res, a)
+    fb = _f_bracket(res, b)
+    for i in range(maxIter):
+        if fa * fb <= 0:
+            return (a, b)
+        if isnan(fa) and isnan(fb):
+            break
+        if isnan(fb):
+            upper = b
+            b = (a + b) / 2
+            fb = _f_bracket(res, b)
+        elif isnan(fa):
+            lower = a
+            a = (a + b) / 2
+            fa = _f_bracket(res, a)
+        elif abs(fa) < abs(fb):
+            step *= _bracketGrowth
+            x = a - step
+            if not x > lower:
+                x = (a + lower) / 2
+            fx = _f_bracket(res, x)
+            if isnan(fx):
+                lower = x
+            else:
+                a, fa = x, fx
+        else:
+            step *= _bracketGrowth
+            x = b + step
+            if not x < upper:
+                x = (b + upper) / 2
+            fx = _f_bracket(res, x)
+            if isnan(fx):
+                upper = x
+            else:
+                b, fb = x, fx
+    msg = "bracket_root(): no bracket found after {} evaluations (last bracket: {}, values: {})".format(maxIter, [a, b], [fa, fb])
+    log("debug" if quiet else "error", msg)
+    raise ValueError(msg)
+
+
+cpdef double find_root(f, double a, double b, tuple args=(), double lower=-inf, double upper=inf, double rtol=1e-7, double xtol=1e-7, dict cache=None, str key="") except *:
+    """float: Root of f solved by :meth:`brentq` in a bracket found by :meth:`bracket_root`. If cache is given and holds a bracket under key, the bracket is sought from it instead of from [a, b], falling back to [a, b] without logging an error if it fails; the bracket found is then stored in cache under key. While the cached bracket still contains a root it is used as is, so repeated solutions of an unchanged function are identical and cost no bracketing evaluations.
+
+Parameters
+-----------
+f : Residual or callable
+    Residual function, called as f(x, \*args) if it is not a Residual.
+a, b : float
+    Hint of the bracket, see :meth:`bracket_root`.
+args : tuple, optional
+    Extra arguments of f if it is not a Residual. Defaults to ().
+lower, upper : float, optional
+    Physical limits of x. Defaults to -inf and inf.
+rtol, xtol : float, optional
+    Relative and absolute tolerances of the root. Defaults to 1e-7.
+cache : dict, optional
+    Successful brackets, eg; Component._brackets. Defaults to None.
+key : str, optional
+    Key of the bracket in cache. Defaults to "".
+    """
+    cdef Residual res = _asResidual(f, args)
+    cdef double root
+    cdef tuple bracket = None
+    if cache is not None and key in cache:
+        try:
+            bracket = bracket_root(res, cache[key][0], cache[key][1], (), lower, upper, 20, True)
+        except ValueError:
+            bracket = None
+    if bracket is None:
+        bracket = bracket_root(res, a, b, (), lower, upper)
+    root = brentq(res, bracket[0], bracket[1], (), xtol, rtol)
+    if cache is not None:
+        cache[key] = bracket
+    return root
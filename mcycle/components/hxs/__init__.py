@@ -2,7 +2,10 @@ from .flowconfig import HxFlowConfig
 from .hx_basic import HxBasic
 from .hx_basicplanar import HxBasicPlanar
 from .hx_plate import HxPlate
+from .hx_plate_surrogate import HxPlateSurrogate
+from .hx_simple import HxSimple
 from .hx_platefin import HxPlateFin
+from .hxunit_arrays import HxUnitArrays
 from .hxunit_basic import HxUnitBasic
 from .hxunit_basicplanar import HxUnitBasicPlanar
 from .hxunit_plate import HxUnitPlate
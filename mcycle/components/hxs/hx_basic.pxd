@@ -3,6 +3,7 @@ from ...bases.config cimport Config
 from ...bases.flowstate cimport FlowState
 from ...bases.solidmaterial cimport SolidMaterial
 from .hxunit_basic cimport HxUnitBasic
+from .hxunit_arrays cimport HxUnitArrays
 from .flowconfig cimport HxFlowConfig
 
 cdef class HxBasic(Component22):
@@ -24,6 +25,8 @@ cdef class HxBasic(Component22):
     cpdef public double ARatioWall
     cpdef public double efficiencyThermal
     cpdef public list _units
+    cpdef public HxUnitArrays _unitArrays
+    cpdef public list _sizeUnitsHint
     cdef public _unitClass
 
     cpdef public bint isEvap(self)
@@ -42,12 +45,23 @@ cdef class HxBasic(Component22):
     #cpdef public double Q(self)
     cpdef public double mass(self)
 
+    cdef void _setUnitArea(self, HxUnitBasic unit, double area)
+    cdef list _intervalAdaptive(self, tuple section, FlowState wf0, FlowState sf0, FlowState wf1, FlowState sf1, double area, tuple keys)
+    cdef tuple _entryAdaptive(self, tuple section, list interval, tuple keys)
+    cdef list _unitsAdaptive(self, list sections, tuple keys)
     cpdef public void unitise(self)
     cdef public void _unitiseExtra(self)
+    cdef public void _assignUnitMethods(self, HxUnitBasic unit)
     cdef public tuple _unitArgsLiq(self)
     cdef public tuple _unitArgsTp(self)
     cdef public tuple _unitArgsVap(self)
     cdef bint _checkContinuous(self)
+    cpdef public HxUnitArrays unitArrays(self)
+    cdef void _unitArraysExtra(self, HxUnitArrays arrays)
+    cpdef public void compactUnits(self)
+    cpdef public list units(self)
+    cpdef public dict sizeHint(self)
+    cpdef public void setSizeHint(self, dict hint)
 
-    cpdef double _f_sizeHxBasic(self, double value, str attr)
+    cpdef double _f_sizeHxBasic(self, double value, str attr) except *
     
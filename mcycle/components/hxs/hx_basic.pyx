@@ -1,20 +1,38 @@
+from ...bases.abc cimport ABC
 from ...bases.component cimport Component22
 from ...bases.config cimport Config
 from ...bases.flowstate cimport FlowState
 from ...bases.solidmaterial cimport SolidMaterial
+from ...bases.solvers cimport Residual, brentq
+from ...bases.utils cimport get_unitPhase
 from ... import defaults
 from ...logger import log
 from .hxunit_basic cimport HxUnitBasic
+from .hxunit_arrays cimport HxUnitArrays
 from .flowconfig cimport HxFlowConfig
 from ..._constants cimport *
 from warnings import warn
-from math import nan
+from math import nan, inf, isnan
+import heapq
 import numpy as np
 cimport numpy as np
-import scipy.optimize as opt
 
 cdef tuple _inputs = ('flowConfig', 'NWf', 'NSf', 'NWall', 'hWf_liq', 'hWf_tp', 'hWf_vap', 'hSf', 'RfWf', 'RfSf', 'wall', 'tWall', 'A', 'ARatioWf', 'ARatioSf', 'ARatioWall', 'efficiencyThermal', 'flowInWf', 'flowInSf', 'flowOutWf', 'flowOutSf', 'ambient', 'sizeAttr', 'sizeBounds', 'sizeUnitsBounds', 'runBounds', 'runUnitsBounds', 'name', 'notes', 'config')
 cdef tuple _properties = ('mWf', 'mSf', 'Q()', 'dpWf()', 'dpSf()', 'isEvap()')
+
+
+cdef class _SizeResidual(Residual):
+    """Residual of HxBasic.size()."""
+    cdef HxBasic hx
+    cdef str attr
+
+    def __init__(self, HxBasic hx, str attr):
+        self.hx = hx
+        self.attr = attr
+
+    cdef double f(self, double x) except *:
+        return self.hx._f_sizeHxBasic(x, self.attr)
+
         
 cdef class HxBasic(Component22):
     r"""Characterises a basic heat exchanger consisting of working fluid and secondary fluid flows separated by a solid wall with single-phase or multi-phase working fluid but only single-phase secondary fluid.
@@ -135,6 +153,8 @@ config : Config, optional
         super().__init__(flowInWf, flowInSf, flowOutWf, flowOutSf, ambient, sizeAttr,
                          sizeBounds, sizeUnitsBounds, runBounds, runUnitsBounds, name, notes, config)
         self._units = []
+        self._unitArrays = None
+        self._sizeUnitsHint = None
         self._unitClass = _unitClass
         self._inputs = _inputs
         self._properties = _properties
@@ -160,6 +180,14 @@ config : Config, optional
             else:
                 super(Component22, self).update({key: value})
                         
+    cpdef public ABC copy(self):
+        """Return a new copy of the Hx, including copies of its HxUnits or of their compact representation, :meth:`unitArrays`. Overrides :meth:`Component.copy() <mcycle.bases.component.Component.copy>`."""
+        cdef HxBasic copy = super(HxBasic, self).copy()
+        if self._unitArrays is not None:
+            copy._unitArrays = self._unitArrays.copy()
+        copy._unitiseExtra()
+        return copy
+
     cpdef public double _A(self):
         return self.A
 
@@ -239,7 +267,7 @@ config : Config, optional
         """float: Estimate of mass [kg], based purely on wall properties."""
         cdef HxUnitBasic unit
         cdef double w8 = 0
-        for unit in self._units:
+        for unit in self.units():
             w8 += unit.mass()
         return w8
 
@@ -265,6 +293,131 @@ config : Config, optional
         else:
             return False
 
+    cpdef public HxUnitArrays unitArrays(self):
+        """HxUnitArrays: Compact, array-backed copy of the HxUnits. The heat transfer coefficients, U and Q of each unit are evaluated from its current state. If the units have been compacted by :meth:`compactUnits`, the stored arrays are returned."""
+        cdef:
+            HxUnitArrays arrays
+            HxUnitBasic unit
+            FlowState nodeSf
+            unsigned int i, N = len(self._units)
+            bint isParallel = self.flowConfig.sense == PARALLELFLOW
+        if N == 0 and self._unitArrays is not None:
+            return self._unitArrays
+        arrays = HxUnitArrays(N)
+        if N == 0:
+            return arrays
+        arrays.pWf = self._units[0].flowsIn[0].p()
+        arrays.pSf = self._units[0].flowsIn[1].p()
+        arrays.mWf = self._mWf()
+        arrays.mSf = self._mSf()
+        for i in range(N + 1):
+            unit = self._units[min(i, N - 1)]
+            if i < N:
+                arrays.hNodesWf[i] = unit.flowsIn[0].h()
+                arrays.TNodesWf[i] = unit.flowsIn[0].T()
+                nodeSf = unit.flowsIn[1] if isParallel else unit.flowsOut[1]
+            else:
+                arrays.hNodesWf[i] = unit.flowsOut[0].h()
+                arrays.TNodesWf[i] = unit.flowsOut[0].T()
+                nodeSf = unit.flowsOut[1] if isParallel else unit.flowsIn[1]
+            arrays.hNodesSf[i] = nodeSf.h()
+            arrays.TNodesSf[i] = nodeSf.T()
+        for i in range(N):
+            unit = self._units[i]
+            arrays.unitPhaseWf[i] = unit._unitPhaseWf
+            arrays.unitPhaseSf[i] = unit._unitPhaseSf
+            arrays.A[i] = unit._A()
+            arrays.sizeUnitsLast[i] = unit._sizeUnitsLast
+            try:
+                arrays.hWf[i] = unit._hWf()
+                arrays.hSf[i] = unit._hSf()
+                arrays.RWf[i] = unit._RWf()
+                arrays.RSf[i] = unit._RSf()
+                arrays.U[i] = unit.U()
+                arrays.Q[i] = unit.Q()
+            except Exception:
+                pass
+        self._unitArraysExtra(arrays)
+        return arrays
+
+    cdef void _unitArraysExtra(self, HxUnitArrays arrays):
+        """Stores quantities specific to the unit class in arrays, called by :meth:`unitArrays`."""
+        pass
+
+    cpdef public void compactUnits(self):
+        """Replaces the HxUnits by their compact, array-backed representation, :meth:`unitArrays`, to reduce the memory used by Hxs with many units or by many stored Hxs, eg; from a sweep. The units are materialised again on demand by :meth:`units`."""
+        self._unitArrays = self.unitArrays()
+        self._units = []
+
+    cpdef public list units(self):
+        """list of HxUnit: Units of the Hx. If the units have been compacted by :meth:`compactUnits`, they are first materialised from the stored arrays, keeping their nodes, unit phases, heat transfer areas and last solutions of sizeUnits(); the arrays are then discarded."""
+        cdef:
+            HxUnitArrays arrays = self._unitArrays
+            HxUnitBasic unit
+            FlowState inWf, inSf, nearWf, farWf, nearSf, farSf
+            unsigned int i
+            unsigned char unitPhaseWf
+            bint isParallel
+            tuple unitArgs
+            list _units = []
+        if self._units or arrays is None:
+            return self._units
+        _unitClass = self._unitClass
+        inWf = self.flowsIn[0]
+        inSf = self.flowsIn[1]
+        isParallel = self.flowConfig.sense == PARALLELFLOW
+        for i in range(arrays.N):
+            unitPhaseWf = arrays.unitPhaseWf[i]
+            if unitPhaseWf == UNITPHASE_LIQUID:
+                unitArgs = self._unitArgsLiq()
+            elif unitPhaseWf == UNITPHASE_VAPOUR:
+                unitArgs = self._unitArgsVap()
+            else:
+                unitArgs = self._unitArgsTp()
+            nearWf = inWf.copyUpdateState(HmassP_INPUTS, arrays.hNodesWf[i], arrays.pWf)
+            farWf = inWf.copyUpdateState(HmassP_INPUTS, arrays.hNodesWf[i + 1], arrays.pWf)
+            nearSf = inSf.copyUpdateState(HmassP_INPUTS, arrays.hNodesSf[i], arrays.pSf)
+            farSf = inSf.copyUpdateState(HmassP_INPUTS, arrays.hNodesSf[i + 1], arrays.pSf)
+            if isParallel:
+                unit = _unitClass(*unitArgs, flowInWf=nearWf, flowOutWf=farWf, flowInSf=nearSf, flowOutSf=farSf,
+                                  sizeBounds=self.sizeUnitsBounds, config=self.config)
+            else:
+                unit = _unitClass(*unitArgs, flowInWf=nearWf, flowOutWf=farWf, flowInSf=farSf, flowOutSf=nearSf,
+                                  sizeBounds=self.sizeUnitsBounds, config=self.config)
+            unit._unitPhaseWf = unitPhaseWf
+            unit._unitPhaseSf = arrays.unitPhaseSf[i]
+            unit._sizeUnitsLast = arrays.sizeUnitsLast[i]
+            if not isnan(arrays.A[i]):
+                self._setUnitArea(unit, arrays.A[i])
+            _units.append(unit)
+        self._units = _units
+        self._unitArrays = None
+        self._unitiseExtra()
+        return self._units
+
+    cpdef public dict sizeHint(self):
+        """dict: Last solutions of size() and of sizeUnits() of each HxUnit, to be passed to :meth:`setSizeHint` of this or another Hx of the same design. Sizing is bracketed from, or started at, these solutions, so re-sizing for nearby operating conditions is faster, eg; between the outer iterations of Cycle.size().
+
+Keys are "brackets", a copy of _brackets, and "sizeUnits", the last solution of sizeUnits() of each unit."""
+        cdef HxUnitBasic unit
+        cdef list sizeUnits
+        if not self._units and self._unitArrays is not None:
+            sizeUnits = [self._unitArrays.sizeUnitsLast[i] for i in range(self._unitArrays.N)]
+        else:
+            sizeUnits = [unit._sizeUnitsLast for unit in self._units]
+        return {"brackets": dict(self._brackets), "sizeUnits": sizeUnits}
+
+    cpdef public void setSizeHint(self, dict hint):
+        """Uses a previous solution, from :meth:`sizeHint`, as the starting point of the next size(). The unit solutions are only used if unitise() builds the same number of units.
+
+Parameters
+-----------
+hint : dict
+    Previous solution returned by :meth:`sizeHint`.
+        """
+        self._brackets.update(hint.get("brackets", {}))
+        self._sizeUnitsHint = list(hint.get("sizeUnits", [])) or None
+
     cpdef public void run(self) except *:
         """Abstract method: must be defined by subclasses."""
         pass
@@ -292,9 +445,98 @@ config : Config, optional
     cdef public void _unitiseExtra(self):
         pass
 
+    cdef public void _assignUnitMethods(self, HxUnitBasic unit):
+        """Assigns the computational methods of a single HxUnit from its unit phases, _unitPhaseWf and _unitPhaseSf, which are set when the unit is built."""
+        pass
+
+    cdef void _setUnitArea(self, HxUnitBasic unit, double area):
+        """Sets the heat transfer area of a HxUnit [m^2]."""
+        unit.A = area
+
+    cdef list _intervalAdaptive(self, tuple section, FlowState wf0, FlowState sf0, FlowState wf1, FlowState sf1, double area, tuple keys):
+        """list: [wf0, sf0, wf1, sf1, unit, area] for a new HxUnit of the section between the given nodes, where area is the heat transfer area it requires [m^2], estimated by a fixed-point step from the given area (nan if it cannot be evaluated). Adjacent intervals share their node FlowStates."""
+        cdef HxUnitBasic unit = self._unitClass(
+            *section[0],
+            **{keys[0]: wf0},
+            **{keys[1]: wf1},
+            **{keys[2]: sf0},
+            **{keys[3]: sf1},
+            sizeBounds=self.sizeUnitsBounds,
+            config=self.config)
+        unit._unitPhaseWf = section[6]
+        unit._unitPhaseSf = section[7]
+        try:
+            self._assignUnitMethods(unit)
+            self._setUnitArea(unit, area)
+            area = area * unit.Q() / unit.Q_lmtd()
+            self._setUnitArea(unit, area)
+        except Exception:
+            area = nan
+        return [wf0, sf0, wf1, sf1, unit, area]
+
+    cdef tuple _entryAdaptive(self, tuple section, list interval, tuple keys):
+        """tuple: (err, halves) where halves are the two intervals of the bisected interval and err is the estimated error in the area of the unbisected unit."""
+        cdef FlowState wf0 = interval[0]
+        cdef FlowState sf0 = interval[1]
+        cdef FlowState wf1 = interval[2]
+        cdef FlowState sf1 = interval[3]
+        cdef FlowState wf = wf0.copyUpdateState(HmassP_INPUTS, 0.5 * (wf0.h() + wf1.h()), wf0.p())
+        cdef FlowState sf = sf0.copyUpdateState(HmassP_INPUTS, 0.5 * (sf0.h() + sf1.h()), sf0.p())
+        cdef double area = 0.5 * interval[5]
+        cdef tuple halves = (self._intervalAdaptive(section, wf0, sf0, wf, sf, area, keys),
+                             self._intervalAdaptive(section, wf, sf, wf1, sf1, area, keys))
+        cdef double err = abs(halves[0][5] + halves[1][5] - interval[5])
+        if not err < inf:
+            err = 0
+        return (err, halves)
+
+    cdef list _unitsAdaptive(self, list sections, tuple keys):
+        """list of HxUnit: Units of the sections built in unitise(), placed adaptively. Each section starts as one unit; the unit with the largest estimated error in its required heat transfer area is then bisected, until the total estimated error is within config.tolDiv of the total area or the Hx has config.maxUnits units. The error of a unit is estimated by comparing its area with the sum of the areas of its two halves, so units are concentrated where U and the temperature difference vary most, such as near the pinch.
+
+Each bisection evaluates two new units, so this costs roughly twice as many unit evaluations as the units it returns; it is intended to spend a fixed unit budget where it matters, not to unitise faster than the uniform division."""
+        cdef:
+            list heap = []
+            double err, errTotal = 0
+            double area, areaTotal = 0
+            unsigned int i, count = 0, NUnits = 0
+            tuple section, entry, halves
+            list interval
+        for i in range(len(sections)):
+            section = sections[i]
+            if section[5] < 2:
+                continue
+            # initial area of the section, from its share of the heat transfer of the whole Hx
+            area = self._A() * abs((section[2].h() - section[1].h()) / (self.flowsOut[0].h() - self.flowsIn[0].h()))
+            interval = self._intervalAdaptive(section, section[1], section[3], section[2], section[4], area, keys)
+            err, halves = self._entryAdaptive(section, interval, keys)
+            heapq.heappush(heap, (-err, count, i, interval, halves))
+            count += 1
+            errTotal += err
+            areaTotal += interval[5]
+            NUnits += 1
+        while NUnits < self.config.maxUnits and errTotal > self.config.tolDiv * abs(areaTotal):
+            entry = heapq.heappop(heap)
+            errTotal += entry[0]
+            areaTotal -= entry[3][5]
+            i = entry[2]
+            for interval in entry[4]:
+                err, halves = self._entryAdaptive(sections[i], interval, keys)
+                heapq.heappush(heap, (-err, count, i, interval, halves))
+                count += 1
+                errTotal += err
+                areaTotal += interval[5]
+            NUnits += 1
+        intervals = sorted([entry[3] for entry in heap], key=lambda interval: (<FlowState>interval[0]).h())
+        return [interval[4] for interval in intervals]
+
     cpdef public void unitise(self):
-        """Divides the Hx into HxUnits according to divT and divX defined in the configuration parameters, for calculating accurate heat transfer properties."""
+        """Divides the Hx into HxUnits according to divT and divX defined in the configuration parameters, for calculating accurate heat transfer properties. If config.divAdaptive is True, the units are instead placed by :meth:`_unitsAdaptive`. If the number of units is unchanged, each unit keeps the last solution of sizeUnits() of the unit it replaces, or takes the solution given by :meth:`setSizeHint`.
+
+The unit phases are known from the section each unit is built in: liquid, two-phase (evaporating or condensing as the Hx) or vapour for the working fluid, and the phase of the whole Hx for the single-phase secondary fluid; they are set on the units without evaluating the phases of their FlowStates."""
+        cdef list unitsLast = self._units
+        cdef HxUnitArrays arraysLast = self._unitArrays
         self._units = []
+        self._unitArrays = None
         _unitClass = self._unitClass
         cdef:
             list _units = []
@@ -313,6 +555,7 @@ config : Config, optional
             FlowState endRightWf = None
             FlowState endRightSf = None
             FlowState leftNodeWf, rightNodeWf, leftNodeSf, rightNodeSf
+            HxUnitBasic unit
             double liqWf_h = liqWf.h()
             double vapWf_h = vapWf.h()
             double pWf = self.flowsIn[0].p()
@@ -323,11 +566,14 @@ config : Config, optional
             double effSf = self._efficiencyFactorSf()
             double senseFactorSf, hFactorSf, hRightSf, endLeftWf_h, endRightWf_h, endLeftSf_h, endRightSf_h
             double[:] hNodesWf, hNodesSf
-            unsigned int i, nodesSection, nodesTotal = 0
+            unsigned int i, j, nodesSection, nodesTotal = 0
+            list sections = []
             unsigned char sense = self.flowConfig.sense
             bint endFound = False 
             bint skipSection = False
             bint isEvap = self.isEvap()
+            unsigned char unitPhaseSf = get_unitPhase(inSf, outSf)
+            unsigned char unitPhaseTp = UNITPHASE_TWOPHASE_EVAPORATING if isEvap else UNITPHASE_TWOPHASE_CONDENSING
             str leftKeyWf, rightKeyWf, leftKeySf, rightKeySf
         # Assign flow ends
         if isEvap:
@@ -393,23 +639,7 @@ config : Config, optional
         #
         if not skipSection:
             nodesSection = int(np.ceil((rightWf.T() - leftWf.T()) / self.config.divT)) + 1
-            hNodesWf = np.linspace(leftWf.h(), rightWf.h(), nodesSection, True)
-            hNodesSf = np.linspace(leftSf.h(), rightSf.h(), nodesSection, True)
-            for i in range(nodesSection - 1):
-                leftNodeWf = inWf.copyUpdateState(HmassP_INPUTS, hNodesWf[i], pWf)
-                leftNodeSf = inSf.copyUpdateState(HmassP_INPUTS, hNodesSf[i], pSf)
-                rightNodeWf = inWf.copyUpdateState(HmassP_INPUTS, hNodesWf[i+1], pWf)
-                rightNodeSf = inSf.copyUpdateState(HmassP_INPUTS, hNodesSf[i+1], pSf)
-                unit = _unitClass(
-                    *self._unitArgsLiq(),
-                    **{leftKeyWf: leftNodeWf},
-                    **{rightKeyWf: rightNodeWf},
-                    **{leftKeySf: leftNodeSf},
-                    **{rightKeySf: rightNodeSf},
-                    sizeBounds=self.sizeUnitsBounds,
-                    config=self.config) 
-                _units.append(unit)   
-            nodesTotal += nodesSection-1
+            sections.append((self._unitArgsLiq(), leftWf, rightWf, leftSf, rightSf, nodesSection, UNITPHASE_LIQUID, unitPhaseSf))
             leftWf = rightWf
             leftSf = rightSf
         # Section B
@@ -429,23 +659,7 @@ config : Config, optional
         #
         if not skipSection:
             nodesSection = int(np.ceil((rightWf.x() - leftWf.x()) / self.config.divX)) + 1
-            hNodesWf = np.linspace(leftWf.h(), rightWf.h(), nodesSection, True)
-            hNodesSf = np.linspace(leftSf.h(), rightSf.h(), nodesSection, True)
-            for i in range(nodesSection - 1):
-                leftNodeWf = inWf.copyUpdateState(HmassP_INPUTS, hNodesWf[i], pWf)
-                leftNodeSf = inSf.copyUpdateState(HmassP_INPUTS, hNodesSf[i], pSf)
-                rightNodeWf = inWf.copyUpdateState(HmassP_INPUTS, hNodesWf[i+1], pWf)
-                rightNodeSf = inSf.copyUpdateState(HmassP_INPUTS, hNodesSf[i+1], pSf)
-                unit = _unitClass(
-                    *self._unitArgsTp(),
-                    **{leftKeyWf: leftNodeWf},
-                    **{rightKeyWf: rightNodeWf},
-                    **{leftKeySf: leftNodeSf},
-                    **{rightKeySf: rightNodeSf},
-                    sizeBounds=self.sizeUnitsBounds,
-                    config=self.config)  
-                _units.append(unit)   
-            nodesTotal += nodesSection-1
+            sections.append((self._unitArgsTp(), leftWf, rightWf, leftSf, rightSf, nodesSection, unitPhaseTp, unitPhaseSf))
             leftWf = rightWf
             leftSf = rightSf
         # Section C
@@ -459,23 +673,33 @@ config : Config, optional
             skipSection = True
         if not skipSection:# and (endRightWf.h() - vapWf_h) / vapWf_h >= self.config._tolRel_h:
             nodesSection = int(np.ceil((rightWf.T() - leftWf.T()) / self.config.divT)) + 1
-            hNodesWf = np.linspace(leftWf.h(), rightWf.h(), nodesSection, True)
-            hNodesSf = np.linspace(leftSf.h(), rightSf.h(), nodesSection, True)
-            for i in range(nodesSection - 1):
-                leftNodeWf = inWf.copyUpdateState(HmassP_INPUTS, hNodesWf[i], pWf)
-                leftNodeSf = inSf.copyUpdateState(HmassP_INPUTS, hNodesSf[i], pSf)
-                rightNodeWf = inWf.copyUpdateState(HmassP_INPUTS, hNodesWf[i+1], pWf)
-                rightNodeSf = inSf.copyUpdateState(HmassP_INPUTS, hNodesSf[i+1], pSf)
-                unit = _unitClass(
-                    *self._unitArgsVap(),
-                    **{leftKeyWf: leftNodeWf},
-                    **{rightKeyWf: rightNodeWf},
-                    **{leftKeySf: leftNodeSf},
-                    **{rightKeySf: rightNodeSf},
-                    sizeBounds=self.sizeUnitsBounds,
-                    config=self.config)  
-                _units.append(unit)       
-            nodesTotal += nodesSection - 1
+            sections.append((self._unitArgsVap(), leftWf, rightWf, leftSf, rightSf, nodesSection, UNITPHASE_VAPOUR, unitPhaseSf))
+        #
+        if self.config.divAdaptive:
+            _units = self._unitsAdaptive(sections, (leftKeyWf, rightKeyWf, leftKeySf, rightKeySf))
+            nodesTotal = len(_units)
+        else:
+            for j in range(len(sections)):
+                nodesSection = sections[j][5]
+                hNodesWf = np.linspace(sections[j][1].h(), sections[j][2].h(), nodesSection, True)
+                hNodesSf = np.linspace(sections[j][3].h(), sections[j][4].h(), nodesSection, True)
+                for i in range(nodesSection - 1):
+                    leftNodeWf = inWf.copyUpdateState(HmassP_INPUTS, hNodesWf[i], pWf)
+                    leftNodeSf = inSf.copyUpdateState(HmassP_INPUTS, hNodesSf[i], pSf)
+                    rightNodeWf = inWf.copyUpdateState(HmassP_INPUTS, hNodesWf[i+1], pWf)
+                    rightNodeSf = inSf.copyUpdateState(HmassP_INPUTS, hNodesSf[i+1], pSf)
+                    unit = _unitClass(
+                        *sections[j][0],
+                        **{leftKeyWf: leftNodeWf},
+                        **{rightKeyWf: rightNodeWf},
+                        **{leftKeySf: leftNodeSf},
+                        **{rightKeySf: rightNodeSf},
+                        sizeBounds=self.sizeUnitsBounds,
+                        config=self.config)
+                    unit._unitPhaseWf = sections[j][6]
+                    unit._unitPhaseSf = sections[j][7]
+                    _units.append(unit)
+                nodesTotal += nodesSection - 1
         if nodesTotal == 0:
             msg = "HxBasic.unitise(): Entire HX has been skipped, check phases of the working fluid; must not be supercritical liquid or at supercritical point"
             log('error', msg)
@@ -486,11 +710,24 @@ config : Config, optional
             else:
                 _units.reverse()
                 self._units = _units
+            if self._sizeUnitsHint is not None and len(self._sizeUnitsHint) == len(_units):
+                for i in range(len(_units)):
+                    (<HxUnitBasic>_units[i])._sizeUnitsLast = self._sizeUnitsHint[i]
+            elif len(unitsLast) == len(_units):
+                # units are re-built over nearly the same intervals, so keep their last solutions as warm starts for sizeUnits()
+                for i in range(len(_units)):
+                    unit = _units[i]
+                    unit._sizeUnitsLast = (<HxUnitBasic>unitsLast[i])._sizeUnitsLast
+                    unit._brackets = (<HxUnitBasic>unitsLast[i])._brackets
+            elif arraysLast is not None and arraysLast.N == len(_units):
+                for i in range(len(_units)):
+                    (<HxUnitBasic>_units[i])._sizeUnitsLast = arraysLast.sizeUnitsLast[i]
+            self._sizeUnitsHint = None
             self._unitiseExtra()
 
         
-    cpdef double _f_sizeHxBasic(self, double value, str attr):
-        self.update({attr: value})
+    cpdef double _f_sizeHxBasic(self, double value, str attr) except *:
+        self._setAttr(attr, value)
         A_units = 0.
         for unit in self._units:
             unit.sizeUnits()
@@ -524,13 +761,14 @@ config : Config, optional
                 self.unitise()
 
                 tol = self.config.tolAbs + self.config.tolRel * abs(self.Q())
-                sizedValue = opt.brentq(
-                        self._f_sizeHxBasic,
-                        *self.sizeBounds,
-                        args=(attr),
-                        rtol=self.config.tolRel,
-                        xtol=self.config.tolAbs)
-                self.update({attr, sizedValue})
+                sizedValue = brentq(
+                        _SizeResidual(self, attr),
+                        self.sizeBounds[0],
+                        self.sizeBounds[1],
+                        (),
+                        self.config.tolAbs,
+                        self.config.tolRel)
+                self.update({attr: sizedValue})
                 #return sizedValue
         except Exception as exc:
             msg = 'HxBasic.size(): failed to converge.'
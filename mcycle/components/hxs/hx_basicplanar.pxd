@@ -1,10 +1,29 @@
 from .hx_basic cimport HxBasic
 from .hxunit_basic cimport HxUnitBasic
+from .hxunit_basicplanar cimport HxUnitBasicPlanar
+from .hxunit_arrays cimport HxUnitArrays
+from ...bases.flowstate cimport FlowState
 
 cdef class HxBasicPlanar(HxBasic):
     cpdef public double L
     cpdef public double W
+    cpdef public HxUnitArrays _designUnits
     cpdef public double _A(self)
-    cpdef public double size_L(self)
-    cpdef double _f_sizeHxBasicPlanar(self, double value, double L, str attr)
-    cpdef double _f_runHxBasicPlanar(self, double value, double saveL)
+    cdef void _setUnitArea(self, HxUnitBasic unit, double area)
+    cpdef public double size_L(self) except *
+    cdef void _setAttr(self, str attr, double value) except *
+    cpdef double _f_sizeHxBasicPlanar(self, double value, double L, str attr) except *
+    cdef object _f_sizeMulti(self, list attrs, list targets, object x)
+    cpdef public void size_multi(self, list attrs, dict targets) except *
+    cpdef double _f_runHxBasicPlanar(self, double value, double saveL) except *
+    cpdef tuple _runLimits(self)
+    cpdef public void run_marching(self) except *
+    cdef list _nodesMarchingWf(self, double hLim)
+    cdef double _sizeSegmentL(self, HxUnitBasicPlanar unit) except *
+    cdef void _setSegmentFlows(self, HxUnitBasicPlanar unit, FlowState nearWf, FlowState farWf, FlowState nearSf, FlowState farSf)
+    cpdef double _f_runMarchingSegment(self, double value, HxUnitBasicPlanar unit, double hEndSf, double hFactorSf, double Lrem) except *
+    cpdef double _f_runMarching(self, double value, list nodesWf, list segments) except *
+    cpdef public void captureUA(self) except *
+    cdef object _quasiUA(self, double nWf, double nSf)
+    cdef double _f_runQuasi(self, double value, double[:, :] UA, double hLiqWf, double hVapWf, bint reverse) except *
+    cpdef void run_quasi(self, double nWf=*, double nSf=*, bint fallback=*) except *
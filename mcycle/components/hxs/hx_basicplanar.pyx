@@ -1,17 +1,110 @@
 from .hx_basic cimport HxBasic
+from .hxunit_basic cimport HxUnitBasic
 from .hxunit_basicplanar cimport HxUnitBasicPlanar
+from .hxunit_arrays cimport HxUnitArrays
 from .flowconfig cimport HxFlowConfig
+from ...bases.abc cimport ABC
 from ...bases.config cimport Config
 from ...bases.flowstate cimport FlowState
 from ...bases.solidmaterial cimport SolidMaterial
+from ...bases.solvers cimport Residual, brentq, secant, find_root
+from ...bases.utils cimport get_unitPhase
+from ...methods.heat_transfer cimport effectivenessNTU
 from ..._constants cimport *
 from ...logger import log
-from math import nan
-import scipy.optimize as opt
+from math import nan, inf, isinf, isnan
+import numpy as np
 from cython.parallel import prange
 cdef tuple _inputs = ('flowConfig', 'NWf', 'NSf', 'NWall', 'hWf_liq', 'hWf_tp', 'hWf_vap', 'hSf', 'RfWf', 'RfSf', 'wall', 'tWall', 'L', 'W', 'ARatioWf', 'ARatioSf', 'ARatioWall', 'efficiencyThermal', 'flowInWf', 'flowInSf', 'flowOutWf', 'flowOutSf', 'ambient', 'sizeAttr', 'sizeBounds', 'sizeUnitsBounds', 'runBounds', 'runUnitsBounds', 'name', 'notes', 'config')
 cdef tuple _properties = ('mWf', 'mSf', 'Q()', 'A', 'dpWf()', 'dpSf()', 'isEvap()')
+cdef double _stepMulti = 1e-4
+cdef unsigned int _maxHalvingsMulti = 4
+cdef str msg
+
+
+def _sizeUnitL(HxUnitBasicPlanar unit):
+    """float: Size a single HxUnit and return its length. Module level so it can be sent to a process pool."""
+    unit.sizeUnits()
+    return unit.L
+
         
+cdef class _SizeResidual(Residual):
+    """Residual of HxBasicPlanar.size()."""
+    cdef HxBasicPlanar hx
+    cdef double L
+    cdef str attr
+
+    def __init__(self, HxBasicPlanar hx, double L, str attr):
+        self.hx = hx
+        self.L = L
+        self.attr = attr
+
+    cdef double f(self, double x) except *:
+        return self.hx._f_sizeHxBasicPlanar(x, self.L, self.attr)
+
+
+cdef class _RunResidual(Residual):
+    """Residual of HxBasicPlanar.run()."""
+    cdef HxBasicPlanar hx
+    cdef double saveL
+
+    def __init__(self, HxBasicPlanar hx, double saveL):
+        self.hx = hx
+        self.saveL = saveL
+
+    cdef double f(self, double x) except *:
+        return self.hx._f_runHxBasicPlanar(x, self.saveL)
+
+
+cdef class _RunMarchingResidual(Residual):
+    """Residual of HxBasicPlanar.run_marching()."""
+    cdef HxBasicPlanar hx
+    cdef list nodesWf, segments
+
+    def __init__(self, HxBasicPlanar hx, list nodesWf, list segments):
+        self.hx = hx
+        self.nodesWf = nodesWf
+        self.segments = segments
+
+    cdef double f(self, double x) except *:
+        return self.hx._f_runMarching(x, self.nodesWf, self.segments)
+
+
+cdef class _RunMarchingSegmentResidual(Residual):
+    """Residual of the outlet of a segment of HxBasicPlanar.run_marching()."""
+    cdef HxBasicPlanar hx
+    cdef HxUnitBasicPlanar unit
+    cdef double hEndSf, hFactorSf, Lrem
+
+    def __init__(self, HxBasicPlanar hx, HxUnitBasicPlanar unit, double hEndSf, double hFactorSf, double Lrem):
+        self.hx = hx
+        self.unit = unit
+        self.hEndSf = hEndSf
+        self.hFactorSf = hFactorSf
+        self.Lrem = Lrem
+
+    cdef double f(self, double x) except *:
+        return self.hx._f_runMarchingSegment(x, self.unit, self.hEndSf, self.hFactorSf, self.Lrem)
+
+
+cdef class _RunQuasiResidual(Residual):
+    """Residual of HxBasicPlanar.run_quasi()."""
+    cdef HxBasicPlanar hx
+    cdef double[:, :] UA
+    cdef double hLiqWf, hVapWf
+    cdef bint reverse
+
+    def __init__(self, HxBasicPlanar hx, double[:, :] UA, double hLiqWf, double hVapWf, bint reverse):
+        self.hx = hx
+        self.UA = UA
+        self.hLiqWf = hLiqWf
+        self.hVapWf = hVapWf
+        self.reverse = reverse
+
+    cdef double f(self, double x) except *:
+        return self.hx._f_runQuasi(x, self.UA, self.hLiqWf, self.hVapWf, self.reverse)
+
+
 cdef class HxBasicPlanar(HxBasic):
     r"""Characterises a basic planar heat exchanger consisting of working fluid and secondary fluid flows separated by a solid wall with single-phase or multi-phase working fluid but only single-phase secondary fluid.
 
@@ -118,14 +211,33 @@ notes : string, optional
                          sizeBounds, sizeUnitsBounds, runBounds, runUnitsBounds, name, notes, config, _unitClass)
         self._units = []
         self._unitClass = HxUnitBasicPlanar
+        self._designUnits = None
         if self.hasInAndOut(0) and self.hasInAndOut(1):
             pass  # self._unitise()
         self._inputs = _inputs
         self._properties = _properties
 
+    cpdef public ABC copy(self):
+        """Return a new copy of the Hx, including its design point for :meth:`run_quasi`. Overrides :meth:`HxBasic.copy() <mcycle.components.hxs.hx_basic.HxBasic.copy>`."""
+        cdef HxBasicPlanar copy = super(HxBasicPlanar, self).copy()
+        if self._designUnits is not None:
+            copy._designUnits = self._designUnits.copy()
+        return copy
+
     cpdef public double _A(self):
         return self.L * self.W
 
+    cdef void _setAttr(self, str attr, double value) except *:
+        cdef HxUnitBasicPlanar unit
+        if attr == 'L':
+            self.L = value
+        elif attr == 'W':
+            self.W = value
+            for unit in self._units:
+                unit._setAttr(attr, value)
+        else:
+            self.update({attr: value})
+
     cdef public tuple _unitArgsLiq(self):
         """Arguments passed to HxUnits in the liquid region."""
         return (self.flowConfig, self.NWf, self.NSf, self.NWall, self.hWf_liq,
@@ -147,28 +259,45 @@ notes : string, optional
                 self.W, self.ARatioWf, self.ARatioSf, self.ARatioWall,
                 self.efficiencyThermal)
 
-    cpdef public double size_L(self):
-        """float: Solve for the required length of the Hx to satisfy the heat transfer equations [m]."""
+    cdef void _setUnitArea(self, HxUnitBasic unit, double area):
+        """Sets the heat transfer area of a HxUnit [m^2] by its length."""
+        unit.L = area / unit.W
+
+    cpdef public double size_L(self) except *:
+        """float: Solve for the required length of the Hx to satisfy the heat transfer equations [m]. If ``config.executor`` is set, the units are sized concurrently; their lengths are always summed in unit order."""
         cdef double L = 0.
         cdef HxUnitBasicPlanar unit
         cdef size_t i
-        for i in range(len(self._units)):#unit in self._units:
-            unit = self._units[i]
+        cdef list units = []
+        cdef list unitsL
+        cdef list _units = self.units()
+        for i in range(len(_units)):#unit in self._units:
+            unit = _units[i]
             if abs(unit.Q()) > self.config.tolAbs:
+                units.append(unit)
+        if self.config.executor is None or len(units) < 2:
+            for unit in units:
                 unit.sizeUnits()
                 L += unit.L
+        else:
+            unitsL = list(self.config.executor.map(_sizeUnitL, units))
+            for i in range(len(units)):
+                unit = units[i]
+                unit.L = unitsL[i]
+                unit._sizeUnitsLast = unitsL[i]
+                L += unitsL[i]
         self.L = L
         return L
 
 
-    cpdef double _f_sizeHxBasicPlanar(self, double value, double L, str attr):
-        self.update({attr: value})
+    cpdef double _f_sizeHxBasicPlanar(self, double value, double L, str attr) except *:
+        self._setAttr(attr, value)
         return self.size_L() - L
                         
     cpdef public void size(self) except *:
-        """Solves for the value of the nominated component attribute required to return the defined outgoing FlowState.
+        """Solves for the value of the nominated component attribute required to return the defined outgoing FlowState. If sizeBounds gives a bracket, the solution is first sought around the last sized value of the attribute.
         """
-        cdef double L, tol
+        cdef double L, tol, width
         cdef HxUnitBasicPlanar unit
         cdef str attr = self.sizeAttr
         cdef list bounds = self.sizeBounds
@@ -183,15 +312,21 @@ notes : string, optional
                 L = self.L
                 tol = self.config.tolAbs + self.config.tolRel * abs(self.Q())
                 if len(bounds) == 2:
-                    sizedValue = opt.brentq(
-                        self._f_sizeHxBasicPlanar,
-                        bounds[0],
-                        bounds[1],
-                        args=(L, attr),
-                        rtol=self.config.tolRel,
-                        xtol=self.config.tolAbs)
+                    sizedValue = find_root(_SizeResidual(self, L, attr),
+                                           bounds[0],
+                                           bounds[1],
+                                           (),
+                                           bounds[0],
+                                           bounds[1],
+                                           self.config.tolRel,
+                                           self.config.tolAbs,
+                                           self._brackets,
+                                           attr)
+                    # narrow the stored bracket so the next size() starts close to this solution
+                    width = 0.01 * (bounds[1] - bounds[0])
+                    self._brackets[attr] = (max(bounds[0], sizedValue - width), min(bounds[1], sizedValue + width))
                 elif len(bounds) == 1:
-                    sizedValue = opt.newton(self._f_sizeHxBasicPlanar, bounds[0], args=(L, attr), tol=tol)
+                    sizedValue = secant(_SizeResidual(self, L, attr), bounds[0], nan, (), tol)
                 else:
                     raise ValueError("HxBasicPlanar.size(): bounds are not valid (given: {})".format(bounds))
                 self.update({attr: sizedValue})
@@ -202,7 +337,82 @@ notes : string, optional
             raise exc
 
 
-    cpdef double _f_runHxBasicPlanar(self, double value, double saveL):
+    cdef object _f_sizeMulti(self, list attrs, list targets, object x):
+        """numpy.ndarray: Relative errors of the targets, a list of (name, value), after updating attrs to x and sizing L."""
+        cdef list err = []
+        cdef double L
+        cdef str key
+        self.update(dict(zip(attrs, x.tolist())))
+        L = self.size_L()
+        for key, value in targets:
+            if key == "L":
+                err.append(L / value - 1)
+            else:
+                err.append(getattr(self, key)() / value - 1)
+        return np.array(err)
+
+    cpdef public void size_multi(self, list attrs, dict targets) except *:
+        """Solves for the values of several attributes together so that the Hx satisfies the heat transfer equations (see size_L()) and meets the same number of targets. The Hx is unitised once and its units are reused by each iteration. The Jacobian is first estimated by finite differences, then updated by Broyden's method; steps that increase the error are halved.
+
+Parameters
+-----------
+attrs : list of str
+    Attributes to solve for, keyed as for update(), eg; ["W", "geomWf.b"]. Their current values are the initial guess. Attributes must be continuous; L cannot be solved for as it is sized by size_L().
+targets : dict
+    Target values keyed by "L" or the name of a method of the Hx with no arguments, eg; {"L": 0.269, "dpWf": 40e3} or {"dpSf": 5e5, "mass": 2.4}. Must have the same number of items as attrs.
+        """
+        cdef size_t i, j, n = len(attrs)
+        cdef unsigned int count = 0, halvings
+        cdef list targetsList = list(targets.items())
+        cdef str attr
+        cdef double tol = self.config.tolRel
+        if len(targetsList) != n or n == 0:
+            msg = "HxBasicPlanar.size_multi(): number of attrs ({}) and targets ({}) must be equal and non-zero".format(n, len(targetsList))
+            log("error", msg)
+            raise ValueError(msg)
+        if "L" in attrs:
+            msg = "HxBasicPlanar.size_multi(): L cannot be in attrs, it is sized by size_L()"
+            log("error", msg)
+            raise ValueError(msg)
+        x = np.empty(n)
+        for i in range(n):
+            obj = self
+            for attr in attrs[i].split("."):
+                obj = getattr(obj, attr)
+            if isinstance(obj, int):
+                msg = "HxBasicPlanar.size_multi(): attrs must be continuous (given: {}={})".format(attrs[i], obj)
+                log("error", msg)
+                raise ValueError(msg)
+            x[i] = obj
+        self.unitise()
+        err = self._f_sizeMulti(attrs, targetsList, x)
+        J = np.empty((n, n))
+        for j in range(n):
+            xStep = x.copy()
+            xStep[j] *= 1 + _stepMulti
+            J[:, j] = (self._f_sizeMulti(attrs, targetsList, xStep) - err) / (xStep[j] - x[j])
+        while np.max(np.abs(err)) > tol:
+            count += 1
+            if count > self.config.maxIterComponent:
+                self._f_sizeMulti(attrs, targetsList, x)
+                msg = "HxBasicPlanar.size_multi(): {} iterations without converging: errors={}>tol={}".format(self.config.maxIterComponent, err.tolist(), tol)
+                log("error", msg)
+                raise StopIteration(msg)
+            dx = np.linalg.solve(J, -err)
+            halvings = 0
+            while halvings < _maxHalvingsMulti and np.any(x + dx <= 0):
+                dx /= 2
+                halvings += 1
+            errNew = self._f_sizeMulti(attrs, targetsList, x + dx)
+            while halvings < _maxHalvingsMulti and np.linalg.norm(errNew) > np.linalg.norm(err):
+                dx /= 2
+                halvings += 1
+                errNew = self._f_sizeMulti(attrs, targetsList, x + dx)
+            J += np.outer(errNew - err - J @ dx, dx) / (dx @ dx)
+            x += dx
+            err = errNew
+
+    cpdef double _f_runHxBasicPlanar(self, double value, double saveL) except *:
         self.flowsOut[0] = self.flowsIn[0].copyUpdateState(HmassP_INPUTS, value, self.flowsIn[0].p())
         cdef double hOut = self.flowsIn[1].h() - self._mWf() * self._efficiencyFactorWf() * (self.flowsOut[0].h() - self.flowsIn[0].h()) / self._mSf() / self._efficiencyFactorSf()
         self.flowsOut[1] = self.flowsIn[1].copyUpdateState(HmassP_INPUTS, hOut, self.flowsIn[1].p())
@@ -211,44 +421,34 @@ notes : string, optional
         #print("----------- _f_runHxBasicPlanar, saveL - self.size_L = ", o)
         return o
         
-    cpdef public void run(self):
-        cdef double tol, sizedValue, a, b, saveL = self.L
-        """
-        cdef FlowState critWf = self.flowsIn[0].copyUpdateState(PT_INPUTS, self.flowsIn[0].p(), self.flowsIn[0]._state.T_critical())
-        cdef FlowState minWf = self.flowsIn[0].copyUpdateState(PT_INPUTS, self.flowsIn[0].p(), self.flowsIn[0]._state.Tmin())
-        cdef double deltah"""
+    cpdef tuple _runLimits(self):
+        """tuple of float: Physical limits of the outgoing working fluid enthalpy for run(); between the incoming working fluid enthalpy and the enthalpy at which the working fluid outlet reaches the incoming secondary fluid temperature. A limit that cannot be evaluated is taken as infinite."""
+        cdef double hLimit
         try:
-            """
-            if self.isEvap():
-                deltah = critWf.h() - self.flowsIn[0].h()
-                a = self.flowsIn[0].h() + deltah*self.runBounds[0]
-                if self.flowsIn[1].T() > critWf.T():
-                    b = self.flowsIn[0].h() + deltah*self.runBounds[1]
-                else:
-                    deltah = self.flowsIn[0].copyUpdateState(PT_INPUTS, self.flowsIn[0].p(), self.flowsIn[1].T()).h() - self.flowsIn[0].h()
-                    b = self.flowsIn[0].h() + deltah*(self.runBounds[1])
-            else:
-                deltah = self.flowsIn[0].h() - minWf.h()
-                b = self.flowsIn[0].h() - deltah*self.runBounds[0]
-                
-                if self.flowsIn[1].T() < minWf.T():
-                    a = self.flowsIn[0].h() - deltah*self.runBounds[1]
-                else:
-                    deltah = self.flowsIn[0].h() - self.flowsIn[0].copyUpdateState(PT_INPUTS, self.flowsIn[0].p(), self.flowsIn[1].T()).h()
-                    a = self.flowsIn[0].h() - deltah*self.runBounds[1]
-           
-            sizedValue = opt.brentq(self._f_runHxBasicPlanar,
-                                    a,
-                                    b,
-                                    args=(saveL),
-                                    rtol=self.config.tolRel,
-                                    xtol=self.config.tolAbs)
-            """
-            sizedValue = opt.brentq(self._f_runHxBasicPlanar,
-                                    *self.runBounds,
-                                    args=(saveL),
-                                    rtol=self.config.tolRel,
-                                    xtol=self.config.tolAbs)
+            hLimit = self.flowsIn[0].copyUpdateState(PT_INPUTS, self.flowsIn[0].p(), self.flowsIn[1].T()).h()
+        except Exception:
+            hLimit = inf if self.isEvap() else -inf
+        if self.isEvap():
+            return (self.flowsIn[0].h(), hLimit)
+        else:
+            return (hLimit, self.flowsIn[0].h())
+
+    cpdef public void run(self) except *:
+        """Solves for the outgoing working fluid enthalpy given the length L. The solution is bracketed by :meth:`find_root <mcycle.bases.solvers.find_root>` from runBounds if given, or else from the physical limits of :meth:`_runLimits`, and is first sought around the last solution of run()."""
+        cdef double sizedValue, saveL = self.L
+        cdef tuple limits
+        try:
+            limits = self._runLimits()
+            sizedValue = find_root(_RunResidual(self, saveL),
+                                   self.runBounds[0],
+                                   self.runBounds[1],
+                                   (),
+                                   limits[0],
+                                   limits[1],
+                                   self.config.tolRel,
+                                   self.config.tolAbs,
+                                   self._brackets,
+                                   'run')
         except AssertionError as err:
             raise err
         except AttributeError as err:
@@ -261,6 +461,347 @@ notes : string, optional
             
             self.update({"L": saveL})
 
+
+    cpdef public void run_marching(self) except *:
+        """Rates the Hx by marching along it from the working fluid inlet, as an alternative to :meth:`run`. The working fluid is divided into segments according to divT and divX, up to the end of runBounds furthest from flowInWf, or else up to the physical limit of :meth:`_runLimits`. The length of each segment is solved locally from its energy balance until the length L is used up. For counterflow, the outgoing working fluid enthalpy is found by shooting with :meth:`find_root <mcycle.bases.solvers.find_root>`, bracketed as in :meth:`run`; the segments and their lengths are reused between shots. For parallel flow a single march is required."""
+        cdef double hEnd, hOutWf, hInWf = self.flowsIn[0].h()
+        cdef double saveL = self.L
+        cdef tuple limits
+        cdef list nodesWf, segments = []
+        try:
+            limits = self._runLimits()
+            if self.isEvap():
+                hEnd = limits[1] if isnan(self.runBounds[0]) or isnan(self.runBounds[1]) else max(self.runBounds)
+                limits = (limits[0], hEnd)
+            else:
+                hEnd = limits[0] if isnan(self.runBounds[0]) or isnan(self.runBounds[1]) else min(self.runBounds)
+                limits = (hEnd, limits[1])
+            nodesWf = self._nodesMarchingWf(hEnd)
+            if self.flowConfig.sense == PARALLELFLOW:
+                hOutWf = hInWf + self._f_runMarching(hInWf, nodesWf, segments)
+            else:
+                hOutWf = find_root(_RunMarchingResidual(self, nodesWf, segments),
+                                   self.runBounds[0],
+                                   self.runBounds[1],
+                                   (),
+                                   limits[0],
+                                   limits[1],
+                                   self.config.tolRel,
+                                   self.config.tolAbs,
+                                   self._brackets,
+                                   'run_marching')
+                self._f_runMarching(hOutWf, nodesWf, segments)
+            self.flowsOut[0] = self._units[len(self._units) - 1].flowsOut[0]
+            self.flowsOut[1] = self.flowsIn[1].copyUpdateState(
+                HmassP_INPUTS, self.flowsIn[1].h() - self._mWf() * self._efficiencyFactorWf() * (self.flowsOut[0].h() - hInWf) / self._mSf() / self._efficiencyFactorSf(), self.flowsIn[1].p())
+        except AssertionError as err:
+            raise err
+        except AttributeError as err:
+            raise err
+        except Exception as exc:
+            raise StopIteration(
+                "{}.run_marching() failed to converge. Check bounds for solution: runBounds={}. ".format(
+                    self.__class__.__name__, self.runBounds), exc)
+        finally:
+            self.L = saveL
+
+    cdef list _nodesMarchingWf(self, double hLim):
+        """list of FlowState: Working fluid nodes from flowInWf to the enthalpy hLim, spaced according to divT and divX with nodes at the saturation points."""
+        cdef:
+            FlowState inWf = self.flowsIn[0]
+            double pWf = inWf.p()
+            double hInWf = inWf.h()
+            FlowState liqWf = inWf.copyUpdateState(PQ_INPUTS, pWf, 0)
+            FlowState vapWf = inWf.copyUpdateState(PQ_INPUTS, pWf, 1)
+            double liqWf_h = liqWf.h()
+            double vapWf_h = vapWf.h()
+            double hMid
+            list ends = [inWf]
+            list nodes = [inWf]
+            FlowState sat, left, right
+            double[:] hNodes
+            unsigned int i, j, nodesSection
+        for sat in ([liqWf, vapWf] if hLim > hInWf else [vapWf, liqWf]):
+            if min(hInWf, hLim) < sat.h() < max(hInWf, hLim):
+                ends.append(sat)
+        ends.append(inWf.copyUpdateState(HmassP_INPUTS, hLim, pWf))
+        for i in range(len(ends) - 1):
+            left = ends[i]
+            right = ends[i + 1]
+            hMid = 0.5 * (left.h() + right.h())
+            if liqWf_h < hMid < vapWf_h:
+                nodesSection = int(np.ceil(abs(right.x() - left.x()) / self.config.divX)) + 1
+            else:
+                nodesSection = int(np.ceil(abs(right.T() - left.T()) / self.config.divT)) + 1
+            hNodes = np.linspace(left.h(), right.h(), nodesSection, True)
+            for j in range(1, nodesSection - 1):
+                nodes.append(inWf.copyUpdateState(HmassP_INPUTS, hNodes[j], pWf))
+            nodes.append(right)
+        return nodes
+
+    cdef double _sizeSegmentL(self, HxUnitBasicPlanar unit) except *:
+        """float: Length of a marching segment [m], found by fixed-point iteration from the segment's previous length. Returns inf if the flow temperatures cross in the segment."""
+        cdef double L = unit.L
+        cdef double LNew, qLmtd
+        cdef unsigned int count = 0
+        if not L > 0:
+            L = self.L
+        while True:
+            unit.L = L
+            qLmtd = unit.Q_lmtd()
+            if qLmtd == 0:
+                return inf
+            LNew = L * unit.Q() / qLmtd
+            if not LNew > 0 or isinf(LNew):
+                return inf
+            if abs(LNew - L) <= self.config.tolRel * L:
+                unit.L = LNew
+                return LNew
+            L = LNew
+            count += 1
+            if count > self.config.maxIterComponent:
+                raise StopIteration(
+                    """{} iterations without segment length converging""".format(self.config.maxIterComponent))
+
+    cdef void _setSegmentFlows(self, HxUnitBasicPlanar unit, FlowState nearWf, FlowState farWf, FlowState nearSf, FlowState farSf):
+        unit.flowsIn[0] = nearWf
+        unit.flowsOut[0] = farWf
+        if self.flowConfig.sense == PARALLELFLOW:
+            unit.flowsIn[1] = nearSf
+            unit.flowsOut[1] = farSf
+        else:
+            unit.flowsIn[1] = farSf
+            unit.flowsOut[1] = nearSf
+
+    cpdef double _f_runMarchingSegment(self, double value, HxUnitBasicPlanar unit, double hEndSf, double hFactorSf, double Lrem) except *:
+        """Sets the far working fluid enthalpy of the last marching segment and returns its length minus the remaining Hx length."""
+        cdef FlowState inWf = self.flowsIn[0]
+        cdef FlowState farSf
+        if value == unit.flowsIn[0].h():
+            return -Lrem
+        farSf = self.flowsIn[1].copyUpdateState(HmassP_INPUTS, hEndSf + hFactorSf * (value - inWf.h()), self.flowsIn[1].p())
+        unit.flowsOut[0] = inWf.copyUpdateState(HmassP_INPUTS, value, inWf.p())
+        if self.flowConfig.sense == PARALLELFLOW:
+            unit.flowsOut[1] = farSf
+        else:
+            unit.flowsIn[1] = farSf
+        cdef double L = self._sizeSegmentL(unit)
+        if isinf(L):
+            return self.L
+        return L - Lrem
+
+    cpdef double _f_runMarching(self, double value, list nodesWf, list segments) except *:
+        """Marches along the Hx from the working fluid inlet, given the outgoing working fluid enthalpy, and returns the difference between the enthalpy reached after length L and that value. Segments are reused between calls."""
+        cdef:
+            FlowState inWf = self.flowsIn[0]
+            FlowState inSf = self.flowsIn[1]
+            double hInWf = inWf.h()
+            double pSf = inSf.p()
+            double liqWf_h = inWf.copyUpdateState(PQ_INPUTS, inWf.p(), 0).h()
+            double vapWf_h = inWf.copyUpdateState(PQ_INPUTS, inWf.p(), 1).h()
+            double hFactorSf = self._mWf() * self._efficiencyFactorWf() / self._mSf() / self._efficiencyFactorSf()
+            double hEndSf, hMid, hOutWf, Lseg, Lrem = self.L
+            FlowState nearSf, farSf
+            HxUnitBasicPlanar unit
+            unsigned int i
+            unsigned char unitPhaseWf, unitPhaseSf = UNITPHASE_NONE
+            tuple unitArgs
+        _unitClass = self._unitClass
+        if self.flowConfig.sense == PARALLELFLOW:
+            hEndSf = inSf.h()
+            hFactorSf *= -1
+            nearSf = inSf
+        else:
+            hEndSf = inSf.h() - hFactorSf * (value - hInWf)
+            nearSf = inSf.copyUpdateState(HmassP_INPUTS, hEndSf, pSf)
+        self._units = []
+        self._unitArrays = None
+        for i in range(len(nodesWf) - 1):
+            farSf = inSf.copyUpdateState(HmassP_INPUTS, hEndSf + hFactorSf * (nodesWf[i + 1].h() - hInWf), pSf)
+            if i == len(segments):
+                hMid = 0.5 * (nodesWf[i].h() + nodesWf[i + 1].h())
+                if hMid < liqWf_h:
+                    unitArgs = self._unitArgsLiq()
+                    unitPhaseWf = UNITPHASE_LIQUID
+                elif hMid < vapWf_h:
+                    unitArgs = self._unitArgsTp()
+                    unitPhaseWf = UNITPHASE_TWOPHASE_EVAPORATING if self.isEvap() else UNITPHASE_TWOPHASE_CONDENSING
+                else:
+                    unitArgs = self._unitArgsVap()
+                    unitPhaseWf = UNITPHASE_VAPOUR
+                if unitPhaseSf == UNITPHASE_NONE:
+                    unitPhaseSf = get_unitPhase(inSf, inSf)
+                unit = _unitClass(*unitArgs, sizeBounds=self.sizeUnitsBounds, config=self.config)
+                unit._unitPhaseWf = unitPhaseWf
+                unit._unitPhaseSf = unitPhaseSf
+                segments.append(unit)
+            unit = segments[i]
+            self._setSegmentFlows(unit, nodesWf[i], nodesWf[i + 1], nearSf, farSf)
+            self._assignUnitMethods(unit)
+            self._units.append(unit)
+            Lseg = self._sizeSegmentL(unit)
+            if Lseg >= Lrem:
+                # the outlet lies within this segment
+                hOutWf = brentq(_RunMarchingSegmentResidual(self, unit, hEndSf, hFactorSf, Lrem),
+                                nodesWf[i].h(),
+                                nodesWf[i + 1].h(),
+                                (),
+                                self.config.tolAbs,
+                                self.config.tolRel)
+                self._f_runMarchingSegment(hOutWf, unit, hEndSf, hFactorSf, Lrem)
+                unit.L = Lrem
+                return hOutWf - value
+            Lrem -= Lseg
+            nearSf = farSf
+        return nodesWf[len(nodesWf) - 1].h() - value
+
+    cpdef public void captureUA(self) except *:
+        """Stores the units at the current operating point, :meth:`unitArrays`, as the design point of :meth:`run_quasi`. Call after size() to use run_quasi(); size() does not call it, as evaluating the units costs about as much again as a warm size(). The design point is kept until captureUA() is called again."""
+        self._designUnits = self.unitArrays()
+
+    cdef object _quasiUA(self, double nWf, double nSf):
+        """numpy.ndarray: UA of each unit of the design point [W/K] for a liquid, two-phase and vapour working fluid (columns), scaled to the current mass flow rates and area. The convective resistances of the design point, RWf and RSf, are scaled by (mDesign / m)**n; the remaining thermal resistance of each unit, 1/U - RWf - RSf, is kept. A unit whose working fluid phase differs from the design point takes the area-weighted mean RWf of the design units in that phase."""
+        cdef:
+            HxUnitArrays design = self._designUnits
+            unsigned int i, j, N = design.N
+            double ratioWf = (design.mWf / self._mWf())**nWf
+            double ratioSf = (design.mSf / self._mSf())**nSf
+            double ratioA = self._A() / np.sum(design.A)
+            double RWf, RRest
+            double[:] RWfMean = np.zeros(3)
+            double[:] AMean = np.zeros(3)
+            unsigned char[:] cols = np.ones(N, dtype=np.uint8)
+            double[:, :] UA = np.empty((N, 3))
+        for i in range(N):
+            if design.unitPhaseWf[i] == UNITPHASE_LIQUID:
+                cols[i] = 0
+            elif design.unitPhaseWf[i] == UNITPHASE_VAPOUR:
+                cols[i] = 2
+            RWfMean[cols[i]] += design.RWf[i] * design.A[i]
+            AMean[cols[i]] += design.A[i]
+        for i in range(N):
+            RRest = 1 / design.U[i] - design.RWf[i] - design.RSf[i]
+            for j in range(3):
+                if j == cols[i] or AMean[j] == 0:
+                    RWf = design.RWf[i]
+                else:
+                    RWf = RWfMean[j] / AMean[j]
+                UA[i, j] = ratioA * design.A[i] / (RWf * ratioWf + design.RSf[i] * ratioSf + RRest)
+        return np.asarray(UA)
+
+    cdef double _f_runQuasi(self, double value, double[:, :] UA, double hLiqWf, double hVapWf, bint reverse) except *:
+        """Marches along the units of the design point, rating each unit by the epsilon-NTU method from its scaled UA, given the outgoing working fluid enthalpy. If reverse, the march starts from the working fluid outlet, where the secondary fluid enters, and returns the difference between the working fluid enthalpy reached at the inlet and that of flowInWf; otherwise it starts from the working fluid inlet and returns the difference between the enthalpy reached at the outlet and value. For counterflow, the effectiveness of each unit is applied with the secondary fluid outlet (or working fluid outlet, if reverse) known instead of its inlet."""
+        cdef:
+            FlowState inWf = self.flowsIn[0]
+            FlowState inSf = self.flowsIn[1]
+            FlowState nodeWf, nodeSf
+            double pWf = inWf.p()
+            double pSf = inSf.p()
+            double mEffWf = self._mWf() * self._efficiencyFactorWf()
+            double mEffSf = self._mSf() * self._efficiencyFactorSf()
+            double hWf, hSf, CWf, CSf, Cmin, Cmax, eff, q
+            unsigned int i, j, col, N = UA.shape[0]
+            bint isParallel = self.flowConfig.sense == PARALLELFLOW
+        if reverse:
+            hWf = value
+            hSf = inSf.h()
+        else:
+            hWf = inWf.h()
+            hSf = inSf.h() if isParallel else inSf.h() - mEffWf * (value - hWf) / mEffSf
+        for j in range(N):
+            i = N - 1 - j if reverse else j
+            nodeWf = inWf.copyUpdateState(HmassP_INPUTS, hWf, pWf)
+            nodeSf = inSf.copyUpdateState(HmassP_INPUTS, hSf, pSf)
+            if hLiqWf <= hWf < hVapWf:
+                col = 1
+                CWf = inf
+            else:
+                col = 0 if hWf < hLiqWf else 2
+                CWf = mEffWf * nodeWf.cp()
+            CSf = mEffSf * nodeSf.cp()
+            Cmin = min(CWf, CSf)
+            Cmax = max(CWf, CSf)
+            eff = effectivenessNTU(UA[i, col] / Cmin, Cmin / Cmax, self.flowConfig.sense)
+            q = eff * Cmin * (nodeSf.T() - nodeWf.T())
+            if reverse:
+                q /= 1 - eff * Cmin / CWf
+                hWf -= q / mEffWf
+                hSf -= q / mEffSf
+            elif isParallel:
+                hWf += q / mEffWf
+                hSf -= q / mEffSf
+            else:
+                q /= 1 - eff * Cmin / CSf
+                hWf += q / mEffWf
+                hSf += q / mEffSf
+        if reverse:
+            return hWf - inWf.h()
+        return hWf - value
+
+    cpdef void run_quasi(self, double nWf=0.8, double nSf=0.8, bint fallback=True) except *:
+        """Rates the Hx quickly from the design point stored by :meth:`captureUA` (called after size()), as an alternative to :meth:`run` for off-design screening. The UA of each design unit is scaled to the current mass flow rates by :meth:`_quasiUA` and the units are rated in turn by the epsilon-NTU method; no correlations are evaluated and the Hx is not unitised. For counterflow, the outgoing working fluid enthalpy is found as by run(), bracketed from runBounds if given, or else from between the incoming working fluid enthalpy and the outgoing enthalpy of the design point. The units of the Hx are not updated.
+
+Parameters
+-----------
+nWf : float, optional
+    Mass flow rate exponent of the working fluid heat transfer coefficients. Defaults to 0.8.
+nSf : float, optional
+    Mass flow rate exponent of the secondary fluid heat transfer coefficients. Defaults to 0.8.
+fallback : bool, optional
+    Run the Hx by :meth:`run` if no design point is stored or the quasi-rating fails. Defaults to True.
+        """
+        cdef FlowState inWf = self.flowsIn[0]
+        cdef double hOutWf, hLiqWf, hVapWf, hInWf = inWf.h()
+        cdef double[:, :] UA
+        cdef tuple limits
+        cdef double CWf, CSf
+        cdef list hint
+        cdef HxUnitArrays design
+        try:
+            if self._designUnits is None:
+                msg = "{}.run_quasi(): no design point stored, call captureUA() after size() first".format(self.__class__.__name__)
+                log("error", msg)
+                raise ValueError(msg)
+            UA = self._quasiUA(nWf, nSf)
+            try:
+                hLiqWf = inWf.copyUpdateState(PQ_INPUTS, inWf.p(), 0).h()
+                hVapWf = inWf.copyUpdateState(PQ_INPUTS, inWf.p(), 1).h()
+            except Exception:
+                # supercritical working fluid
+                hLiqWf, hVapWf = nan, nan
+            if self.flowConfig.sense == PARALLELFLOW:
+                hOutWf = hInWf + self._f_runQuasi(hInWf, UA, hLiqWf, hVapWf, False)
+            else:
+                # march in the direction of the flow with the smaller heat capacity rate at the design point, as errors then decay along the march
+                design = self._designUnits
+                CWf = design.mWf * (design.hNodesWf[design.N] - design.hNodesWf[0]) / (design.TNodesWf[design.N] - design.TNodesWf[0])
+                CSf = design.mSf * (design.hNodesSf[design.N] - design.hNodesSf[0]) / (design.TNodesSf[design.N] - design.TNodesSf[0])
+                limits = self._runLimits()
+                hint = self.runBounds
+                if isnan(hint[0]) or isnan(hint[1]):
+                    hOutWf = self._designUnits.hNodesWf[self._designUnits.N]
+                    hint = [0.5 * (hInWf + hOutWf), hOutWf]
+                hOutWf = find_root(_RunQuasiResidual(self, UA, hLiqWf, hVapWf, not CWf < CSf),
+                                   hint[0],
+                                   hint[1],
+                                   (),
+                                   limits[0],
+                                   limits[1],
+                                   self.config.tolRel,
+                                   self.config.tolAbs,
+                                   self._brackets,
+                                   'run_quasi')
+            self.flowsOut[0] = inWf.copyUpdateState(HmassP_INPUTS, hOutWf, inWf.p())
+            self.flowsOut[1] = self.flowsIn[1].copyUpdateState(
+                HmassP_INPUTS, self.flowsIn[1].h() - self._mWf() * self._efficiencyFactorWf() * (hOutWf - hInWf) / self._mSf() / self._efficiencyFactorSf(), self.flowsIn[1].p())
+        except AssertionError as err:
+            raise err
+        except Exception as exc:
+            if not fallback:
+                raise exc
+            log("warning", "{}.run_quasi(): falling back to run()".format(self.__class__.__name__), exc)
+            self.run()
+
             
     @property
     def A(self):
@@ -1,5 +1,8 @@
 from .hx_basicplanar cimport HxBasicPlanar
+from .hxunit_basic cimport HxUnitBasic
+from .hxunit_arrays cimport HxUnitArrays
 from ...bases.geom cimport Geom
+from ...bases.flowstate cimport FlowState
 
 cdef class HxPlate(HxBasicPlanar):
 
@@ -20,12 +23,20 @@ cdef class HxPlate(HxBasicPlanar):
     cpdef public double depth(self)
     cpdef public double dpFWf(self)
     cpdef public double dpFSf(self)
+    cpdef dict unitCorrelations(self, bint wf=*)
     cpdef public double dpAccWf(self)
     cpdef public double dpAccSf(self)
     cpdef public double dpHeadWf(self)
     cpdef public double dpHeadSf(self)
     cpdef public double dpPortWf(self)
     cpdef public double dpPortSf(self)
+    cdef double _diff_NPlate(self, unsigned int NPlate, double L, dict diffs) except *
     cpdef public unsigned int size_NPlate(self) except 0
+    cdef tuple _sweepDesign(self, list keys, tuple design)
+    cpdef public dict sweep(self, dict grid)
+    cdef tuple _runCondition(self, FlowState flowInWf, FlowState flowInSf)
+    cpdef public dict run_batch(self, flowsInWf, flowsInSf)
 
     cdef public void _unitiseExtra(self)
+    cdef public void _assignUnitMethods(self, HxUnitBasic unit)
+    cdef void _unitArraysExtra(self, HxUnitArrays arrays)
@@ -1,23 +1,44 @@
 from .hxunit_basic cimport HxUnitBasic
 from .hx_basicplanar cimport HxBasicPlanar
 from .hxunit_plate cimport HxUnitPlate
+from .hxunit_arrays cimport HxUnitArrays
 from .flowconfig cimport HxFlowConfig
 from ...bases.config cimport Config
 from ...bases.component cimport Component22
 from ...bases.geom cimport Geom
 from ...bases.flowstate cimport FlowState
 from ...bases.solidmaterial cimport SolidMaterial
-from ...bases.utils cimport *
 from ..._constants cimport *
 from ...logger import log
+from ...methods import heat_transfer as ht
 from warnings import warn
 from math import nan, isnan, pi
 import scipy.optimize as opt
+import numpy as np
+import itertools
+import os
 
 cdef tuple _inputs = ('flowConfig', 'NPlate', 'RfWf', 'RfSf', 'plate', 'tPlate', 'geomWf', 'geomSf', 'L', 'W', 'portWf', 'portSf', 'LVertPortWf', 'LVertPortSf', 'coeffs_LPlate', 'coeffs_WPlate', 'coeffs_mass', 'efficiencyThermal', 'flowInWf', 'flowInSf', 'flowOutWf', 'flowOutSf', 'ambient', 'sizeAttr', 'sizeBounds', 'sizeUnitsBounds', 'runBounds', 'runUnitsBounds', 'name', 'notes', 'config')
 cdef tuple _properties = ('mWf', 'mSf', 'Q()', 'A', 'dpWf()', 'dpSf()', 'isEvap()')
 cdef str msg
 
+
+def _sweepHxPlate(HxPlate hx, list keys, list designs):
+    """list of tuple: (mass, L, dpWf, dpSf) for each design of a copy of hx. Module level so it can be sent to a process pool."""
+    hx = <HxPlate>hx.copy()
+    hx.config.executor = None
+    hx.unitise()
+    return [hx._sweepDesign(keys, design) for design in designs]
+
+
+def _runBatchHxPlate(HxPlate hx, list flowsInWf, list flowsInSf):
+    """list of tuple: (flowOutWf, flowOutSf, Q, dpWf, dpSf) for each pair of incoming FlowStates, rated in order by a copy of hx. Module level so it can be sent to a process pool."""
+    cdef size_t i
+    hx = <HxPlate>hx.copy()
+    hx.config.executor = None
+    return [hx._runCondition(flowsInWf[i], flowsInSf[i]) for i in range(len(flowsInWf))]
+
+
 cdef class HxPlate(HxBasicPlanar):
     r"""Characterises a basic plate heat exchanger consisting of alternating working fluid and secondary fluid flows separated by a solid wall with single-phase or multi-phase working fluid but only single-phase secondary fluid.
 
@@ -130,6 +151,9 @@ config : Config, optional
         self.portSf = portSf
         self.LVertPortWf = LVertPortWf
         self.LVertPortSf = LVertPortSf
+        self.coeffs_LPlate = coeffs_LPlate
+        self.coeffs_WPlate = coeffs_WPlate
+        self.coeffs_mass = coeffs_mass
         self._unitClass = HxUnitPlate
         self._inputs = _inputs
         self._properties = _properties
@@ -163,22 +187,34 @@ config : Config, optional
 
     
     cdef public void _unitiseExtra(self):
+        cdef HxUnitBasic unit
+        for unit in self._units:
+            self._assignUnitMethods(unit)
+
+    cdef public void _assignUnitMethods(self, HxUnitBasic unit):
         cdef:
-            unsigned int i, NUnits=len(self._units)
-            unsigned char unitPhaseWf, unitPhaseSf
+            unsigned char unitPhaseWf = unit._unitPhaseWf
+            unsigned char unitPhaseSf = unit._unitPhaseSf
             str clsName = self.__class__.__name__
             str geomWf = self.geomWf.__class__.__name__
             str geomSf = self.geomSf.__class__.__name__
-        for i in range(NUnits):
-            unitPhaseWf = get_unitPhase(self._units[i].flowsIn[0], self._units[i].flowsOut[0])
-            unitPhaseSf = get_unitPhase(self._units[i].flowsIn[1], self._units[i].flowsOut[1])
-            self._units[i]._unitPhaseWf = unitPhaseWf
-            self._units[i]._unitPhaseSf = unitPhaseSf
-            self._units[i]._methodHeatWf = self.config.lookupMethod(clsName, (geomWf, TRANSFER_HEAT, unitPhaseWf, WORKING_FLUID))
-            self._units[i]._methodHeatSf = self.config.lookupMethod(clsName, (geomSf, TRANSFER_HEAT, unitPhaseSf, SECONDARY_FLUID))
-            self._units[i]._methodFrictionWf = self.config.lookupMethod(clsName, (geomWf, TRANSFER_FRICTION, unitPhaseWf, WORKING_FLUID))
-            self._units[i]._methodFrictionSf = self.config.lookupMethod(clsName, (geomSf, TRANSFER_FRICTION, unitPhaseSf, SECONDARY_FLUID))
-        
+        unit._methodHeatWf = self.config.lookupMethod(clsName, (geomWf, TRANSFER_HEAT, unitPhaseWf, WORKING_FLUID))
+        unit._methodHeatSf = self.config.lookupMethod(clsName, (geomSf, TRANSFER_HEAT, unitPhaseSf, SECONDARY_FLUID))
+        unit._methodFrictionWf = self.config.lookupMethod(clsName, (geomWf, TRANSFER_FRICTION, unitPhaseWf, WORKING_FLUID))
+        unit._methodFrictionSf = self.config.lookupMethod(clsName, (geomSf, TRANSFER_FRICTION, unitPhaseSf, SECONDARY_FLUID))
+        (<HxUnitPlate>unit)._resolveMethods()
+
+    cdef void _unitArraysExtra(self, HxUnitArrays arrays):
+        """Stores the frictional pressure drops of the units."""
+        cdef HxUnitPlate unit
+        cdef size_t i
+        for i in range(len(self._units)):
+            unit = self._units[i]
+            try:
+                arrays.dpFWf[i] = unit._dpFWf()
+                arrays.dpFSf[i] = unit._dpFSf()
+            except Exception:
+                pass
                     
     cpdef public unsigned int _NWf(self):
         """int: Number of secondary fluid flow channels. Setter may not be used.
@@ -241,8 +277,9 @@ config : Config, optional
         cdef double dp = 0
         cdef HxUnitPlate unit
         cdef size_t i
-        for i in range(len(self._units)):#unit in self._units:
-            unit = self._units[i]
+        cdef list _units = self.units()
+        for i in range(len(_units)):#unit in self._units:
+            unit = _units[i]
             dp += unit._dpFWf()
         return dp
 
@@ -251,8 +288,9 @@ config : Config, optional
         cdef double dp = 0
         cdef HxUnitPlate unit
         cdef size_t i
-        for i in range(len(self._units)):#unit in self._units:
-            unit = self._units[i]
+        cdef list _units = self.units()
+        for i in range(len(_units)):#unit in self._units:
+            unit = _units[i]
             #dp += unit._dpFSf()
             add = unit._dpFSf()
             dp += add
@@ -260,6 +298,66 @@ config : Config, optional
         #print("dpSf = ", dp)
         return dp
 
+    cpdef dict unitCorrelations(self, bint wf=True):
+        """dict of numpy.ndarray: Heat transfer coefficients "h" [W/m^2.K], Fanning friction factors "f" and frictional pressure drops "dpF" [Pa] of the working fluid channels of each unit, or of the secondary fluid channels if wf is False. The units sharing a correlation are evaluated together by its vectorised counterpart (see :meth:`getVectorised <mcycle.methods.heat_transfer.getVectorised>`), from properties averaged over each unit and evaluated in one pass by :meth:`flowProperties <mcycle.methods.heat_transfer.flowProperties>`. Units whose correlation has no vectorised counterpart are evaluated one by one.
+
+Parameters
+-----------
+wf : bool, optional
+    If True, the working fluid correlations are evaluated, else the secondary fluid correlations. Defaults to True.
+        """
+        cdef list units = self.units()
+        cdef HxUnitPlate unit
+        cdef unsigned char flowId = 0 if wf else 1
+        cdef Py_ssize_t i, n = len(units)
+        cdef unsigned int N = self._NWf() if wf else self._NSf()
+        cdef Geom geom = self.geomWf if wf else self.geomSf
+        cdef FlowState flowIn, flowOut
+        cdef str method
+        cdef list methodsHeat = [], methodsFriction = []
+        state = np.empty((7, n))  # pIn, pOut, TIn, TOut, hIn, hOut, xIn + xOut
+        L = np.empty(n)
+        m = np.empty(n)
+        for i in range(n):
+            unit = units[i]
+            flowIn = unit.flowsIn[flowId]
+            flowOut = unit.flowsOut[flowId]
+            state[:, i] = (flowIn.p(), flowOut.p(), flowIn.T(), flowOut.T(), flowIn.h(), flowOut.h(), flowIn.x() + flowOut.x())
+            L[i] = unit.L
+            m[i] = flowIn.m
+            if wf:
+                methodsHeat.append(unit._methodHeatWf)
+                methodsFriction.append(unit._methodFrictionWf)
+            else:
+                methodsHeat.append(unit._methodHeatSf)
+                methodsFriction.append(unit._methodFrictionSf)
+        pAvg = 0.5 * (state[0] + state[1])
+        cdef dict inputs = {PT_INPUTS: (pAvg, 0.5 * (state[2] + state[3])),
+                            PQ_INPUTS: (pAvg, 0.5 * state[6]),
+                            HmassP_INPUTS: (0.5 * (state[4] + state[5]), pAvg)}
+        cdef dict result = {"h": np.full(n, nan), "f": np.full(n, nan), "dpF": np.full(n, nan)}
+        for keys, methods in ((("h",), methodsHeat), (("f", "dpF"), methodsFriction)):
+            for method in set(methods):
+                idx = np.array([i for i in range(n) if methods[i] == method], dtype=np.intp)
+                vectorised = ht.getVectorised(method)
+                if vectorised is None:
+                    for i in idx:
+                        unit = units[i]
+                        if "h" in keys:
+                            result["h"][i] = unit._hWf() if wf else unit._hSf()
+                        else:
+                            result["f"][i] = unit._fWf() if wf else unit._fSf()
+                            result["dpF"][i] = unit._dpFWf() if wf else unit._dpFSf()
+                    continue
+                kernel, inputPair = vectorised
+                props = ht.flowProperties(self.flowsIn[flowId], inputPair, inputs[inputPair][0][idx], inputs[inputPair][1][idx])
+                props["m"] = m[idx]
+                props["dh"] = state[5][idx] - state[4][idx]
+                out = kernel(props, N, geom, L[idx], self.W)
+                for key in keys:
+                    result[key][idx] = out[key]
+        return result
+
     cpdef public double dpAccWf(self):
         """float: Acceleration pressure drop of the working fluid [Pa]."""
         cdef double G = self._mWf() / self._NWf() / (self.geomWf.areaPerWidth() * self.W)
@@ -359,28 +457,155 @@ config : Config, optional
                 massPerVol += self.coeffs_mass[i] * self.NWall**i
             return massPerVol * self.LPlate() * self.WPlate() * self.tWall
 
+    cdef double _diff_NPlate(self, unsigned int NPlate, double L, dict diffs) except *:
+        """Memoised size_L() - L for the given NPlate."""
+        if NPlate not in diffs:
+            self.update({'NWall': NPlate})
+            diffs[NPlate] = self.size_L() - L
+        return diffs[NPlate]
+
     cpdef public unsigned int size_NPlate(self) except 0:
-        """int: size for NPlate that requires L to be closest to self.L"""
-        cdef double diff
-        cdef unsigned int NPlate = int(self.sizeBounds[0])
-        cdef unsigned int NPlateMax = int(self.sizeBounds[1])
+        """int: size for NPlate that requires L to be closest to self.L. L(NPlate) is non-increasing, so the bracket given by sizeBounds is bisected; each sized NPlate is memoised so it is only sized once.
+
+If a previous call (or setSizeHint()) left a bracket in _brackets["NPlate"], the search starts from it and gallops outwards until it brackets the solution again, so re-sizing for nearby conditions (eg; between the outer iterations of Cycle.size()) only sizes a few NPlate."""
+        cdef unsigned int lower = int(self.sizeBounds[0])
+        cdef unsigned int upper = int(self.sizeBounds[1])
+        cdef unsigned int lo = lower
+        cdef unsigned int hi = upper
+        cdef unsigned int mid, NPlate, step
         cdef double L = self.L
-        cdef list diff_vals = [nan, nan]
-        while NPlate < NPlateMax:
-            self.update({'NWall':NPlate})
-            diff = self.size_L() - L
-            diff_vals = [diff_vals[1], diff]
-            if diff > 0:
-                NPlate += 1
+        cdef dict diffs = {}
+        cdef tuple last = self._brackets.get('NPlate')
+        if last is not None:
+            lo = min(max(<unsigned int>last[0], lower), upper)
+            hi = min(max(<unsigned int>last[1], lo), upper)
+            step = 1
+            while lo > lower and self._diff_NPlate(lo, L, diffs) <= 0:
+                hi = lo
+                lo = max(lower, lo - step) if lo > step else lower
+                step *= 2
+            step = 1
+            while hi < upper and self._diff_NPlate(hi, L, diffs) > 0:
+                lo = hi
+                hi = min(upper, hi + step)
+                step *= 2
+        if self._diff_NPlate(lo, L, diffs) <= 0:
+            NPlate = lo
+            self._brackets['NPlate'] = (lo, lo)
+        elif self._diff_NPlate(hi, L, diffs) > 0:
+            NPlate = hi
+            self._brackets['NPlate'] = (hi, hi)
+        else:
+            # invariant: diff(lo) > 0 >= diff(hi)
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if self._diff_NPlate(mid, L, diffs) > 0:
+                    lo = mid
+                else:
+                    hi = mid
+            if abs(diffs[lo]) < abs(diffs[hi]):
+                NPlate = lo
             else:
-                break
-        if abs(diff_vals[0]) < abs(diff_vals[1]):
-            self.update({'NWall':NPlate-1})
+                NPlate = hi
+            self._brackets['NPlate'] = (lo, hi)
+        if NPlate != self.NWall:
+            self.update({'NWall': NPlate})
             self.size_L()
-            return NPlate - 1
-        else:
-            return NPlate
+        return NPlate
         
+    cdef tuple _sweepDesign(self, list keys, tuple design):
+        """tuple: (mass, L, dpWf, dpSf) after updating keys to the values of design and sizing L; nan if the design cannot be sized."""
+        try:
+            self.update(dict(zip(keys, design)))
+            self.size_L()
+            return (self.mass(), self.L, self.dpWf(), self.dpSf())
+        except Exception:
+            return (nan, nan, nan, nan)
+
+    cpdef public dict sweep(self, dict grid):
+        """dict of numpy.ndarray: Size L for every combination of the values in grid, for the defined incoming and outgoing FlowStates, and return the "mass", "L", "dpWf" and "dpSf" of each design. Each array has one axis per key of grid, in order. Designs that cannot be sized are nan.
+
+The designs are evaluated on copies of the Hx, so it is not modified. Each copy is unitised once and its units are shared by all of its designs; only the geometry of the units changes between designs. If config.executor is set, the designs are split into chunks that are evaluated concurrently.
+
+Parameters
+-----------
+grid : dict
+    Values of each attribute to sweep, keyed as for update(), eg; {"NPlate": [21, 23, 25], "geomWf.b": [1e-3, 1.1e-3], "W": [0.095, 0.1]}. Attributes must not change the class of either geometry.
+        """
+        cdef list keys = list(grid.keys())
+        cdef list designs = list(itertools.product(*[grid[key] for key in keys]))
+        cdef tuple shape = tuple([len(grid[key]) for key in keys])
+        cdef list results = []
+        cdef list chunks, chunk
+        cdef size_t nChunks, i
+        if self.config.executor is None:
+            results = _sweepHxPlate(self, keys, designs)
+        else:
+            nChunks = max(1, min(len(designs), os.cpu_count() or 1))
+            chunks = [designs[i * len(designs) // nChunks:(i + 1) * len(designs) // nChunks] for i in range(nChunks)]
+            for chunk in self.config.executor.map(_sweepHxPlate, [self] * nChunks, [keys] * nChunks, chunks):
+                results.extend(chunk)
+        arr = np.array(results, dtype=float).reshape(shape + (4,))
+        return {"mass": arr[..., 0], "L": arr[..., 1], "dpWf": arr[..., 2], "dpSf": arr[..., 3]}
+
+    cdef tuple _runCondition(self, FlowState flowInWf, FlowState flowInSf):
+        """tuple: (flowOutWf, flowOutSf, Q, dpWf, dpSf) after updating the incoming FlowStates and running the Hx; None and nan if it cannot be run."""
+        try:
+            self.update({'flowInWf': flowInWf, 'flowInSf': flowInSf})
+            self.run()
+            return (self.flowsOut[0], self.flowsOut[1], self.Q(), self.dpWf(), self.dpSf())
+        except Exception:
+            return (None, None, nan, nan, nan)
+
+    cpdef public dict run_batch(self, flowsInWf, flowsInSf):
+        """dict of numpy.ndarray: Rate the Hx, as by :meth:`run`, for each pair of incoming working and secondary fluid FlowStates, and return the outgoing FlowStates "flowOutWf" and "flowOutSf" and the "Q", "dpWf" and "dpSf" of each condition, in the order given. Conditions that cannot be run are None or nan.
+
+The conditions are evaluated on a copy of the Hx, so it is not modified. They are rated in order of their pressures, enthalpies and mass flow rates so that each run() starts from the bracket of a neighbouring condition, stored in _brackets, and its units from the sizeUnits() solutions of the last. If config.executor is set, the ordered conditions are split into contiguous chunks that are evaluated concurrently.
+
+Parameters
+-----------
+flowsInWf : FlowState or list of FlowState
+    Incoming working fluid FlowStates. A single FlowState is used for every condition.
+flowsInSf : FlowState or list of FlowState
+    Incoming secondary fluid FlowStates. A single FlowState is used for every condition.
+        """
+        cdef list inWf, inSf, chunk, results = []
+        cdef dict ret
+        cdef size_t n, nChunks, i
+        inWf = [flowsInWf] if isinstance(flowsInWf, FlowState) else list(flowsInWf)
+        inSf = [flowsInSf] if isinstance(flowsInSf, FlowState) else list(flowsInSf)
+        n = max(len(inWf), len(inSf))
+        if len(inWf) == 1:
+            inWf = inWf * n
+        if len(inSf) == 1:
+            inSf = inSf * n
+        if len(inWf) != n or len(inSf) != n:
+            msg = "HxPlate.run_batch(): flowsInWf and flowsInSf must have the same length (given: {}, {})".format(len(inWf), len(inSf))
+            log("error", msg)
+            raise ValueError(msg)
+        # the last key is the primary key of the ordering
+        order = np.lexsort(([f.m for f in inSf], [f.h() for f in inSf], [f.p() for f in inSf],
+                            [f.m for f in inWf], [f.h() for f in inWf], [f.p() for f in inWf]))
+        inWf = [inWf[i] for i in order]
+        inSf = [inSf[i] for i in order]
+        if self.config.executor is None or n < 2:
+            results = _runBatchHxPlate(self, inWf, inSf)
+        else:
+            nChunks = max(1, min(n, os.cpu_count() or 1))
+            for chunk in self.config.executor.map(_runBatchHxPlate, [self] * nChunks,
+                                                  [inWf[i * n // nChunks:(i + 1) * n // nChunks] for i in range(nChunks)],
+                                                  [inSf[i * n // nChunks:(i + 1) * n // nChunks] for i in range(nChunks)]):
+                results.extend(chunk)
+        ret = {"flowOutWf": np.empty(n, dtype=object), "flowOutSf": np.empty(n, dtype=object),
+               "Q": np.empty(n), "dpWf": np.empty(n), "dpSf": np.empty(n)}
+        for i in range(n):
+            ret["flowOutWf"][order[i]] = results[i][0]
+            ret["flowOutSf"][order[i]] = results[i][1]
+            ret["Q"][order[i]] = results[i][2]
+            ret["dpWf"][order[i]] = results[i][3]
+            ret["dpSf"][order[i]] = results[i][4]
+        return ret
+
     cpdef public void size(self) except *:
         """Solves for the value of the nominated component attribute required to return the defined outgoing FlowState.
 
@@ -0,0 +1,21 @@
+from .hx_plate cimport HxPlate
+
+cdef class HxPlateSurrogate(HxPlate):
+    cpdef public dict surrogateBox
+    cpdef public double errorL
+    cdef tuple _surrogateKeys
+    cdef object _surrogateCoeffs
+    cdef dict _surrogateRef
+    cdef tuple _surrogateFluids
+    cdef tuple _surrogateInputs
+    cdef bint _surrogateInputsValid
+    cdef dict _surrogateConfig
+
+    cpdef public void update(self, dict kwargs)
+    cdef dict _surrogateConfigState(self)
+    cdef object _surrogateFeature(self, str key)
+    cdef dict _surrogateDesign(self, dict values)
+    cdef object _surrogateTerms(self, object X)
+    cdef object _surrogateFit(self, object X, object L)
+    cpdef public bint inDomain(self) except *
+    cpdef void train(self, dict box, unsigned int nSamples=*, double validation=*, unsigned int seed=*) except *
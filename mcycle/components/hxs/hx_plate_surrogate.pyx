@@ -0,0 +1,242 @@
+from .hx_plate cimport HxPlate
+from ...bases.abc cimport ABC
+from ...bases.abc import _canonical
+from ...bases.flowstate cimport FlowState
+from ..._constants cimport *
+from ...logger import log
+from math import nan, isnan
+import copy
+import numpy as np
+import os
+
+cdef tuple _flowKeys = ('pWf', 'hInWf', 'hOutWf', 'mWf', 'pSf', 'TInSf', 'mSf')
+# inputs not compared by inDomain(): the sized L, the flows (compared by _flowKeys), solver bounds and descriptions
+cdef tuple _inputsIgnored = ('L', 'flowInWf', 'flowInSf', 'flowOutWf', 'flowOutSf', 'sizeAttr', 'sizeBounds', 'sizeUnitsBounds', 'runBounds', 'runUnitsBounds', 'name', 'notes')
+cdef str msg
+
+
+def _sizeSamplesHxPlate(HxPlate hx, list designs):
+    """list of float: L sized by the full HxPlate model for a copy of hx updated with each design; nan if the design cannot be sized. Module level so it can be sent to a process pool."""
+    cdef list ret = []
+    hx = <HxPlate>hx.copy()
+    hx.config.executor = None
+    for design in designs:
+        try:
+            hx.update(design)
+            hx.unitise()
+            ret.append(HxPlate.size_L(hx))
+        except Exception:
+            ret.append(nan)
+    return ret
+
+
+def _canonicalExcept(value, tuple keys):
+    """Hashable description of value as by :func:`mcycle.bases.abc._canonical`, omitting the attributes of an ABC instance given by keys, which may be nested, eg; ('b', ) for a geometry or ('geomWf.b', ) for a Hx."""
+    if not keys or not isinstance(value, ABC):
+        return _canonical(value)
+    return (type(value).__name__, ) + tuple([
+        (i, _canonicalExcept(v, tuple([key.split('.', 1)[1] for key in keys if key.startswith(i + '.')])))
+        for i, v in (<ABC>value)._canonicalItems() if i not in keys])
+
+
+cdef class HxPlateSurrogate(HxPlate):
+    r"""HxPlate that, once trained, predicts the length sized by size_L() (and therefore by size() and size_NPlate()) from a regression model instead of sizing its units. The model is fitted by train() to HxPlate.size_L() sampled over a box of operating conditions and geometry; outside that box, or if any other operating condition, input or Config parameter has changed since training, the full HxPlate model is used.
+
+Only L is predicted: the units are not sized by the surrogate, so properties computed from the units, such as dpWf(), are not updated.
+
+Parameters are the same as for :meth:`HxPlate <mcycle.components.hxs.hx_plate.HxPlate>`. Copies are untrained.
+
+Attributes
+-----------
+surrogateBox : dict
+    Box of operating conditions and geometry the surrogate was trained over, see train(). None if untrained.
+errorL : float
+    Maximum relative error of the predicted L over the validation samples of train(). nan if untrained.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.surrogateBox = None
+        self.errorL = nan
+        self._surrogateInputsValid = False
+
+    cpdef public void update(self, dict kwargs):
+        """Update (multiple) variables using keyword arguments. Inputs other than the keys of surrogateBox and those ignored by inDomain() are compared with their values at training by the next inDomain()."""
+        cdef str key
+        HxPlate.update(self, kwargs)
+        for key in kwargs:
+            if key.split('.', 1)[0] not in _inputsIgnored and (self._surrogateKeys is None or key not in self._surrogateKeys):
+                self._surrogateInputsValid = False
+
+    cdef dict _surrogateConfigState(self):
+        """dict: Pickled state of the Config, except name, with nan values replaced by None so that equal states compare equal."""
+        return {k: None if isinstance(v, float) and isnan(v) else v for k, v in self.config.__reduce__()[2].items() if k != 'name'}
+
+    cdef object _surrogateFeature(self, str key):
+        """float or int: Current value of a key of surrogateBox."""
+        cdef FlowState flowInWf = self.flowsIn[0]
+        cdef FlowState flowInSf = self.flowsIn[1]
+        if key == 'pWf':
+            return flowInWf.p()
+        elif key == 'hInWf':
+            return flowInWf.h()
+        elif key == 'hOutWf':
+            return self.flowsOut[0].h()
+        elif key == 'mWf':
+            return flowInWf.m
+        elif key == 'pSf':
+            return flowInSf.p()
+        elif key == 'TInSf':
+            return flowInSf.T()
+        elif key == 'mSf':
+            return flowInSf.m
+        obj = self
+        for attr in key.split('.'):
+            obj = getattr(obj, attr)
+        return obj
+
+    cdef dict _surrogateDesign(self, dict values):
+        """dict: update() arguments for the operating conditions and geometry given by values, a dict of some of the keys of surrogateBox; the others are taken from the conditions at training. The outgoing secondary fluid is found from the energy balance."""
+        cdef dict design = {}
+        cdef dict flowValues = {}
+        cdef str key
+        cdef FlowState flowInWf, flowOutWf, flowInSf, flowOutSf
+        cdef double effWf = 1, effSf = 1
+        for key in _flowKeys:
+            flowValues[key] = values.get(key, self._surrogateRef[key])
+        for key in values:
+            if key not in _flowKeys:
+                design[key] = values[key]
+        flowInWf = self.flowsIn[0].copyUpdateState(HmassP_INPUTS, flowValues['hInWf'], flowValues['pWf'])
+        flowInWf.m = flowValues['mWf']
+        flowOutWf = flowInWf.copyUpdateState(HmassP_INPUTS, flowValues['hOutWf'], flowValues['pWf'])
+        flowInSf = self.flowsIn[1].copyUpdateState(PT_INPUTS, flowValues['pSf'], flowValues['TInSf'])
+        flowInSf.m = flowValues['mSf']
+        if flowInSf.T() > flowInWf.T():
+            effSf = self.efficiencyThermal
+        else:
+            effWf = self.efficiencyThermal
+        flowOutSf = flowInSf.copyUpdateState(
+            HmassP_INPUTS,
+            flowInSf.h() - flowInWf.m * effWf * (flowOutWf.h() - flowInWf.h()) / flowInSf.m / effSf,
+            flowValues['pSf'])
+        design['flowInWf'] = flowInWf
+        design['flowOutWf'] = flowOutWf
+        design['flowInSf'] = flowInSf
+        design['flowOutSf'] = flowOutSf
+        return design
+
+    cdef object _surrogateTerms(self, object X):
+        """numpy.ndarray: Terms of the quadratic regression model for each row of X, the values of the keys of surrogateBox."""
+        cdef size_t i, j, n = len(self._surrogateKeys)
+        cdef list terms
+        lo = np.array([self.surrogateBox[key][0] for key in self._surrogateKeys], dtype=float)
+        hi = np.array([self.surrogateBox[key][1] for key in self._surrogateKeys], dtype=float)
+        X = (2 * np.asarray(X, dtype=float) - lo - hi) / (hi - lo)
+        terms = [np.ones(len(X))]
+        for i in range(n):
+            terms.append(X[:, i])
+        for i in range(n):
+            for j in range(i, n):
+                terms.append(X[:, i] * X[:, j])
+        return np.stack(terms, axis=1)
+
+    cdef object _surrogateFit(self, object X, object L):
+        """numpy.ndarray: Least squares coefficients of the regression model of log(L) on the rows of X."""
+        return np.linalg.lstsq(self._surrogateTerms(X), np.log(L), rcond=None)[0]
+
+    cpdef public bint inDomain(self) except *:
+        """bool: True if the surrogate is trained, the current values of the keys of surrogateBox are within it and all other operating conditions, inputs (eg; the plate, geometries and ports, other than the keys of surrogateBox) and the Config are as they were at training. L, the solver bounds, name and notes are not compared. Inputs of the Hx are compared again only after they are changed by update(); changes made in place to its attributes, other than the Config, are not detected."""
+        cdef str key
+        cdef double value
+        if self.surrogateBox is None:
+            return False
+        if (self.flowsIn[0].fluid, self.flowsIn[1].fluid) != self._surrogateFluids:
+            return False
+        if not self._surrogateInputsValid:
+            if _canonicalExcept(self, self._surrogateKeys + _inputsIgnored) != self._surrogateInputs:
+                return False
+            self._surrogateInputsValid = True
+        if self._surrogateConfigState() != self._surrogateConfig:
+            return False
+        for key in _flowKeys:
+            if key not in self.surrogateBox and not abs(self._surrogateFeature(key) - self._surrogateRef[key]) <= self.config.tolRel * abs(self._surrogateRef[key]):
+                return False
+        for key in self._surrogateKeys:
+            value = self._surrogateFeature(key)
+            if not self.surrogateBox[key][0] <= value <= self.surrogateBox[key][1]:
+                return False
+        return True
+
+    cpdef void train(self, dict box, unsigned int nSamples=100, double validation=0.2, unsigned int seed=0) except *:
+        """Fit the regression model of L to HxPlate.size_L() sampled over box. The samples are a Latin hypercube over box and are sized concurrently if config.executor is set. The model is quadratic in the keys of box and is fitted to log(L); a fraction validation of the samples is first held out to estimate errorL, then the model is refitted to all samples.
+
+Parameters
+-----------
+box : dict
+    Ranges [min, max] of the operating conditions and geometry to train over. Keys may be attributes accepted by update(), eg; "NPlate", "W" or "geomWf.b", or the operating conditions "pWf", "hInWf", "hOutWf", "mWf", "pSf", "TInSf" and "mSf", which are the pressure, incoming and outgoing enthalpy and mass flow rate of the working fluid and the pressure, incoming temperature and mass flow rate of the secondary fluid. Operating conditions not in box are fixed at their current values. Integer attributes are sampled as integers.
+nSamples : int, optional
+    Number of samples. Defaults to 100.
+validation : float, optional
+    Fraction of the samples held out to estimate errorL. Defaults to 0.2.
+seed : int, optional
+    Seed of the random number generator used to draw the samples. Defaults to 0.
+        """
+        cdef list keys = list(box.keys())
+        cdef size_t nKeys = len(keys)
+        cdef size_t nTerms = (nKeys + 1) * (nKeys + 2) // 2
+        cdef size_t nValid, nVal, i, nChunks
+        cdef list designs, chunks, sized = []
+        cdef list isInt
+        cdef str key
+        self.surrogateBox = None
+        self._surrogateRef = {key: self._surrogateFeature(key) for key in _flowKeys}
+        self._surrogateFluids = (self.flowsIn[0].fluid, self.flowsIn[1].fluid)
+        rng = np.random.default_rng(seed)
+        U = (np.stack([rng.permutation(nSamples) for i in range(nKeys)], axis=1) + rng.random((nSamples, nKeys))) / nSamples
+        lo = np.array([box[key][0] for key in keys], dtype=float)
+        hi = np.array([box[key][1] for key in keys], dtype=float)
+        X = lo + U * (hi - lo)
+        isInt = [isinstance(self._surrogateFeature(key), int) for key in keys]
+        for i in range(nKeys):
+            if isInt[i]:
+                X[:, i] = np.round(X[:, i])
+        designs = [self._surrogateDesign({keys[i]: int(row[i]) if isInt[i] else row[i] for i in range(nKeys)}) for row in X.tolist()]
+        if self.config.executor is None:
+            sized = _sizeSamplesHxPlate(self, designs)
+        else:
+            nChunks = max(1, min(len(designs), os.cpu_count() or 1))
+            chunks = [designs[i * len(designs) // nChunks:(i + 1) * len(designs) // nChunks] for i in range(nChunks)]
+            for chunk in self.config.executor.map(_sizeSamplesHxPlate, [self] * nChunks, chunks):
+                sized.extend(chunk)
+        L = np.array(sized, dtype=float)
+        valid = np.isfinite(L) & (L > 0)
+        X, L = X[valid], L[valid]
+        nValid = len(L)
+        nVal = int(validation * nValid)
+        if nValid - nVal < nTerms:
+            msg = "HxPlateSurrogate.train(): {} of {} samples could be sized, at least {} are required to fit the model; increase nSamples or reduce box".format(nValid, nSamples, nTerms + nVal)
+            log("error", msg)
+            raise ValueError(msg)
+        self._surrogateKeys = tuple(keys)
+        self._surrogateInputs = _canonicalExcept(self, self._surrogateKeys + _inputsIgnored)
+        self._surrogateInputsValid = True
+        self._surrogateConfig = copy.deepcopy(self._surrogateConfigState())
+        self.surrogateBox = {key: [float(box[key][0]), float(box[key][1])] for key in keys}
+        if nVal > 0:
+            coeffs = self._surrogateFit(X[nVal:], L[nVal:])
+            self.errorL = float(np.max(np.abs(np.exp(self._surrogateTerms(X[:nVal]) @ coeffs) / L[:nVal] - 1)))
+        else:
+            self.errorL = nan
+        self._surrogateCoeffs = self._surrogateFit(X, L)
+
+    cpdef public double size_L(self) except *:
+        """float: Length of the Hx [m] predicted by the surrogate if inDomain(), otherwise sized by :meth:`HxPlate.size_L() <mcycle.components.hxs.hx_plate.HxPlate.size_L>`."""
+        cdef double L
+        if self.inDomain():
+            x = np.array([[self._surrogateFeature(key) for key in self._surrogateKeys]], dtype=float)
+            L = float(np.exp(self._surrogateTerms(x) @ self._surrogateCoeffs)[0])
+            self.L = L
+            return L
+        log("debug", "HxPlateSurrogate.size_L(): outside training domain, sized with HxPlate")
+        return super(HxPlateSurrogate, self).size_L()
@@ -3,6 +3,7 @@ from ...bases.config cimport Config
 from ...bases.flowstate cimport FlowState
 
 cdef class HxSimple(Component22):
+    cpdef public unsigned char sense
     cpdef public double U
     cpdef public double A
     cpdef public double efficiencyThermal
@@ -18,5 +19,9 @@ cdef class HxSimple(Component22):
     cpdef public double lmtd(self)
     cpdef public double Q_lmtd(self)
 
-    cdef double _f_runHxSimple(self, double value)
+    cdef double _f_runHxSimple(self, double value) except *
+    cdef void _updateFlowsOut(self, double Q) except *
+    cdef double _g_runAnalytic(self, double Q) except *
+    cdef tuple _runCondition(self, FlowState flowInWf, FlowState flowInSf)
+    cpdef public dict run_batch(self, flowsInWf, flowsInSf)
     
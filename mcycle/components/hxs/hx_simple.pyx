@@ -1,18 +1,121 @@
 from ...bases.component cimport Component22
 from ...bases.config cimport Config
+from ...bases.flowstate cimport FlowState
+from ...bases.solvers cimport Residual, brentq, secant
 from ... import defaults
 from ...logger import log
 from ..._constants cimport *
-from ...methods.heat_transfer cimport lmtd
+from ...methods.heat_transfer cimport lmtd, effectivenessNTU
+from ...utils.pinch import temperatures
 from warnings import warn
-from math import nan
+from math import nan, isnan, inf
 import numpy as np
 cimport numpy as np
-import scipy.optimize as opt
 
 cdef tuple _inputs = ('sense', 'U', 'A', 'efficiencyThermal', 'flowInWf', 'flowInSf', 'flowOutWf', 'flowOutSf', 'sizeAttr', 'runBounds', 'name', 'notes', 'config')
 cdef tuple _properties = ('mWf', 'mSf', 'Q()', 'dpWf()', 'dpSf()', 'isEvap()')
-        
+
+
+cdef class _RunResidual(Residual):
+    """Residual of HxSimple.run()."""
+    cdef HxSimple hx
+
+    def __init__(self, HxSimple hx):
+        self.hx = hx
+
+    cdef double f(self, double x) except *:
+        return self.hx._f_runHxSimple(x)
+
+
+cdef class _RunAnalyticResidual(Residual):
+    """Residual of the effectiveness-NTU solution of HxSimple.run()."""
+    cdef HxSimple hx
+
+    def __init__(self, HxSimple hx):
+        self.hx = hx
+
+    cdef double f(self, double x) except *:
+        return self.hx._g_runAnalytic(x) - x
+
+
+def _effectivenessNTU(NTU, CRatio, unsigned char flowSense):
+    """numpy.ndarray: Element-wise :meth:`effectivenessNTU <mcycle.methods.heat_transfer.effectivenessNTU>`."""
+    if flowSense == COUNTERFLOW:
+        e = np.exp(-NTU * (1 - CRatio))
+        return np.where(1 - CRatio < 1e-9, NTU / (1 + NTU), (1 - e) / (1 - CRatio * e))
+    elif flowSense == PARALLELFLOW:
+        return (1 - np.exp(-NTU * (1 + CRatio))) / (1 + CRatio)
+    else:
+        msg = "effectivenessNTU flowSense not valid/supported (given: {})".format(flowSense)
+        log("error", msg)
+        raise ValueError(msg)
+
+
+cdef class _BatchHxSimple:
+    """Incoming states of many conditions of an HxSimple, all of the same working and secondary fluids, rated together by the effectiveness-NTU method on numpy arrays."""
+    cdef FlowState flowWf, flowSf
+    cdef public object mWf, hInWf, pWf, TInWf, cpWf, mSf, hInSf, pSf, TInSf, cpSf
+    cdef public object s, effWf, effSf, dTIn
+    cdef public object hOutWf, hOutSf
+    cdef double UA
+    cdef unsigned char sense
+
+    def __init__(self, HxSimple hx, list flowsInWf, list flowsInSf):
+        self.flowWf = flowsInWf[0]
+        self.flowSf = flowsInSf[0]
+        self.mWf = np.array([f.m for f in flowsInWf])
+        self.hInWf = np.array([f.h() for f in flowsInWf])
+        self.pWf = np.array([f.p() for f in flowsInWf])
+        self.TInWf = np.array([f.T() for f in flowsInWf])
+        self.cpWf = np.array([f.cp() for f in flowsInWf])
+        self.mSf = np.array([f.m for f in flowsInSf])
+        self.hInSf = np.array([f.h() for f in flowsInSf])
+        self.pSf = np.array([f.p() for f in flowsInSf])
+        self.TInSf = np.array([f.T() for f in flowsInSf])
+        self.cpSf = np.array([f.cp() for f in flowsInSf])
+        isEvap = self.TInSf > self.TInWf
+        self.s = np.where(isEvap, 1., -1.)
+        self.effWf = np.where(isEvap, 1., hx.efficiencyThermal)
+        self.effSf = np.where(isEvap, hx.efficiencyThermal, 1.)
+        self.dTIn = np.abs(self.TInSf - self.TInWf)
+        self.UA = hx.U * hx.A
+        self.sense = hx.sense
+
+    def g(self, Q):
+        """numpy.ndarray: Element-wise :meth:`HxSimple._g_runAnalytic`."""
+        self.hOutWf = self.hInWf + self.s * Q / self.effWf / self.mWf
+        self.hOutSf = self.hInSf - self.s * Q / self.effSf / self.mSf
+        with np.errstate(divide='ignore', invalid='ignore'):
+            CWf = np.where(Q > 0, Q / np.abs(temperatures(self.flowWf, self.hOutWf, self.pWf) - self.TInWf),
+                           np.where(self.cpWf > 0, self.effWf * self.mWf * self.cpWf, inf))
+            CSf = np.where(Q > 0, Q / np.abs(temperatures(self.flowSf, self.hOutSf, self.pSf) - self.TInSf),
+                           np.where(self.cpSf > 0, self.effSf * self.mSf * self.cpSf, inf))
+            Cmin = np.minimum(CWf, CSf)
+            return _effectivenessNTU(self.UA / Cmin, Cmin / np.maximum(CWf, CSf), self.sense) * Cmin * self.dTIn
+
+    def solve(self, double xtol, double rtol, unsigned int maxIter=50):
+        """numpy.ndarray: Heat transfer rates [W] solving Q = g(Q) by the secant method, started from the effectiveness-NTU solution with the incoming heat capacities. Conditions that do not converge are nan."""
+        x0 = self.g(np.zeros(self.mWf.shape[0]))
+        x1 = self.g(x0)
+        q0 = x1 - x0
+        q1 = self.g(x1) - x1
+        done = (x0 == 0) | (q0 == 0)
+        x1 = np.where(done, x0, x1)
+        cdef unsigned int i
+        for i in range(maxIter):
+            if done.all():
+                break
+            with np.errstate(divide='ignore', invalid='ignore'):
+                x = np.where(q1 == q0, x1, x1 - q1 * (x1 - x0) / (q1 - q0))
+            converged = np.abs(x - x1) <= xtol + rtol * np.abs(x1)
+            x0, q0 = x1, q1
+            x1 = np.where(done, x1, x)
+            done = done | converged | ~np.isfinite(x1)
+            if not done.all():
+                q1 = self.g(x1) - x1
+        return np.where(done & np.isfinite(x1) & (x1 >= 0), x1, nan)
+
+
 cdef class HxSimple(Component22):
     r"""Characterises a simple heat exchanger with defined overall heat transfer coefficient.
 
@@ -60,12 +163,12 @@ config : Config, optional
                  str name="HxSimple instance",
                  str notes="No notes/model info.",
                  Config config=None):
+        super().__init__(flowInWf, flowInSf, flowOutWf, flowOutSf, None, sizeAttr,
+                          [nan, nan], [nan, nan], runBounds, [nan, nan], name, notes, config)
         self.sense = sense
         self.U = U
         self.A = A
         self.efficiencyThermal = efficiencyThermal
-        super().__init__(flowInWf, flowInSf, flowOutWf, flowOutSf, None, sizeAttr,
-                          [nan, nan], [nan, nan], runBounds, [nan, nan], name, notes, config)
         self._inputs = _inputs
         self._properties = _properties
                         
@@ -131,13 +234,13 @@ config : Config, optional
 
     cpdef public double lmtd(self):
         """float: Log-mean temperature difference [K]."""
-        return lmtd(self.flowsIn[0].T(), self.flowsOut[0].T(), self.flowsIn[1].T(), self.flowsOut[1].T(), self.flowConfig.sense)
+        return lmtd(self.flowsIn[0].T(), self.flowsOut[0].T(), self.flowsIn[1].T(), self.flowsOut[1].T(), self.sense)
     
     cpdef public double Q_lmtd(self):
         """float: Absolute value of heat transfer rate to the working fluid [W] as calculated using the log-mean temperature difference method."""
         return self.U * self.A * self.lmtd()
 
-    cdef double _f_runHxSimple(self, double value):
+    cdef double _f_runHxSimple(self, double value) except *:
         self.flowsOut[0] = self.flowsIn[0].copyUpdateState(HmassP_INPUTS, value, self.flowsIn[0].p())
         self.flowsOut[1] = self.flowsIn[1].copyUpdateState(
                 HmassP_INPUTS,
@@ -145,20 +248,142 @@ config : Config, optional
                 self.flowsIn[1].p())
         return abs(self.Q()) - self.Q_lmtd()
     
+    cdef void _updateFlowsOut(self, double Q) except *:
+        """Set the outgoing FlowStates for a heat transfer rate Q [W] from the hotter to the colder flow."""
+        cdef double sign = 1 if self.isEvap() else -1
+        self.flowsOut[0] = self.flowsIn[0].copyUpdateState(
+                HmassP_INPUTS,
+                self.flowsIn[0].h() + sign * Q / self._efficiencyFactorWf() / self._mWf(),
+                self.flowsIn[0].p())
+        self.flowsOut[1] = self.flowsIn[1].copyUpdateState(
+                HmassP_INPUTS,
+                self.flowsIn[1].h() - sign * Q / self._efficiencyFactorSf() / self._mSf(),
+                self.flowsIn[1].p())
+
+    cdef double _g_runAnalytic(self, double Q) except *:
+        """float: Heat transfer rate [W] given by the effectiveness-NTU method, using for each flow its mean heat capacity rate between the incoming FlowState and the outgoing FlowState of a heat transfer rate Q. Q = 0 uses the specific heat capacities of the incoming FlowStates."""
+        cdef double CWf, CSf, Cmin, Cmax, dT
+        if Q > 0:
+            self._updateFlowsOut(Q)
+            dT = abs(self.flowsOut[0].T() - self.flowsIn[0].T())
+            CWf = Q / dT if dT > 0 else inf
+            dT = abs(self.flowsOut[1].T() - self.flowsIn[1].T())
+            CSf = Q / dT if dT > 0 else inf
+        else:
+            CWf = self._efficiencyFactorWf() * self._mWf() * self.flowsIn[0].cp()
+            CSf = self._efficiencyFactorSf() * self._mSf() * self.flowsIn[1].cp()
+            if not CWf > 0:
+                CWf = inf
+            if not CSf > 0:
+                CSf = inf
+        Cmin = min(CWf, CSf)
+        Cmax = max(CWf, CSf)
+        return effectivenessNTU(self.U * self.A / Cmin, Cmin / Cmax, self.sense) * Cmin * abs(self.flowsIn[1].T() - self.flowsIn[0].T())
+
     cpdef public void run(self) except *:
-        cdef double tol, sol
+        """Compute the outgoing working fluid and secondary fluid FlowStates.
+
+With constant U and A, the heat transfer rate has the effectiveness-NTU solution for the mean heat capacity rates of the flows. It is first evaluated with the heat capacities of the incoming FlowStates, then refined by the secant method on the mean heat capacities between the incoming and outgoing FlowStates, at which it satisfies the log-mean temperature difference equation exactly. If the refinement fails and runBounds is set, the outgoing working fluid enthalpy is solved for within runBounds instead.
+        """
+        cdef double Q0, sol
+        try:
+            Q0 = self._g_runAnalytic(0)
+            if Q0 > 0:
+                sol = secant(_RunAnalyticResidual(self), Q0, nan, (), self.config.tolAbs, self.config.tolRel)
+                if not sol >= 0:
+                    raise ValueError("HxSimple.run(): found negative heat transfer rate (Q={})".format(sol))
+            else:
+                sol = 0
+            self._updateFlowsOut(sol)
+            return
+        except Exception as exc:
+            if isnan(self.runBounds[0]) or isnan(self.runBounds[1]):
+                msg = "HxSimple.run(): error raised"
+                log('error', msg, exc)
+                raise exc
         try:
-            tol = self.config.tolAbs + self.config.tolRel * self.flowsIn[0].h()
-            sol = opt.brentq(
-                        self._f_runHxSimple,
-                        *self.runBounds,
-                        rtol=self.config.tolRel,
-                        xtol=self.config.tolAbs)
+            sol = brentq(
+                        _RunResidual(self),
+                        self.runBounds[0],
+                        self.runBounds[1],
+                        (),
+                        self.config.tolAbs,
+                        self.config.tolRel)
+            self._f_runHxSimple(sol)
         except Exception as exc:
             msg = "HxSimple.run(): error raised"
             log('error', msg, exc)
             raise exc
-                           
+
+    cdef tuple _runCondition(self, FlowState flowInWf, FlowState flowInSf):
+        """tuple: (flowOutWf, flowOutSf, Q) after updating the incoming FlowStates and running the Hx; None and nan if it cannot be run."""
+        try:
+            self.update({'flowInWf': flowInWf, 'flowInSf': flowInSf})
+            self.run()
+            return (self.flowsOut[0], self.flowsOut[1], self.Q())
+        except Exception:
+            return (None, None, nan)
+
+    cpdef public dict run_batch(self, flowsInWf, flowsInSf):
+        """dict of numpy.ndarray: Rate the Hx, as by :meth:`run`, for each pair of incoming working and secondary fluid FlowStates, and return the outgoing FlowStates "flowOutWf" and "flowOutSf" and the "Q" of each condition, in the order given. Conditions that cannot be run are None or nan.
+
+The conditions whose fluids are those of the first are solved together: the effectiveness-NTU solution and its secant refinement are evaluated on numpy arrays, with one vectorised CoolProp call per flow per iteration. Any other conditions, and any that fail to converge, are run one at a time on a copy of the Hx, so it is not modified.
+
+Parameters
+-----------
+flowsInWf : FlowState or list of FlowState
+    Incoming working fluid FlowStates. A single FlowState is used for every condition.
+flowsInSf : FlowState or list of FlowState
+    Incoming secondary fluid FlowStates. A single FlowState is used for every condition.
+        """
+        cdef list inWf, inSf, batch
+        cdef dict ret
+        cdef size_t n, i, j
+        cdef _BatchHxSimple solver
+        cdef HxSimple hx = None
+        cdef tuple result
+        inWf = [flowsInWf] if isinstance(flowsInWf, FlowState) else list(flowsInWf)
+        inSf = [flowsInSf] if isinstance(flowsInSf, FlowState) else list(flowsInSf)
+        n = max(len(inWf), len(inSf))
+        if len(inWf) == 1:
+            inWf = inWf * n
+        if len(inSf) == 1:
+            inSf = inSf * n
+        if len(inWf) != n or len(inSf) != n:
+            msg = "HxSimple.run_batch(): flowsInWf and flowsInSf must have the same length (given: {}, {})".format(len(inWf), len(inSf))
+            log("error", msg)
+            raise ValueError(msg)
+        ret = {"flowOutWf": np.empty(n, dtype=object), "flowOutSf": np.empty(n, dtype=object), "Q": np.full(n, nan)}
+        if n == 0:
+            return ret
+        batch = [i for i in range(n) if type(inWf[i]) is type(inWf[0]) and inWf[i].fluid == inWf[0].fluid and inWf[i].eos == inWf[0].eos
+                 and type(inSf[i]) is type(inSf[0]) and inSf[i].fluid == inSf[0].fluid and inSf[i].eos == inSf[0].eos]
+        solver = _BatchHxSimple(self, [inWf[i] for i in batch], [inSf[i] for i in batch])
+        try:
+            Q = solver.solve(self.config.tolAbs, self.config.tolRel)
+        except Exception:
+            Q = np.full(len(batch), nan)
+        for j in range(len(batch)):
+            if Q[j] >= 0:
+                i = batch[j]
+                try:
+                    ret["flowOutWf"][i] = inWf[i].copyUpdateState(
+                        HmassP_INPUTS, solver.hInWf[j] + solver.s[j] * Q[j] / solver.effWf[j] / solver.mWf[j], solver.pWf[j])
+                    ret["flowOutSf"][i] = inSf[i].copyUpdateState(
+                        HmassP_INPUTS, solver.hInSf[j] - solver.s[j] * Q[j] / solver.effSf[j] / solver.mSf[j], solver.pSf[j])
+                    ret["Q"][i] = solver.s[j] * Q[j]
+                except Exception:
+                    ret["flowOutWf"][i] = None
+        for i in range(n):
+            if ret["flowOutWf"][i] is None or ret["flowOutSf"][i] is None:
+                if hx is None:
+                    hx = <HxSimple>self.copy()
+                result = hx._runCondition(inWf[i], inSf[i])
+                ret["flowOutWf"][i] = result[0]
+                ret["flowOutSf"][i] = result[1]
+                ret["Q"][i] = result[2]
+        return ret
+
     cpdef public void size(self) except *:
         """Solves for the value of the nominated component attribute required to return the defined outgoing FlowState.
         """
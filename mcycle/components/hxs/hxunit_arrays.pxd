@@ -0,0 +1,27 @@
+cimport numpy as np
+
+cdef class HxUnitArrays:
+    cpdef public unsigned int N
+    cpdef public double pWf
+    cpdef public double pSf
+    cpdef public double mWf
+    cpdef public double mSf
+    cpdef public np.ndarray hNodesWf
+    cpdef public np.ndarray hNodesSf
+    cpdef public np.ndarray TNodesWf
+    cpdef public np.ndarray TNodesSf
+    cpdef public np.ndarray unitPhaseWf
+    cpdef public np.ndarray unitPhaseSf
+    cpdef public np.ndarray hWf
+    cpdef public np.ndarray hSf
+    cpdef public np.ndarray RWf
+    cpdef public np.ndarray RSf
+    cpdef public np.ndarray U
+    cpdef public np.ndarray A
+    cpdef public np.ndarray Q
+    cpdef public np.ndarray dpFWf
+    cpdef public np.ndarray dpFSf
+    cpdef public np.ndarray sizeUnitsLast
+
+    cpdef public HxUnitArrays copy(self)
+    cpdef public size_t nbytes(self)
@@ -0,0 +1,92 @@
+from math import nan
+import numpy as np
+cimport numpy as np
+
+
+cdef tuple _arrays = ('hNodesWf', 'hNodesSf', 'TNodesWf', 'TNodesSf', 'unitPhaseWf', 'unitPhaseSf', 'hWf', 'hSf', 'RWf', 'RSf', 'U', 'A', 'Q', 'dpFWf', 'dpFSf', 'sizeUnitsLast')
+
+
+cdef class HxUnitArrays:
+    """Compact, array-backed storage of the HxUnits of a heat exchanger, built by :meth:`HxBasic.compactUnits() <mcycle.components.hxs.hx_basic.HxBasic.compactUnits>`. The discretisation is stored as contiguous arrays instead of one HxUnit and four FlowStates per unit, from which the units are materialised again on demand by :meth:`HxBasic.units() <mcycle.components.hxs.hx_basic.HxBasic.units>`.
+
+Units are stored in the direction of the working fluid flow. Node i is the working fluid inlet of unit i and node N is the outlet of the last unit; the secondary fluid node i is at the same end of unit i as the working fluid node. Per-unit quantities that could not be evaluated are nan.
+
+Parameters
+----------
+N : int, optional
+    Number of units. Defaults to 0.
+
+Attributes
+-----------
+pWf, pSf : float
+    Pressures of the working and secondary fluids [Pa].
+mWf, mSf : float
+    Mass flow rates of the working and secondary fluids [kg/s].
+hNodesWf, hNodesSf : ndarray, len=N+1
+    Specific enthalpies of the working and secondary fluids at the nodes [J/kg].
+TNodesWf, TNodesSf : ndarray, len=N+1
+    Temperatures of the working and secondary fluids at the nodes [K].
+unitPhaseWf, unitPhaseSf : ndarray of uint8, len=N
+    Unit phases of the working and secondary fluids.
+hWf, hSf : ndarray, len=N
+    Heat transfer coefficients of the working and secondary fluids [W/m^2.K].
+RWf, RSf : ndarray, len=N
+    Convective thermal resistances of the working and secondary fluids per unit area [m^2.K/W], the parts of 1/U due to hWf and hSf.
+U : ndarray, len=N
+    Overall heat transfer coefficients [W/m^2.K].
+A : ndarray, len=N
+    Heat transfer areas [m^2].
+Q : ndarray, len=N
+    Heat transfer to the working fluid [W].
+dpFWf, dpFSf : ndarray, len=N
+    Frictional pressure drops of the working and secondary fluids [Pa], if computed by the units.
+sizeUnitsLast : ndarray, len=N
+    Last solutions of sizeUnits(), kept as warm starts.
+    """
+
+    def __init__(self, unsigned int N=0):
+        self.N = N
+        self.pWf = nan
+        self.pSf = nan
+        self.mWf = nan
+        self.mSf = nan
+        self.hNodesWf = np.full(N + 1, nan)
+        self.hNodesSf = np.full(N + 1, nan)
+        self.TNodesWf = np.full(N + 1, nan)
+        self.TNodesSf = np.full(N + 1, nan)
+        self.unitPhaseWf = np.zeros(N, dtype=np.uint8)
+        self.unitPhaseSf = np.zeros(N, dtype=np.uint8)
+        self.hWf = np.full(N, nan)
+        self.hSf = np.full(N, nan)
+        self.RWf = np.full(N, nan)
+        self.RSf = np.full(N, nan)
+        self.U = np.full(N, nan)
+        self.A = np.full(N, nan)
+        self.Q = np.full(N, nan)
+        self.dpFWf = np.full(N, nan)
+        self.dpFSf = np.full(N, nan)
+        self.sizeUnitsLast = np.full(N, nan)
+
+    def __len__(self):
+        return self.N
+
+    cpdef public HxUnitArrays copy(self):
+        """HxUnitArrays: Copy of the arrays."""
+        cdef HxUnitArrays copy = HxUnitArrays.__new__(HxUnitArrays)
+        cdef str key
+        copy.N = self.N
+        copy.pWf = self.pWf
+        copy.pSf = self.pSf
+        copy.mWf = self.mWf
+        copy.mSf = self.mSf
+        for key in _arrays:
+            setattr(copy, key, getattr(self, key).copy())
+        return copy
+
+    cpdef public size_t nbytes(self):
+        """int: Memory used by the arrays [bytes]."""
+        cdef size_t n = 0
+        cdef str key
+        for key in _arrays:
+            n += getattr(self, key).nbytes
+        return n
@@ -26,6 +26,7 @@ cdef class HxUnitBasic(Component22):
     cpdef public str _methodHeatSf
     cpdef public str _methodFrictionWf
     cpdef public str _methodFrictionSf
+    cpdef public double _sizeUnitsLast
 
     cpdef public bint isEvap(self)
     cpdef public double _A(self)
@@ -43,9 +44,15 @@ cdef class HxUnitBasic(Component22):
     cpdef public double QSf(self)
     cpdef public double Q(self)
     cdef public double Q_lmtd(self)
+    cdef double _RWf(self) except *
+    cdef double _RSf(self) except *
     cpdef public double U(self)
     cpdef public double lmtd(self)
     cpdef public double mass(self)
+    cdef double _CWf(self, bint inlet) except *
+    cdef double _CSf(self, bint inlet) except *
+    cdef double _runNTU(self, bint inlet) except *
 
-    cdef double _f_sizeHxUnitBasic(self, double value, str attr)
+    cdef void _setAttr(self, str attr, double value) except *
+    cdef double _f_sizeHxUnitBasic(self, double value, str attr) except *
     
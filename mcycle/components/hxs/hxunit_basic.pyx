@@ -1,18 +1,33 @@
+from ...bases.abc cimport ABC
 from ...bases.component cimport Component22
 from ...bases.config cimport Config
 from ...bases.flowstate cimport FlowState
 from ...bases.solidmaterial cimport SolidMaterial
+from ...bases.solvers cimport Residual, brentq
 from ..._constants cimport *
-from ...methods.heat_transfer cimport lmtd
+from ...methods.heat_transfer cimport lmtd, effectivenessNTU
 from ...logger import log
 from .flowconfig cimport HxFlowConfig
 from warnings import warn
-from math import nan
+from math import nan, inf, isnan, isinf
 import numpy as np
-import scipy.optimize as opt
 
 cdef tuple _inputs = ('flowConfig', 'NWf', 'NSf', 'NWall', 'hWf', 'hSf', 'RfWf', 'RfSf', 'wall', 'tWall', 'A', 'ARatioWf', 'ARatioSf', 'ARatioWall', 'efficiencyThermal', 'flowInWf', 'flowInSf', 'flowOutWf', 'flowOutSf', 'sizeAttr', 'sizeBounds', 'name', 'notes', 'config')
 cdef tuple _properties = ('mWf', 'mSf', 'Q()', 'dpWf()', 'dpSf()', 'isEvap()')
+
+
+cdef class _SizeUnitsResidual(Residual):
+    """Residual of HxUnitBasic.sizeUnits()."""
+    cdef HxUnitBasic unit
+    cdef str attr
+
+    def __init__(self, HxUnitBasic unit, str attr):
+        self.unit = unit
+        self.attr = attr
+
+    cdef double f(self, double x) except *:
+        return self.unit._f_sizeHxUnitBasic(x, self.attr)
+
         
 cdef class HxUnitBasic(Component22):
     r"""Characterises a basic heat exchanger unit consisting of working fluid and secondary fluid flows separated by a solid wall with single-phase or multi-phase working fluid but only single-phase secondary fluid.
@@ -118,7 +133,27 @@ notes : string, optional
         self._methodHeatSf = ''
         self._methodFrictionWf = ''
         self._methodFrictionSf = ''
+        self._sizeUnitsLast = nan
+
+    def __reduce__(self):
+        """Pickle support: also carries the unit phases and methods assigned by the parent Hx in unitise() and the last solution of sizeUnits()."""
+        return (self.__class__, self._inputValues(), {'_unitPhaseWf': self._unitPhaseWf, '_unitPhaseSf': self._unitPhaseSf, '_methodHeatWf': self._methodHeatWf, '_methodHeatSf': self._methodHeatSf, '_methodFrictionWf': self._methodFrictionWf, '_methodFrictionSf': self._methodFrictionSf, '_sizeUnitsLast': self._sizeUnitsLast})
 
+    def __setstate__(self, dict state):
+        self._unitPhaseWf = state['_unitPhaseWf']
+        self._unitPhaseSf = state['_unitPhaseSf']
+        self._methodHeatWf = state['_methodHeatWf']
+        self._methodHeatSf = state['_methodHeatSf']
+        self._methodFrictionWf = state['_methodFrictionWf']
+        self._methodFrictionSf = state['_methodFrictionSf']
+        self._sizeUnitsLast = state['_sizeUnitsLast']
+
+    cpdef public ABC copy(self):
+        """Return a new copy of the HxUnit, including its unit phases and methods assigned by the parent Hx in unitise(), its last solution of sizeUnits() and its brackets. Overrides :meth:`Component.copy() <mcycle.bases.component.Component.copy>`."""
+        cdef HxUnitBasic copy = super(HxUnitBasic, self).copy()
+        copy.__setstate__(self.__reduce__()[2])
+        copy._brackets = dict(self._brackets)
+        return copy
     
     cpdef public double _A(self):
         return self.A
@@ -314,10 +349,18 @@ notes : string, optional
     cpdef public unsigned  int _NSf(self):
         return self.NSf
 
+    cdef double _RWf(self) except *:
+        """float: Convective thermal resistance of the working fluid per unit area [m^2.K/W]."""
+        return 1 / self._hWf() / self.ARatioWf / self._NWf()
+
+    cdef double _RSf(self) except *:
+        """float: Convective thermal resistance of the secondary fluid per unit area [m^2.K/W]."""
+        return 1 / self._hSf() / self.ARatioSf / self._NSf()
+
     cpdef public double U(self):
         """float: Overall heat transfer coefficient [W/m^2.K]; heat transfer coefficients of each flow channel and wall, summed in series."""
-        cdef double RWf = 1 / self._hWf() / self.ARatioWf / self._NWf() + self.RfWf / self.ARatioWf / self._NWf()
-        cdef double RSf = 1 / self._hSf() / self.ARatioSf / self._NSf() + self.RfSf / self.ARatioSf / self._NSf()
+        cdef double RWf = self._RWf() + self.RfWf / self.ARatioWf / self._NWf()
+        cdef double RSf = self._RSf() + self.RfSf / self.ARatioSf / self._NSf()
         cdef double RWall = self.tWall / self.wall.k() / self.ARatioWall / self.NWall
         return (RWf + RSf + RWall)**-1
 
@@ -333,22 +376,53 @@ notes : string, optional
         """float: Estimate of mass [Kg], based purely on wall properties."""
         return self._A() * self.ARatioWall * self.tWall * self.wall.rho * self.NWall
 
-    cpdef public void run(self):
-        """Run the HX from the incoming FlowState, using the epsilon-NTU method to produce an initial solution estimate."""
-        # initial guess from e-NTU method
-        cdef double eps = 0.8
-        cdef double Cmin = min(self.flowsIn[0].cp() * self._mWf(), self.flowsIn[1].cp() * self._mSf())
-        cdef double q = eps * Cmin * (self.flowsIn[1].T() - self.flowsIn[0].T()) * self.efficiencyThermal
-        self.flowsOut[0] = self.flowsIn[0].copyUpdateState(
-            HmassP_INPUTS, self.flowsIn[0].h() + q / self._mWf(), self.flowsIn[0].p())
-        self.flowsOut[1] = self.flowsIn[1].copyUpdateState(
-            HmassP_INPUTS, self.flowsIn[1].h() - self._mWf() * self._efficiencyFactorWf() *
-            (self.flowsOut[0].h() - self.flowsIn[0].h()
-             ) / self._mSf() / self._efficiencyFactorSf(), self.flowsIn[1].p())
-        cdef double diff = abs(self.Q() - self.Q_lmtd()) / self.Q()
+    cdef double _CWf(self, bint inlet) except *:
+        """float: Effective heat capacity rate of the working fluid [W/K], from cp of the incoming FlowState if inlet, else from its change in enthalpy and temperature across the unit; inf if isothermal."""
+        cdef double dT
+        if inlet:
+            if self.flowsIn[0].phase() == PHASE_TWOPHASE:
+                return inf
+            return self._mWf() * self._efficiencyFactorWf() * self.flowsIn[0].cp()
+        dT = self.flowsOut[0].T() - self.flowsIn[0].T()
+        if abs(dT) < self.config.tolAbs:
+            return inf
+        return self._mWf() * self._efficiencyFactorWf() * (self.flowsOut[0].h() - self.flowsIn[0].h()) / dT
+
+    cdef double _CSf(self, bint inlet) except *:
+        """float: Effective heat capacity rate of the secondary fluid [W/K], from cp of the incoming FlowState if inlet, else from its change in enthalpy and temperature across the unit; inf if isothermal."""
+        cdef double dT
+        if inlet:
+            if self.flowsIn[1].phase() == PHASE_TWOPHASE:
+                return inf
+            return self._mSf() * self._efficiencyFactorSf() * self.flowsIn[1].cp()
+        dT = self.flowsOut[1].T() - self.flowsIn[1].T()
+        if abs(dT) < self.config.tolAbs:
+            return inf
+        return self._mSf() * self._efficiencyFactorSf() * (self.flowsOut[1].h() - self.flowsIn[1].h()) / dT
+
+    cdef double _runNTU(self, bint inlet) except *:
+        """float: Heat transfer to the working fluid [W] by the epsilon-NTU method, evaluating U() and the heat capacity rates from the current FlowStates (see _CWf()); nan if the method is not applicable."""
+        cdef double CWf = self._CWf(inlet)
+        cdef double CSf = self._CSf(inlet)
+        cdef double Cmin = min(CWf, CSf)
+        cdef double Cmax = max(CWf, CSf)
+        if isinf(Cmin) or not Cmin > 0 or self.flowConfig.sense not in (COUNTERFLOW, PARALLELFLOW):
+            return nan
+        return effectivenessNTU(self.U() * self._A() / Cmin, Cmin / Cmax, self.flowConfig.sense) * Cmin * (self.flowsIn[1].T() - self.flowsIn[0].T())
+
+    cpdef public void run(self) except *:
+        """Run the HX from the incoming FlowState using the epsilon-NTU method for flowConfig.sense. The first step evaluates the heat capacity rates at the incoming FlowStates; each further step uses the effective heat capacity rates and U() of the previous outgoing FlowStates, so it typically converges in two or three steps. If the epsilon-NTU method is not applicable, the outgoing FlowStates are instead iterated on Q_lmtd()."""
+        cdef double q, diff
         cdef int count = 0
-        while diff > self.config._tolRel_h:
-            q = self.Q_lmtd()
+        cdef bint lmtdMethod = False
+        self.flowsOut[0] = self.flowsIn[0]
+        self.flowsOut[1] = self.flowsIn[1]
+        q = self._runNTU(True)
+        if isnan(q):
+            # estimate from eps = 0.8, then iterate on Q_lmtd()
+            lmtdMethod = True
+            q = 0.8 * min(self.flowsIn[0].cp() * self._mWf(), self.flowsIn[1].cp() * self._mSf()) * (self.flowsIn[1].T() - self.flowsIn[0].T()) * self.efficiencyThermal
+        while True:
             self.flowsOut[0] = self.flowsIn[0].copyUpdateState(
                 HmassP_INPUTS,
                 self.flowsIn[0].h() + q / self._efficiencyFactorWf() / self._mWf(),
@@ -357,18 +431,30 @@ notes : string, optional
                 HmassP_INPUTS,
                 self.flowsIn[1].h() - q / self._efficiencyFactorSf() / self._mSf(),
                 self.flowsIn[1].p())
-            diff = abs(self.Q() - q) / self.Q()
-
+            if not lmtdMethod:
+                q = self._runNTU(False)
+                if isnan(q):
+                    lmtdMethod = True
+            if lmtdMethod:
+                q = self.Q_lmtd()
+            diff = abs(self.Q() - q) / abs(self.Q())
+            if diff <= self.config._tolRel_h:
+                break
             count += 1
             if count > self.config.maxIterComponent:
                 raise StopIteration(
                     """{} iterations without {} converging: diff={}>tol={}""".
                     format(self.config.maxIterComponent, "h", diff,
                            self.config._tolRel_h))
-        #return self.flowsOut[0]
 
-    cdef double _f_sizeHxUnitBasic(self, double value, str attr):
-        self.update({attr: value})
+    cdef void _setAttr(self, str attr, double value) except *:
+        if attr == 'A':
+            self.A = value
+        else:
+            self.update({attr: value})
+
+    cdef double _f_sizeHxUnitBasic(self, double value, str attr) except *:
+        self._setAttr(attr, value)
         return abs(self.Q()) - self.Q_lmtd()
                 
     cpdef public void sizeUnits(self) except *:
@@ -391,13 +477,13 @@ bounds : float or list of float, optional
                 #return self.A
             else:
                 tol = self.config.tolAbs + self.config.tolRel * self.Q()
-                sizedValue = opt.brentq(
-                        self._f_sizeHxUnitBasic,
+                sizedValue = brentq(
+                        _SizeUnitsResidual(self, attr),
                         bounds[0],
                         bounds[1],
-                        args=(attr),
-                        rtol=self.config.tolRel,
-                        xtol=self.config.tolAbs)
+                        (),
+                        self.config.tolAbs,
+                        self.config.tolRel)
                 self.update({attr:sizedValue})
                 #return sizedValue
         except AssertionError as err:
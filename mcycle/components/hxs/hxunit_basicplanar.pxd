@@ -6,4 +6,5 @@ cdef class HxUnitBasicPlanar(HxUnitBasic):
     cpdef public double L
     cpdef public double W
     cpdef public double _A(self)
+    cdef void _setAttr(self, str attr, double value) except *
     
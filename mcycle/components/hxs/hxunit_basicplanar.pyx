@@ -104,6 +104,14 @@ config : Config, optional
     cpdef public double _A(self):
         return self.L * self.W
 
+    cdef void _setAttr(self, str attr, double value) except *:
+        if attr == 'L':
+            self.L = value
+        elif attr == 'W':
+            self.W = value
+        else:
+            self.update({attr: value})
+
     cpdef public void sizeUnits(self) except *:
         """Solves for the value of the nominated component attribute required to return the defined outgoing FlowState.
 
@@ -1,4 +1,5 @@
 from ...bases.geom cimport Geom
+from ...methods.heat_transfer cimport HtMethod
 from .hxunit_basicplanar cimport HxUnitBasicPlanar
 
 cdef class HxUnitPlate(HxUnitBasicPlanar):
@@ -10,13 +11,22 @@ cdef class HxUnitPlate(HxUnitBasicPlanar):
     cpdef public double _fSf(self)
     cpdef public double _dpFWf(self)
     cpdef public double _dpFSf(self)
+    cdef double _RWf(self) except *
+    cdef double _RSf(self) except *
     cpdef public double U(self)
     cpdef public Geom geomWf
     cpdef public Geom geomSf
+    cdef HtMethod _htMethodHeatWf
+    cdef HtMethod _htMethodHeatSf
+    cdef HtMethod _htMethodFrictionWf
+    cdef HtMethod _htMethodFrictionSf
+
+    cdef void _resolveMethods(self)
     
     cdef double Re(self, unsigned int flowId=*)
     cpdef public double ReSf(self)
     cpdef public double ReWf(self)
 
-    cpdef double _f_sizeUnitsHxUnitPlate(self, double value, str attr)
+    cpdef double _f_sizeUnitsHxUnitPlate(self, double value, str attr) except *
+    cdef double _sizeUnitsWarm(self, str attr, double[2] bounds) except *
     
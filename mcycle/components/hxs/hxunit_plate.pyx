@@ -2,20 +2,38 @@ from ...bases.config cimport Config
 from ...bases.flowstate cimport FlowState
 from ...bases.geom cimport Geom
 from ...bases.solidmaterial cimport SolidMaterial
+from ...bases.solvers cimport Residual, secant, find_root
 from ..._constants cimport *
 from ...methods import heat_transfer as ht
+from ...methods.heat_transfer cimport getMethod
 from ...geometries.geom_hxplate cimport GeomHxPlateChevron, GeomHxPlateFinOffset, GeomHxPlateFinStraight, GeomHxPlateSmooth
 from .hxunit_basicplanar cimport HxUnitBasicPlanar
 from .flowconfig cimport HxFlowConfig
-from warnings import warn
-from math import nan
+from math import nan, inf, isnan
 import CoolProp as CP
 import numpy as np
-import scipy.optimize as opt
 
 cdef str method
+cdef double _warmStep = 0.01
 cdef tuple _inputs = ('flowConfig', 'NPlate', 'RfWf', 'RfSf', 'plate', 'tPlate', 'geomWf', 'geomSf', 'L', 'W', 'efficiencyThermal', 'flowInWf', 'flowInSf', 'flowOutWf', 'flowOutSf', 'sizeAttr', 'sizeBounds', 'name', 'notes', 'config')
 cdef tuple _properties = ('mWf', 'mSf', 'Q()', 'U()', 'A()', 'dpWf()', 'dpSf()', 'isEvap()')
+cdef tuple _cacheDpF = ('L', 'W', 'NWall', 'geomWf', 'geomSf', 'flowConfig', 'config')
+cdef dict _cacheInputs = {'_dpFWf': ('flowInWf', 'flowOutWf', '_methodFrictionWf') + _cacheDpF,
+                          '_dpFSf': ('flowInSf', 'flowOutSf', '_methodFrictionSf') + _cacheDpF}
+
+
+cdef class _SizeUnitsResidual(Residual):
+    """Residual of HxUnitPlate.sizeUnits()."""
+    cdef HxUnitPlate unit
+    cdef str attr
+
+    def __init__(self, HxUnitPlate unit, str attr):
+        self.unit = unit
+        self.attr = attr
+
+    cdef double f(self, double x) except *:
+        return self.unit._f_sizeUnitsHxUnitPlate(x, self.attr)
+
 
 cdef class HxUnitPlate(HxUnitBasicPlanar):
     r"""Characterises a basic plate heat exchanger unit consisting of alternating working fluid and secondary fluid flows separated by a solid wall with single-phase or multi-phase working fluid but only single-phase secondary fluid.
@@ -93,7 +111,19 @@ config : Config, optional
         self.geomSf = geomSf
         self._inputs = _inputs
         self._properties = _properties
+        self._cacheInputs = _cacheInputs
         
+    def __setstate__(self, dict state):
+        super(HxUnitPlate, self).__setstate__(state)
+        self._resolveMethods()
+
+    cdef void _resolveMethods(self):
+        """Resolves _methodHeatWf, _methodHeatSf, _methodFrictionWf and _methodFrictionSf to their C-level implementations in mcycle.methods.heat_transfer, so the correlations are called without keyword arguments or a dict of results. Methods without one are called through Python. Must be called again if the method names are changed."""
+        self._htMethodHeatWf = getMethod(self._methodHeatWf)
+        self._htMethodHeatSf = getMethod(self._methodHeatSf)
+        self._htMethodFrictionWf = getMethod(self._methodFrictionWf)
+        self._htMethodFrictionSf = getMethod(self._methodFrictionSf)
+
     cpdef public unsigned int _NWf(self):
         """int: Number of secondary fluid flow channels. Setter may not be used.
 
@@ -123,7 +153,9 @@ config : Config, optional
                 return int(self.NWall / 2)
 
     cpdef public double _hWf(self):
-        """float: Heat transfer coefficient of a working fluid channel [W/m^2.K]. Calculated using the relevant method of mcycle.methods.heat_transfer defined in config.methods."""
+        """float: Heat transfer coefficient of a working fluid channel [W/m^2.K]. Calculated using the relevant method of mcycle.methods.heat_transfer defined in config.methods, through its C-level implementation if it has one."""
+        if self._htMethodHeatWf is not NULL:
+            return self._htMethodHeatWf(self.flowsIn[0], self.flowsOut[0], self._NWf(), self.geomWf, self.L, self.W, self.flowConfig, False, self.geomSf).h
         return getattr(ht, self._methodHeatWf)(
             flowIn=self.flowsIn[0],
             flowOut=self.flowsOut[0],
@@ -136,7 +168,9 @@ config : Config, optional
             geom2=self.geomSf)["h"]
 
     cpdef public double _hSf(self):
-        """float: Heat transfer coefficient of a secondary fluid channel [W/m^2.K]. Calculated using the relevant method of mcycle.methods.heat_transfer defined in config.methods."""
+        """float: Heat transfer coefficient of a secondary fluid channel [W/m^2.K]. Calculated using the relevant method of mcycle.methods.heat_transfer defined in config.methods, through its C-level implementation if it has one."""
+        if self._htMethodHeatSf is not NULL:
+            return self._htMethodHeatSf(self.flowsIn[1], self.flowsOut[1], self._NSf(), self.geomSf, self.L, self.W, self.flowConfig, True, self.geomWf).h
         return getattr(ht, self._methodHeatSf)(
             flowIn=self.flowsIn[1],
             flowOut=self.flowsOut[1],
@@ -149,7 +183,9 @@ config : Config, optional
             geom2=self.geomWf)["h"]
 
     cpdef public double _fWf(self):
-        """float: Fanning friction factor of a working fluid channel [-]. Calculated using the relevant method of mcycle.methods.heat_transfer defined in config.methods."""
+        """float: Fanning friction factor of a working fluid channel [-]. Calculated using the relevant method of mcycle.methods.heat_transfer defined in config.methods, through its C-level implementation if it has one."""
+        if self._htMethodFrictionWf is not NULL:
+            return self._htMethodFrictionWf(self.flowsIn[0], self.flowsOut[0], self._NWf(), self.geomWf, self.L, self.W, self.flowConfig, True, self.geomSf).f
         return getattr(ht, self._methodFrictionWf)(
             flowIn=self.flowsIn[0],
             flowOut=self.flowsOut[0],
@@ -162,7 +198,9 @@ config : Config, optional
             geom2=self.geomSf)["f"]
 
     cpdef public double _fSf(self):
-        """float: Fanning friction factor of a secondary fluid channel [-]. Calculated using the relevant method of mcycle.methods.heat_transfer defined in config.methods."""
+        """float: Fanning friction factor of a secondary fluid channel [-]. Calculated using the relevant method of mcycle.methods.heat_transfer defined in config.methods, through its C-level implementation if it has one."""
+        if self._htMethodFrictionSf is not NULL:
+            return self._htMethodFrictionSf(self.flowsIn[1], self.flowsOut[1], self._NSf(), self.geomSf, self.L, self.W, self.flowConfig, False, self.geomWf).f
         return getattr(ht, self._methodFrictionSf)(
             flowIn=self.flowsIn[1],
             flowOut=self.flowsOut[1],
@@ -175,35 +213,55 @@ config : Config, optional
             geom2=self.geomWf)["f"]
 
     cpdef public double _dpFWf(self):
-        """float: Frictional pressure drop of a working fluid channel [-]. Calculated using the relevant method of mcycle.methods.heat_transfer defined in config.methods."""
-        return getattr(ht, self._methodFrictionWf)(
-            flowIn=self.flowsIn[0],
-            flowOut=self.flowsOut[0],
-            N=self._NWf(),
-            geom=self.geomWf,
-            L=self.L,
-            W=self.W,
-            flowConfig=self.flowConfig,
-            is_wf=True,
-            geom2=self.geomSf)["dpF"]
+        """float: Frictional pressure drop of a working fluid channel [-]. Calculated using the relevant method of mcycle.methods.heat_transfer defined in config.methods, through its C-level implementation if it has one. Cached until the flows, geometry or methods of the unit change; see :meth:`ABC._cacheGet() <mcycle.bases.abc.ABC._cacheGet>`."""
+        value = self._cacheGet('_dpFWf')
+        if value is not None:
+            return value
+        if self._htMethodFrictionWf is not NULL:
+            value = self._htMethodFrictionWf(self.flowsIn[0], self.flowsOut[0], self._NWf(), self.geomWf, self.L, self.W, self.flowConfig, True, self.geomSf).dpF
+        else:
+            value = getattr(ht, self._methodFrictionWf)(
+                flowIn=self.flowsIn[0],
+                flowOut=self.flowsOut[0],
+                N=self._NWf(),
+                geom=self.geomWf,
+                L=self.L,
+                W=self.W,
+                flowConfig=self.flowConfig,
+                is_wf=True,
+                geom2=self.geomSf)["dpF"]
+        return self._cacheSet('_dpFWf', value)
 
     cpdef public double _dpFSf(self):
-        """float: Frictional pressure drop of a secondary fluid channel [-]. Calculated using the relevant method of mcycle.methods.heat_transfer defined in config.methods."""
-        return getattr(ht, self._methodFrictionSf)(
-            flowIn=self.flowsIn[1],
-            flowOut=self.flowsOut[1],
-            N=self._NSf(),
-            geom=self.geomSf,
-            L=self.L,
-            W=self.W,
-            flowConfig=self.flowConfig,
-            is_wf=False,
-            geom2=self.geomWf)["dpF"]
+        """float: Frictional pressure drop of a secondary fluid channel [-]. Calculated using the relevant method of mcycle.methods.heat_transfer defined in config.methods, through its C-level implementation if it has one. Cached until the flows, geometry or methods of the unit change; see :meth:`ABC._cacheGet() <mcycle.bases.abc.ABC._cacheGet>`."""
+        value = self._cacheGet('_dpFSf')
+        if value is not None:
+            return value
+        if self._htMethodFrictionSf is not NULL:
+            value = self._htMethodFrictionSf(self.flowsIn[1], self.flowsOut[1], self._NSf(), self.geomSf, self.L, self.W, self.flowConfig, False, self.geomWf).dpF
+        else:
+            value = getattr(ht, self._methodFrictionSf)(
+                flowIn=self.flowsIn[1],
+                flowOut=self.flowsOut[1],
+                N=self._NSf(),
+                geom=self.geomSf,
+                L=self.L,
+                W=self.W,
+                flowConfig=self.flowConfig,
+                is_wf=False,
+                geom2=self.geomWf)["dpF"]
+        return self._cacheSet('_dpFSf', value)
+
+    cdef double _RWf(self) except *:
+        return 1 / self._hWf() / self._NWf()
+
+    cdef double _RSf(self) except *:
+        return 1 / self._hSf() / self._NSf()
 
     cpdef public double U(self):
         """float: Overall heat transfer coefficient of the unit [W/m^2.K]."""
-        cdef double RWf = (1 / self._hWf() + self.RfWf) / self._NWf()
-        cdef double RSf = (1 / self._hSf() + self.RfSf) / self._NSf()
+        cdef double RWf = self._RWf() + self.RfWf / self._NWf()
+        cdef double RSf = self._RSf() + self.RfSf / self._NSf()
         cdef double RPlate = self.tWall / (
             self.NWall - 2) / self.wall.k()
         return (RWf + RSf + RPlate)**-1
@@ -246,12 +304,31 @@ config : Config, optional
     cpdef public double ReSf(self):
         return self.Re(1)
     
-    cpdef double _f_sizeUnitsHxUnitPlate(self, double value, str attr):
-        self.update({attr: value})
+    cpdef double _f_sizeUnitsHxUnitPlate(self, double value, str attr) except *:
+        self._setAttr(attr, value)
         return self.Q() - self.Q_lmtd()
     
+    cdef double _sizeUnitsWarm(self, str attr, double[2] bounds) except *:
+        """float: Solution of sizeUnits() found by the secant method started from the last solution, _sizeUnitsLast. Returns nan if there is no last solution, or if the secant method fails to converge within bounds."""
+        cdef double sizedValue
+        if not self._sizeUnitsLast > 0:
+            return nan
+        try:
+            sizedValue = secant(_SizeUnitsResidual(self, attr),
+                                self._sizeUnitsLast,
+                                self._sizeUnitsLast * (1 + _warmStep),
+                                (),
+                                self.config.tolAbs,
+                                self.config.tolRel,
+                                self.config.maxIterComponent)
+        except RuntimeError:
+            return nan
+        if bounds[0] <= sizedValue <= bounds[1]:
+            return sizedValue
+        return nan
+
     cpdef public void sizeUnits(self) except *:
-        """Solves for the value of the nominated component attribute required to return the defined outgoing FlowState.
+        """Solves for the value of the nominated component attribute required to return the defined outgoing FlowState. If the unit has been sized before, the solution is first sought by the secant method started from its last solution, see :meth:`_sizeUnitsWarm`, then by :meth:`find_root <mcycle.bases.solvers.find_root>` bracketed around its last root or from sizeBounds.
 
 Parameters
 -----------
@@ -260,7 +337,7 @@ attr : string, optional
 bounds : float or list of float, optional
     Bracket containing solution of size(). If None, self.sizeBounds is used. Defaults to None.
         """
-        cdef double tol, sizedValue, fa, fb, r
+        cdef double tol, sizedValue
         cdef list boundsOriginal
         cdef str attr = self.sizeAttr
         cdef double[2] bounds = self.sizeBounds
@@ -268,40 +345,22 @@ bounds : float or list of float, optional
         try:
             tol = self.config.tolAbs + self.config.tolRel * self.Q()
             if len(bounds) == 2:
-                try:
-                    sizedValue = opt.brentq(self._f_sizeUnitsHxUnitPlate,
-                                            bounds[0],
-                                            bounds[1],
-                                            args=(attr),
-                                            rtol=self.config.tolRel,
-                                            xtol=self.config.tolAbs)
-                except:
-                    a = bounds[0]
-                    b = bounds[1]
-                    fa = self._f_sizeUnitsHxUnitPlate(a, attr)
-                    fb = self._f_sizeUnitsHxUnitPlate(b, attr)
-                    r = a - fa*(b-a)/(fb-fa)
-                    try:
-                        sizedValue = opt.brentq(self._f_sizeUnitsHxUnitPlate,
-                                            a,
-                                            2*r-a,
-                                            args=(attr),
-                                            rtol=self.config.tolRel,
-                                            xtol=self.config.tolAbs)
-                    except:
-                        try:
-                            sizedValue = opt.brentq(self._f_sizeUnitsHxUnitPlate,
-                                            b,
-                                            2*r-b,
-                                            args=(attr),
-                                            rtol=self.config.tolRel,
-                                            xtol=self.config.tolAbs)
-                        except Exception as exc:
-                            warn('Could not find solution in boundss {} or {}.'.format([a, 2*r-a], [b, 2*r-b]))
-                            raise exc
+                sizedValue = self._sizeUnitsWarm(attr, bounds)
+                if isnan(sizedValue):
+                    sizedValue = find_root(_SizeUnitsResidual(self, attr),
+                                           bounds[0],
+                                           bounds[1],
+                                           (),
+                                           0,
+                                           inf,
+                                           self.config.tolRel,
+                                           self.config.tolAbs,
+                                           self._brackets,
+                                           attr)
             else:
                 raise ValueError("bounds is not valid (given: {})".format(bounds))
             self.update({attr: sizedValue})
+            self._sizeUnitsLast = sizedValue
             # return sizedValue
         except AssertionError as err:
             raise err
@@ -82,6 +82,7 @@ cdef class RankineBasic(Cycle):
     cpdef public double IComp(self) except *
     cpdef public double ICond(self) except *
     cpdef public double ITotal(self) except *
+    cpdef tuple _pptdStates(self)
     cpdef public double _pptdEvap(self)
 
     cpdef public void sizeSetup(self, bint unitiseEvap, bint unitiseCond)
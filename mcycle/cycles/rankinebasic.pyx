@@ -7,6 +7,7 @@ from ..bases.component cimport Component
 from ..bases.flowstate cimport FlowState
 from ..components.hxs.hx_basic cimport HxBasic
 from ..utils.saturation_curves import saturationCurve
+from ..utils.pinch import matchedCompositeCurves, solveMassPinch
 from math import nan, isnan
 import numpy as np
 
@@ -14,6 +15,9 @@ from warnings import warn
 
 cdef tuple _inputs = ('wf', 'evap', 'exp', 'cond', 'comp', 'pEvap', 'superheat', 'pCond', 'subcool', 'config')
 cdef tuple _properties = ('mWf', 'QIn()', 'QOut()', 'PIn()', 'POut()', 'efficiencyThermal()', 'efficiencyExergy()', 'IComp()', 'IEvap()', 'IExp()', 'ICond()')
+cdef tuple _cacheComponents = ('wf', 'evap', 'exp', 'cond', 'comp')
+cdef dict _cacheInputs = {'efficiencyExergy': _cacheComponents, 'IComp': _cacheComponents, 'IEvap': _cacheComponents,
+                          'IExp': _cacheComponents, 'ICond': _cacheComponents, 'ITotal': _cacheComponents}
 
 cdef class RankineBasic(Cycle):
     """Defines all cycle components and design parameters for a basic four-stage (steam/organic) Rankine cycle.
@@ -70,6 +74,7 @@ name : str, optional
         #self.setAll_config(config)  # use setter to set for all components
         self._inputs =  _inputs
         self._properties = _properties
+        self._cacheInputs = _cacheInputs
 
     cpdef public void update(self, dict kwargs):
         """Update (multiple) Cycle variables using keyword arguments."""
@@ -96,6 +101,7 @@ name : str, optional
                         setter(value)
                     except AttributeError:
                         super(RankineBasic, self).update({key: value})
+        self.clearCache(tuple(kwargs))
 
     cpdef public double _mWf(self):
         return self.wf.m
@@ -573,94 +579,132 @@ name : str, optional
                 return nan
 
     cpdef public double efficiencyExergy(self) except *:
-        """float: Exergy efficiency"""
+        """float: Exergy efficiency. Cached until the working fluid or the flows of the components change; see :meth:`ABC._cacheGet() <mcycle.bases.abc.ABC._cacheGet>`."""
+        value = self._cacheGet('efficiencyExergy')
+        if value is not None:
+            return value
         if len(self.evap.flowsIn) == 1:
             log("warning", "efficiencyExergy() is not valid with {} evaporator".format(type(self.evap)))
-            return nan
+            value = nan
         else:
             try:
-                return self.PNet() / self._sourceIn().m / (self._sourceIn().h() - self._sourceAmbient().h())
+                value = self.PNet() / self._sourceIn().m / (self._sourceIn().h() - self._sourceAmbient().h())
             except Exception as exc:
                 log("error", "efficiencyExergy() could not be calculated", exc_info=exc)
-                return nan
+                value = nan
+        return self._cacheSet('efficiencyExergy', value)
 
     cpdef public double efficiencyGlobal(self) except *:
         """float: Global recovery efficiency"""
         return self.efficiencyThermal() * self.efficiencyExergy()
 
     cpdef public double IComp(self) except *:
-        """float: Exergy destruction of compressor [W]"""
+        """float: Exergy destruction of compressor [W]. Cached until the working fluid or the flows of the components change."""
+        value = self._cacheGet('IComp')
+        if value is not None:
+            return value
         if len(self.cond.flowsIn) == 1:
             log("warning", "IComp() is not valid with {} condenser".format(type(self.cond)))
-            return nan
+            value = nan
         else:
             try:
-                return self._sinkAmbient().T() * self._mWf() * (
+                value = self._sinkAmbient().T() * self._mWf() * (
                 self._state1().s() - self._state6().s())
             except Exception as exc:
                 log("error", "IComp() could not be calculated", exc_info=exc)
-                return nan
+                value = nan
+        return self._cacheSet('IComp', value)
 
     cpdef public double IEvap(self) except *:
-        """float: Exergy destruction of evaporator [W]"""
+        """float: Exergy destruction of evaporator [W]. Cached until the working fluid or the flows of the components change."""
         cdef FlowState ambientSource
         cdef double I_13, I_C0
+        value = self._cacheGet('IEvap')
+        if value is not None:
+            return value
         if len(self.evap.flowsIn) == 1:
             log("warning", "IEvap() is not valid with {} evaporator".format(type(self.evap)))
-            return nan
+            value = nan
         else:
             try:
                 ambientSource = self._sourceIn().copyUpdateState(PT_INPUTS, self._sourceAmbient.p(), self._sourceAmbient().T())
             except Exception as exc:
                 log("warning", "Could not create evaporator source flow at ambient conditions. Returned nan. ", exc_info=exc)
-                return nan
+                return self._cacheSet('IEvap', nan)
             I_13 = ambientSource.T() * (
                 self._mWf() * (self._state3().s() - self._state1().s()) + self._sourceIn().m *
                 (self._source1().s() - self._sourceIn().s()))
             I_C0 = ambientSource.T() * self._sourceIn().m * (
                 (ambientSource.s() - self._source1().s()) +
                 (self._source1().h() - ambientSource.h()) / ambientSource.T())
-            return I_13 + I_C0
+            value = I_13 + I_C0
+        return self._cacheSet('IEvap', value)
 
     cpdef public double IExp(self) except *:
-        """float: Exergy destruction of expander [W]"""
+        """float: Exergy destruction of expander [W]. Cached until the working fluid or the flows of the components change."""
+        value = self._cacheGet('IExp')
+        if value is not None:
+            return value
         if len(self.cond.flowsIn) == 1:
             log("warning", "IExp() is not valid with {} condenser".format(type(self.cond)))
-            return nan
+            value = nan
         else:
             try:
-                return self._sinkAmbient().T() * self._mWf() * (
+                value = self._sinkAmbient().T() * self._mWf() * (
             self._state4().s() - self._state3().s())
             except Exception as exc:
                 log("error", "IExp() could not be calculated", exc_info=exc)
-                return nan
+                value = nan
+        return self._cacheSet('IExp', value)
 
     cpdef public double ICond(self) except *:
-        """float: Exergy destruction of condenser [W]"""
+        """float: Exergy destruction of condenser [W]. Cached until the working fluid or the flows of the components change."""
+        value = self._cacheGet('ICond')
+        if value is not None:
+            return value
         if len(self.cond.flowsIn) == 1:
             log("warning", "ICond() is not valid with {} condenser".format(type(self.cond)))
-            return nan
+            value = nan
         else:
             try:
-                return self._sinkAmbient().T() * self._mWf() * (
+                value = self._sinkAmbient().T() * self._mWf() * (
             (self._state50().s() - self._state4().s()) +
             (self._state4().h() - self._state50().h()) / self._sinkAmbient().T())
             except Exception as exc:
                 log("error", "ICond() could not be calculated", exc_info=exc)
-                return nan
+                value = nan
+        return self._cacheSet('ICond', value)
 
     cpdef public double ITotal(self) except *:
-        """float: Total exergy destruction of cycle [W]"""
-        return self.IComp() + self.IEvap() + self.IExp() + self.ICond()
+        """float: Total exergy destruction of cycle [W]. Cached until the working fluid or the flows of the components change."""
+        value = self._cacheGet('ITotal')
+        if value is None:
+            value = self._cacheSet('ITotal', self.IComp() + self.IEvap() + self.IExp() + self.ICond())
+        return value
     
+    cpdef tuple _pptdStates(self):
+        """tuple of FlowState: Working fluid states 1, 3, 4 and 6 set by pEvap, superheat, pCond, subcool and the isentropic efficiencies of the compressor and expander, without running the cycle."""
+        cdef FlowState state1, state1s, state3, state4, state4s, state6
+        if self.subcool == 0:
+            state6 = self.wf.copyUpdateState(PQ_INPUTS, self.pCond, 0)
+        else:
+            state6 = self.wf.copyUpdateState(PT_INPUTS, self.pCond, self._TCond() - self.subcool)
+        state1s = self.wf.copyUpdateState(PSmass_INPUTS, self.pEvap, state6.s())
+        state1 = self.wf.copyUpdateState(HmassP_INPUTS, state6.h() + (state1s.h() - state6.h()) / self.comp.efficiencyIsentropic, self.pEvap)
+        if self.superheat == 0:
+            state3 = self.wf.copyUpdateState(PQ_INPUTS, self.pEvap, 1)
+        else:
+            state3 = self.wf.copyUpdateState(PT_INPUTS, self.pEvap, self._TEvap() + self.superheat)
+        state4s = self.wf.copyUpdateState(PSmass_INPUTS, self.pCond, state3.s())
+        state4 = self.wf.copyUpdateState(HmassP_INPUTS, state3.h() - (state3.h() - state4s.h()) * self.exp.efficiencyIsentropic, self.pCond)
+        return state1, state3, state4, state6
+
     cpdef public double _pptdEvap(self):
-        """float: Pinch-point temperature difference of evaporator"""
+        """float: Pinch-point temperature difference of evaporator; the minimum temperature difference between the composite curves of the working fluid from state1 to state3 and of the heat source (see :meth:`mcycle.utils.pinch.matchedCompositeCurves`)."""
         if issubclass(type(self.evap), HxBasic):
-            if self.evap.flowConfig.sense == COUNTERFLOW:
-                if self._state1() and self._state20() and self._source1() and self._source20():
-                    return min(self._source20().T() - self._state20().T(),
-                               self._source1().T() - self._state1().T())
-
+            if self.evap.flowConfig.sense == COUNTERFLOW or self.evap.flowConfig.sense == PARALLELFLOW:
+                if self._state1() and self._state3() and self._sourceIn():
+                    return matchedCompositeCurves(self._state1(), self._state3(), self._sourceIn(), self._mWf(), self.evap.flowConfig.sense, self.evap._efficiencyFactorWf(), self.evap._efficiencyFactorSf())['pinch']
                 else:
                     warn("run() or size() has not been executed")
             else:
@@ -668,84 +712,45 @@ name : str, optional
         else:
             warn("pptdEvap is not a valid attribute for a {} evaporator".
                  format(type(self.evap)))
-            return nan
+        return nan
 
     @property
     def pptdEvap(self):
+        """float: Pinch-point temperature difference of evaporator. Setting pptdEvap sets the working fluid mass flow rate that gives it for the states set by pEvap, superheat, pCond, subcool and the compressor and expander efficiencies (see :meth:`mcycle.utils.pinch.solveMassPinch`)."""
         return self._pptdEvap()
     
     @pptdEvap.setter
     def pptdEvap(self, value):
         if issubclass(type(self.evap), HxBasic):
-            state20 = self.wf.copyUpdateState(PQ_INPUTS, self.pEvap, 0)
-            if self.superheat == 0:# or self.superheat is None:
-                state3 = self.wf.copyUpdateState(PQ_INPUTS, self.pEvap, 1)
-            else:
-                state3 = self.wf.copyUpdateState(PT_INPUTS, self.pEvap,
-                                      self._TEvap() + self.superheat)
-            source20 = self._sourceIn().copyUpdateState(PT_INPUTS,
-                                          self._sourceIn().p(),
-                                          state20.T() + value)
-
-            m20 = self.evap.efficiencyThermal * self._sourceIn().m * (
-                self._sourceIn().h() - source20.h()) / (state3.h() - state20.h())
-            # check if pptd should be at state1
-            if (source20.m / m20) < (state20.cp() / source20.cp()):
-                if self.subcool == 0:# or self.subcool is None:
-                    state6 = self.wf.copyUpdateState(PQ_INPUTS, self.pCond, 0)
-                else:
-                    state6 = self.wf.copyUpdateState(PT_INPUTS, self.pCond,
-                                          self.TCond - self.subcool)
-                state1s = self.wf.copyUpdateState(PSmass_INPUTS, self.pEvap,
-                                       state6.s())
-                h1 = state6.h() + (state1s.h() - state6.h()
-                                   ) / self.comp.efficiencyIsentropic
-                state1 = self.wf.copyUpdateState(HmassP_INPUTS, h1, self.pEvap)
-                source1 = self.sourceIn.copyUpdateState(PT_INPUTS,
-                                             self.sourceIn.p(),
-                                             state1.T() + value)
-                m1 = self.evap.efficiencyThermal * self.sourceIn.m * (
-                    self.sourceIn.h() - source1.h()) / (
-                        state3.h() - state1.h())
-                # check
-                h20 = source1.h() + m1 * (
-                    state20.h() - state1.h()
-                ) / self.sourceIn.m / self.evap.efficiencyThermal
-                source20.updateState(HmassP_INPUTS, h20, self.sourceIn.p())
-                if source20.T() < state20.T():  # assumption was wrong or error
-                    self.wf.m = m20
-                else:
-                    self.wf.m = m1
-            else:
-                self.wf.m = m20
+            state1, state3, state4, state6 = self._pptdStates()
+            self.wf.m = solveMassPinch(state1, state3, self._sourceIn(), value, self.evap.flowConfig.sense, 1, self.evap.efficiencyThermal, mGuess=self.wf.m)
         else:
             print("pptdEvap is not a valid attribute for a {0} evaporator".
                   format(type(self.evap)))
 
     @property
     def pptdCond(self):
-        """float: Pinch-point temperature difference of condenser"""
+        """float: Pinch-point temperature difference of condenser; the minimum temperature difference between the composite curves of the working fluid from state4 to state6 and of the heat sink. Setting pptdCond sets the working fluid mass flow rate that gives it, as for pptdEvap."""
         if issubclass(type(self.cond), HxBasic):
-            if self.cond.flowConfig.sense == COUNTERFLOW:
-
-                if self.state4 and self.state51 and self.sink4 and self.sink51:
-                    return min(self.state51.T() - self.sink51.T(),
-                               self.state4.T() - self.sink4.T())
-
+            if self.cond.flowConfig.sense == COUNTERFLOW or self.cond.flowConfig.sense == PARALLELFLOW:
+                if self._state4() and self._state6() and self._sinkIn():
+                    return matchedCompositeCurves(self._state4(), self._state6(), self._sinkIn(), self._mWf(), self.cond.flowConfig.sense, self.cond._efficiencyFactorWf(), self.cond._efficiencyFactorSf())['pinch']
                 else:
                     print("run() or size() has not been executed")
             else:
-                print("pptdEvap is not a valid for flowConfig.sense = {0}".format(self.evap.flowConfig.sense))
+                print("pptdCond is not a valid for flowConfig.sense = {0}".format(self.cond.flowConfig.sense))
         else:
-            print("pptdEvap is not a valid attribute for a {0} condenser".
+            print("pptdCond is not a valid attribute for a {0} condenser".
                   format(type(self.cond)))
+        return nan
 
     @pptdCond.setter
     def pptdCond(self, value):
         if issubclass(type(self.cond), HxBasic):
-            pass  # TODO
+            state1, state3, state4, state6 = self._pptdStates()
+            self.wf.m = solveMassPinch(state4, state6, self._sinkIn(), value, self.cond.flowConfig.sense, self.cond.efficiencyThermal, 1, mGuess=self.wf.m)
         else:
-            print("pptdEvap is not a valid attribute for a {0} condenser".
+            print("pptdCond is not a valid attribute for a {0} condenser".
                   format(type(self.cond)))
 
     cpdef public void run(self) except *:
@@ -7,6 +7,8 @@ TOLABS = 1e-7
 TOLREL = 1e-7
 DIV_T = 5.
 DIV_X = 0.1
+TOL_DIV = 1e-3
+MAX_UNITS = 50
 MAXITER_CYCLE = 50
 MAXITER_COMPONENT = 50
 MAX_WALLS = 200
@@ -17,6 +19,7 @@ DP_PORT_OUT_FACTOR = 0.4
 COOLPROP_EOS = 'HEOS'
 MPL_BACKEND = 'TkAgg'
 PLOT_DIR = '.'
+DESIGN_CACHE_DIR = '~/.mcycle/designs'
 PLOT_DPI = 600
 PLOT_FORMAT = 'png'
 PLOT_COLOR = ['C0', 'C1', 'C2', 'C3', 'C4', 'C5', 'C6', 'C7', 'C8', 'C9']
@@ -452,6 +455,8 @@ def check():
         MAXITER_COMPONENT)
     assert MAX_WALLS > 1, "MAX_WALLS must be >1, {} is invalid.".format(
         MAX_WALLS)
+    assert MAX_UNITS > 0, "MAX_UNITS must be >0, {} is invalid.".format(
+        MAX_UNITS)
     unitsepnum = [".", "-"]
     if UNITS_SEPARATOR_NUMERATOR not in unitsepnum:
         print(
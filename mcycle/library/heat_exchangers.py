@@ -1,10 +1,15 @@
-"""A brief library of commercial component designs."""
-from ..bases import Config
+"""A brief library of commercial component designs. Designs sized by :meth:`sizeCached` are stored on disk and reused by later sizings of the same design."""
+from ..bases import ABC
+from ..bases.abc import _canonical
+from .. import defaults
+from ..logger import log
 from ..constants import *
 from .. import components as cps
 from .. import geometries as gms
 from . import materials as mats
 
+_designs = {}
+
 
 def alfaLaval_AC30EQ(
         flowConfig=cps.hxs.HxFlowConfig(
@@ -102,3 +107,70 @@ def alfaLaval_CBXP27(
     )
     hx.update(kwargs)
     return hx
+
+
+def _designKey(hx):
+    """str: Hash of the design of hx, its flows, Config and sizeAttr, excluding the value of the attribute to be sized and the descriptive name and notes."""
+    import hashlib
+    from ..__meta__ import version
+    exclude = ('name', 'notes', hx.sizeAttr)
+    key = (version, type(hx).__name__, hx.sizeAttr) + tuple(
+        (i, _canonical(v)) for i, v in zip(hx._inputs, hx._inputValues())
+        if i not in exclude)
+    return hashlib.sha256(repr(key).encode()).hexdigest()
+
+
+def sizeCached(hx, cacheDir='default'):
+    """Size hx, as by its size(), reusing the design stored by an earlier call for the same design, flows, Config and sizeAttr. The sized design is stored in memory and on disk, so repeated sizings of a library heat exchanger against the same duty return without sizing, in this and later sessions.
+
+The stored design is the values of the _inputs of hx changed by size() (eg; NPlate or L, and any outgoing FlowState) and, for heat exchangers, its units, compacted as by ``compactUnits()``, and the design point of ``run_quasi()`` if one has been stored by ``captureUA()``. Designs are keyed by the MCycle version, so they are not reused after an upgrade.
+
+Parameters
+-----------
+hx : Component
+    Component to be sized, eg; from :meth:`alfaLaval_AC30EQ`.
+cacheDir : str, optional
+    Directory of the stored designs. If None or '', designs are only stored in memory. If ``'default'``, :meth:`mcycle.defaults.DESIGN_CACHE_DIR <mcycle.defaults.DESIGN_CACHE_DIR>` is used. Defaults to ``'default'``.
+    """
+    import os
+    import pickle
+    key = _designKey(hx)
+    if cacheDir == 'default':
+        cacheDir = defaults.DESIGN_CACHE_DIR
+    path = os.path.join(os.path.expanduser(cacheDir), key + '.pkl') if cacheDir else ''
+    design = _designs.get(key)
+    if design is None and path and os.path.exists(path):
+        try:
+            with open(path, 'rb') as f:
+                design = pickle.load(f)
+            _designs[key] = design
+        except Exception as exc:
+            log('warning', 'sizeCached(): could not read stored design "{}"'.format(path), exc)
+            design = None
+    if design is None:
+        before = {i: _canonical(v) for i, v in zip(hx._inputs, hx._inputValues())}
+        hx.size()
+        design = {
+            'inputs': {i: v for i, v in zip(hx._inputs, hx._inputValues())
+                       if i != 'config' and (i == hx.sizeAttr or _canonical(v) != before[i])}
+        }
+        if hasattr(hx, 'unitArrays'):
+            design['_unitArrays'] = hx.unitArrays()
+        if getattr(hx, '_designUnits', None) is not None:
+            design['_designUnits'] = hx._designUnits
+        _designs[key] = design
+        if path:
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path + '.tmp', 'wb') as f:
+                    pickle.dump(design, f)
+                os.replace(path + '.tmp', path)
+            except Exception as exc:
+                log('warning', 'sizeCached(): could not store design "{}"'.format(path), exc)
+        return
+    hx.update({i: v.copy() if isinstance(v, ABC) else v for i, v in design['inputs'].items()})
+    if '_unitArrays' in design:
+        hx._units = []
+        hx._unitArrays = design['_unitArrays'].copy()
+    if '_designUnits' in design:
+        hx._designUnits = design['_designUnits'].copy()
@@ -1,8 +1,35 @@
-"""A brief library of common component materials."""
+"""A brief library of common component materials. Each material is defined once, on its first call, and later calls return a new SolidMaterial sharing that definition."""
 from ..bases.solidmaterial import SolidMaterial
+from functools import wraps
+
+_definitions = {}
+
+
+def _shared(factory):
+    """Decorator of a material factory: the material built by the first call is stored in _definitions, with its data as tuples so it cannot be edited in place, and every call returns a new SolidMaterial of that definition at temperature T, with its own lists of the data."""
+
+    @wraps(factory)
+    def material(T=293.15):
+        try:
+            definition = _definitions[factory.__name__]
+        except KeyError:
+            definition = factory(T)
+            definition.data = {
+                key: tuple(value)
+                for key, value in definition.data.items()
+            }
+            _definitions[factory.__name__] = definition
+        return SolidMaterial(definition.rho,
+                             {key: list(value)
+                              for key, value in definition.data.items()},
+                             definition.deg, T, definition.name,
+                             definition.notes)
+
+    return material
 
 
 #: Alumel (Ni, 2%-Al, 2%-Mn, 1%-Si), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def alumel(T=293.15):
     return SolidMaterial(
         rho=8600.,
@@ -17,6 +44,7 @@ def alumel(T=293.15):
 
 
 #: Aluminium (pure), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def aluminium(T=293.15):
     return SolidMaterial(
         rho=2707.,
@@ -36,6 +64,7 @@ def aluminium(T=293.15):
 
 
 #: Aluminium alloy 6061-T6, from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def aluminium_6061_T6(T=293.15):
     return SolidMaterial(
         rho=2700.,
@@ -52,6 +81,7 @@ def aluminium_6061_T6(T=293.15):
 
 
 #: Aluminium alloy 7075-T6, from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def aluminium_7075_T6(T=293.15):
     return SolidMaterial(
         rho=2800.,
@@ -68,6 +98,7 @@ def aluminium_7075_T6(T=293.15):
 
 
 #: Brass, from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def brass(T=293.15):
     return SolidMaterial(
         rho=8522.,
@@ -85,6 +116,7 @@ def brass(T=293.15):
 
 
 #: Chromel P (Ni, 10%-Cr), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def chromelP(T=293.15):
     return SolidMaterial(
         rho=8730.,
@@ -99,6 +131,7 @@ def chromelP(T=293.15):
 
 
 #: Chromium, from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def chromium(T=293.15):
     return SolidMaterial(
         rho=7190.,
@@ -118,6 +151,7 @@ def chromium(T=293.15):
 
 
 #: Constantan, from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def constantan(T=293.15):
     return SolidMaterial(
         rho=8922.,
@@ -134,6 +168,7 @@ def constantan(T=293.15):
 
 
 #: Copper (pure), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def copper(T=293.15):
     return SolidMaterial(
         rho=8954.,
@@ -153,6 +188,7 @@ def copper(T=293.15):
 
 
 #: Duralumin, from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def duralumin(T=293.15):
     return SolidMaterial(
         rho=2787.,
@@ -169,6 +205,7 @@ def duralumin(T=293.15):
 
 
 #: Gold (pure), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def gold(T=293.15):
     return SolidMaterial(
         rho=19320.,
@@ -188,6 +225,7 @@ def gold(T=293.15):
 
 
 #: Inconel X-750 (73%-Ni, 15%-Cr, 6.75%-Fe, 2.5%-Ti, 0.85%-Nb, 0.8%-Al, 0.7%-Mn, 0.3%-Si), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def inconelX750(T=293.15):
     return SolidMaterial(
         rho=8510.,
@@ -208,6 +246,7 @@ def inconelX750(T=293.15):
 
 
 #: Iron (pure), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def iron(T=293.15):
     return SolidMaterial(
         rho=7987.,
@@ -227,6 +266,7 @@ def iron(T=293.15):
 
 
 #: Lead (pure), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def lead(T=293.15):
     return SolidMaterial(
         rho=11373.,
@@ -243,6 +283,7 @@ def lead(T=293.15):
 
 
 #: Magnesium (pure), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def magnesium(T=293.15):
     return SolidMaterial(
         rho=1746.,
@@ -262,6 +303,7 @@ def magnesium(T=293.15):
 
 
 #: Molybdenum (pure), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def molybdenum(T=293.15):
     return SolidMaterial(
         rho=10220.,
@@ -281,6 +323,7 @@ def molybdenum(T=293.15):
 
 
 #: Nichrome (Ni, 23%-Fe, 16%-Cr), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def nichrome(T=293.15):
     return SolidMaterial(
         rho=8250.,
@@ -295,6 +338,7 @@ def nichrome(T=293.15):
 
 
 #: Nichrome V (Ni, 20%-Cr, 1.4%-Si), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def nichromeV(T=293.15):
     return SolidMaterial(
         rho=8410.,
@@ -312,6 +356,7 @@ def nichromeV(T=293.15):
 
 
 #: Nickel (pure), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def nickel(T=293.15):
     return SolidMaterial(
         rho=8906.,
@@ -331,6 +376,7 @@ def nickel(T=293.15):
 
 
 #: Steel AISI 1010, from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def steel_1010(T=293.15):
     return SolidMaterial(
         rho=7830.,
@@ -350,6 +396,7 @@ def steel_1010(T=293.15):
 
 
 #: Steel 0.5%-carbon, from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def steel_0o5C(T=293.15):
     return SolidMaterial(
         rho=7833.,
@@ -369,6 +416,7 @@ def steel_0o5C(T=293.15):
 
 
 #: Steel 1.0%-carbon, from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def steel_1o0C(T=293.15):
     return SolidMaterial(
         rho=7801.,
@@ -388,6 +436,7 @@ def steel_1o0C(T=293.15):
 
 
 #: Steel 1.5%-carbon, from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def steel_1o5C(T=293.15):
     return SolidMaterial(
         rho=7753.,
@@ -407,6 +456,7 @@ def steel_1o5C(T=293.15):
 
 
 #: Stainless steel AISI 304, from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def stainlessSteel_304(T=293.15):
     return SolidMaterial(
         rho=8000.,
@@ -423,6 +473,7 @@ def stainlessSteel_304(T=293.15):
 
 
 #: Stainless steel AISI 316, from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def stainlessSteel_316(T=293.15):
     return SolidMaterial(
         rho=8000.,
@@ -442,6 +493,7 @@ def stainlessSteel_316(T=293.15):
 
 
 #: Stainless steel AISI 347, from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def stainlessSteel_347(T=293.15):
     return SolidMaterial(
         rho=8000.,
@@ -461,6 +513,7 @@ def stainlessSteel_347(T=293.15):
 
 
 #: Silicon (single crystal form), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def silicon(T=293.15):
     return SolidMaterial(
         rho=2330.,
@@ -480,6 +533,7 @@ def silicon(T=293.15):
 
 
 #: Silver (99.99% pure), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def silver(T=293.15):
     return SolidMaterial(
         rho=10524.,
@@ -499,6 +553,7 @@ def silver(T=293.15):
 
 
 #: Titanium (pure), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def titanium(T=293.15):
     return SolidMaterial(
         rho=4540.,
@@ -518,6 +573,7 @@ def titanium(T=293.15):
 
 
 #: Titanium (6%-Al, 4%-V), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def titanium_6Al4V(T=293.15):
     return SolidMaterial(
         rho=4430.,
@@ -534,6 +590,7 @@ def titanium_6Al4V(T=293.15):
 
 
 #: Tungsten (pure), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def tungsten(T=293.15):
     return SolidMaterial(
         rho=19350.,
@@ -553,6 +610,7 @@ def tungsten(T=293.15):
 
 
 #: Zinc (pure), from Table A.1; Lienhard, J. H. I. & Lienhard, J. H. V., *A Heat Transfer Textbook*, Phlogiston Press, 2011.
+@_shared
 def zinc(T=293.15):
     return SolidMaterial(
         rho=7144.,
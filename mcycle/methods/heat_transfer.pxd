@@ -1,5 +1,19 @@
+from ..bases.flowstate cimport FlowState
+from ..bases.geom cimport Geom
+from ..components.hxs.flowconfig cimport HxFlowConfig
 #from libc.math cimport NAN
 
+ctypedef struct HtResult:
+    double h
+    double f
+    double dpF
+
+ctypedef HtResult (*HtMethod)(FlowState flowIn, FlowState flowOut, int N, Geom geom, double L, double W, HxFlowConfig flowConfig, bint is_wf, Geom geom2) except *
+
 cpdef public double htc(double Nu, double k, double charLength) except -1
 cpdef public double dpf(double f, double G, double L, double Dh, double rho, int N) except -1
 cpdef public double lmtd(double TIn1, double TOut1, double TIn2, double TOut2, unsigned char flowSense) except -1
+cpdef public double effectivenessNTU(double NTU, double CRatio, unsigned char flowSense) except -1
+cdef HtMethod getMethod(str method)
+cpdef dict flowProperties(FlowState flow, unsigned char inputPair, input1, input2)
+cpdef tuple getVectorised(str method)
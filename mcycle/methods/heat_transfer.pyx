@@ -65,6 +65,7 @@ from .. import geometries as gms
 #from libc.math cimport NAN
 from math import nan, sin, cos, pi, log, log10, exp, isnan
 from warnings import warn
+import CoolProp as CP
 import numpy as np
 
 cdef str _assertGeomErrMsg(Geom geom, str method_name):
@@ -121,6 +122,23 @@ cpdef public double lmtd(double TIn1, double TOut1, double TIn2, double TOut2, u
         log("warning", msg)
         warn(msg)
     return ans
+
+
+cpdef public double effectivenessNTU(double NTU, double CRatio, unsigned char flowSense) except -1:
+    """float: Effectiveness of a heat exchanger with NTU = UA/Cmin transfer units and heat capacity rate ratio CRatio = Cmin/Cmax."""
+    cdef double e
+    cdef str msg
+    if flowSense == COUNTERFLOW:
+        if 1 - CRatio < 1e-9:
+            return NTU / (1 + NTU)
+        e = exp(-NTU * (1 - CRatio))
+        return (1 - e) / (1 - CRatio * e)
+    elif flowSense == PARALLELFLOW:
+        return (1 - exp(-NTU * (1 + CRatio))) / (1 + CRatio)
+    else:
+        msg = "effectivenessNTU flowSense not valid/supported (given: {})".format(flowSense)
+        log("error", msg)
+        raise ValueError(msg)
     
 
 # -----------------------------------------------------------------
@@ -128,6 +146,31 @@ cpdef public double lmtd(double TIn1, double TOut1, double TIn2, double TOut2, u
 # single-phase relations
 # -----------------------------------------------------------------
 
+cdef HtResult _chisholmWannairachchi_sp(FlowState flowIn,
+                                        FlowState flowOut,
+                                        int N,
+                                        Geom geom,
+                                        double L,
+                                        double W,
+                                        HxFlowConfig flowConfig,
+                                        bint is_wf,
+                                        Geom geom2) except *:
+    assert type(geom) == gms.GeomHxPlateChevron, _assertGeomErrMsg(
+        geom, "chisholmWannairachchi_sp")
+    cdef double Dh = 2 * geom.b / geom.phi
+    cdef double m_channel = flowIn.m / N
+    cdef double G = m_channel / (geom.b * W)
+    cdef double p_avg = 0.5 * (flowIn.p() + flowOut.p())
+    cdef double T_avg = 0.5 * (flowIn.T() + flowOut.T())
+    cdef FlowState avg = flowIn.copyUpdateState(PT_INPUTS, p_avg, T_avg)
+    cdef double Re = G * Dh / avg.visc()
+    cdef double Nu = 0.72 * Re**0.59 * avg.Pr()**0.4 * geom.phi**0.41 * (geom.beta /
+                                                             30)**0.66
+    cdef double h = htc(Nu, avg.k(), Dh)
+    cdef double f = 0.8 * Re**-0.25 * geom.phi**1.25 * (geom.beta / 30)**3.6
+    cdef double dpF = dpf(f, G, L, Dh, avg.rho(), 1)
+    return HtResult(h=h, f=f, dpF=dpF)
+
 cpdef dict chisholmWannairachchi_sp(FlowState flowIn,
                                     FlowState flowOut,
                                     int N,
@@ -143,21 +186,47 @@ Returns
 -------
 dict of float : {"h", "f", "dpF"}
     """
+    cdef HtResult r = _chisholmWannairachchi_sp(flowIn, flowOut, N, geom, L, W, flowConfig, is_wf, geom2)
+    return {"h": r.h, "f": r.f, "dpF": r.dpF}
+
+cdef HtResult _savostinTikhonov_sp(FlowState flowIn,
+                                   FlowState flowOut,
+                                   int N,
+                                   Geom geom,
+                                   double L,
+                                   double W,
+                                   HxFlowConfig flowConfig,
+                                   bint is_wf,
+                                   Geom geom2) except *:
     assert type(geom) == gms.GeomHxPlateChevron, _assertGeomErrMsg(
-        geom, "chisholmWannairachchi_sp")
+        geom, "savostinTikhonov_sp")
     cdef double Dh = 2 * geom.b / geom.phi
+    cdef double psi = 2 * np.radians(geom.beta)
     cdef double m_channel = flowIn.m / N
     cdef double G = m_channel / (geom.b * W)
     cdef double p_avg = 0.5 * (flowIn.p() + flowOut.p())
     cdef double T_avg = 0.5 * (flowIn.T() + flowOut.T())
     cdef FlowState avg = flowIn.copyUpdateState(PT_INPUTS, p_avg, T_avg)
     cdef double Re = G * Dh / avg.visc()
-    cdef double Nu = 0.72 * Re**0.59 * avg.Pr()**0.4 * geom.phi**0.41 * (geom.beta /
-                                                             30)**0.66
+    cdef double a1 = 0.22 * (1 + 1.1 * psi**1.5)
+    cdef double a2 = 0.53 * (0.58 + 0.42 * np.cos(1.87 * psi))
+    cdef double f, Nu
+    if Re / geom.phi < 600:
+        f = 6.25 * (1 + 0.95 * psi**1.72) * geom.phi**1.84 * Re**-0.84
+        Nu = 1.26 * ((0.62 + 0.38 * cos(2.3 * psi)) * geom.phi**(1 - a1) * avg.Pr()**(1. / 3) * Re**a1)
+    else:
+        f = 0.95 * (0.62 + 0.38 * cos(2.6 * psi)) * geom.phi**(
+            1 + a2) * Re**(-a2)
+        Nu = 0.072*geom.phi**0.33*avg.Pr()**(1./3)*Re**0.67 \
+            * exp(0.5*psi+0.17*psi**2)
+    if Nu < 0.:
+        msg = "savostinTikhonov_sp calculated a negative Nu value"
+        log("error", msg)
+        warn(msg)
+    Nu = abs(Nu)
     cdef double h = htc(Nu, avg.k(), Dh)
-    cdef double f = 0.8 * Re**-0.25 * geom.phi**1.25 * (geom.beta / 30)**3.6
     cdef double dpF = dpf(f, G, L, Dh, avg.rho(), 1)
-    return {"h": h, "f": f, "dpF": dpF}
+    return HtResult(h=h, f=f, dpF=dpF)
 
 cpdef dict savostinTikhonov_sp(FlowState flowIn,
                                FlowState flowOut,
@@ -176,35 +245,33 @@ Returns
 -------
 dict of float : {"h", "f", "dpF"}
     """
+    cdef HtResult r = _savostinTikhonov_sp(flowIn, flowOut, N, geom, L, W, flowConfig, is_wf, geom2)
+    return {"h": r.h, "f": r.f, "dpF": r.dpF}
+
+cdef HtResult _muleyManglik_sp(FlowState flowIn,
+                               FlowState flowOut,
+                               int N,
+                               Geom geom,
+                               double L,
+                               double W,
+                               HxFlowConfig flowConfig,
+                               bint is_wf,
+                               Geom geom2) except *:
     assert type(geom) == gms.GeomHxPlateChevron, _assertGeomErrMsg(
-        geom, "savostinTikhonov_sp")
+        geom, "muleyManglik_sp")
     cdef double Dh = 2 * geom.b / geom.phi
-    cdef double psi = 2 * np.radians(geom.beta)
     cdef double m_channel = flowIn.m / N
     cdef double G = m_channel / (geom.b * W)
     cdef double p_avg = 0.5 * (flowIn.p() + flowOut.p())
     cdef double T_avg = 0.5 * (flowIn.T() + flowOut.T())
     cdef FlowState avg = flowIn.copyUpdateState(PT_INPUTS, p_avg, T_avg)
     cdef double Re = G * Dh / avg.visc()
-    cdef double a1 = 0.22 * (1 + 1.1 * psi**1.5)
-    cdef double a2 = 0.53 * (0.58 + 0.42 * np.cos(1.87 * psi))
-    cdef double f, Nu
-    if Re / geom.phi < 600:
-        f = 6.25 * (1 + 0.95 * psi**1.72) * geom.phi**1.84 * Re**-0.84
-        Nu = 1.26 * ((0.62 + 0.38 * cos(2.3 * psi)) * geom.phi**(1 - a1) * avg.Pr()**(1. / 3) * Re**a1)
-    else:
-        f = 0.95 * (0.62 + 0.38 * cos(2.6 * psi)) * geom.phi**(
-            1 + a2) * Re**(-a2)
-        Nu = 0.072*geom.phi**0.33*avg.Pr()**(1./3)*Re**0.67 \
-            * exp(0.5*psi+0.17*psi**2)
-    if Nu < 0.:
-        msg = "savostinTikhonov_sp calculated a negative Nu value"
-        log("error", msg)
-        warn(msg)
-    Nu = abs(Nu)
+    cdef double C0 = 90-geom.beta
+    cdef double Nu = (0.2668-0.006967*C0+7.244e-5*C0**2)*(20.78-50.94*geom.phi+41.16*geom.phi**2-10.51*geom.phi**3)*Re**(0.728+0.0543*sin(pi*C0/45+3.7))*avg.Pr()**(1./3)
     cdef double h = htc(Nu, avg.k(), Dh)
+    cdef double f = (2.917-0.1277*C0+2.016e-3*C0**2)*(5.474-19.02*geom.phi+18.93*geom.phi**2-5.341*geom.phi**3)*Re**-(0.2+0.0577*sin(pi*C0/45+2.1))
     cdef double dpF = dpf(f, G, L, Dh, avg.rho(), 1)
-    return {"h": h, "f": f, "dpF": dpF}
+    return HtResult(h=h, f=f, dpF=dpF)
 
 cpdef dict muleyManglik_sp(FlowState flowIn,
                            FlowState flowOut,
@@ -223,44 +290,23 @@ Returns
 -------
 dict of float : {"h", "f", "dpF"}
     """
-    assert type(geom) == gms.GeomHxPlateChevron, _assertGeomErrMsg(
-        geom, "muleyManglik_sp")
-    cdef double Dh = 2 * geom.b / geom.phi
-    cdef double m_channel = flowIn.m / N
-    cdef double G = m_channel / (geom.b * W)
-    cdef double p_avg = 0.5 * (flowIn.p() + flowOut.p())
-    cdef double T_avg = 0.5 * (flowIn.T() + flowOut.T())
-    cdef FlowState avg = flowIn.copyUpdateState(PT_INPUTS, p_avg, T_avg)
-    cdef double Re = G * Dh / avg.visc()
-    cdef double C0 = 90-geom.beta
-    cdef double Nu = (0.2668-0.006967*C0+7.244e-5*C0**2)*(20.78-50.94*geom.phi+41.16*geom.phi**2-10.51*geom.phi**3)*Re**(0.728+0.0543*sin(pi*C0/45+3.7))*avg.Pr()**(1./3)
-    cdef double h = htc(Nu, avg.k(), Dh)
-    cdef double f = (2.917-0.1277*C0+2.016e-3*C0**2)*(5.474-19.02*geom.phi+18.93*geom.phi**2-5.341*geom.phi**3)*Re**-(0.2+0.0577*sin(pi*C0/45+2.1))
-    cdef double dpF = dpf(f, G, L, Dh, avg.rho(), 1)
-    return {"h": h, "f": f, "dpF": dpF}
+    cdef HtResult r = _muleyManglik_sp(flowIn, flowOut, N, geom, L, W, flowConfig, is_wf, geom2)
+    return {"h": r.h, "f": r.f, "dpF": r.dpF}
 
 # -----------------------------------------------------------------
 # 2-phase boiling relations, plate exchangers
 # -----------------------------------------------------------------
 
 
-cpdef dict yanLin_tpEvap(FlowState flowIn,
-                         FlowState flowOut,
-                         int N,
-                         Geom geom,
-                         double L,
-                         double W,
-                         HxFlowConfig flowConfig,
-                         bint is_wf=True,
-                         Geom geom2=None):
-    """Two-phase evaporation, heat and friction, valid for GeomHxPlateChevron. [Yan1999]_ Yan, Y.-Y. & Lin, T.-F. Evaporation Heat Transfer and Pressure Drop of Refrigerant R-134a in a Plate Heat Exchanger Journal of Heat Transfer Engineering, 1999, 121, 118-127. `doi:10.1115/1.2825924 <http://doi.org/10.1115/1.2825924>`_
-
-Data collected for: R134a, beta=60deg, 2000<Re<8000.
-
-Returns
--------
-dict of float : {"h", "f", "dpF"}
-    """
+cdef HtResult _yanLin_tpEvap(FlowState flowIn,
+                             FlowState flowOut,
+                             int N,
+                             Geom geom,
+                             double L,
+                             double W,
+                             HxFlowConfig flowConfig,
+                             bint is_wf,
+                             Geom geom2) except *:
     assert type(geom) == gms.GeomHxPlateChevron, _assertGeomErrMsg(
         geom, "yanLin_tpEvap")
     cdef double Dh = 2 * geom.b / geom.phi
@@ -283,7 +329,27 @@ dict of float : {"h", "f", "dpF"}
     else:
         f = 31.21 * Re_eq**0.04557 / Re**0.5
     cdef double dpF = dpf(f, G, L, Dh, avg.rho(), 1)
-    return {"h": h, "f": f, "dpF": dpF}
+    return HtResult(h=h, f=f, dpF=dpF)
+
+cpdef dict yanLin_tpEvap(FlowState flowIn,
+                         FlowState flowOut,
+                         int N,
+                         Geom geom,
+                         double L,
+                         double W,
+                         HxFlowConfig flowConfig,
+                         bint is_wf=True,
+                         Geom geom2=None):
+    """Two-phase evaporation, heat and friction, valid for GeomHxPlateChevron. [Yan1999]_ Yan, Y.-Y. & Lin, T.-F. Evaporation Heat Transfer and Pressure Drop of Refrigerant R-134a in a Plate Heat Exchanger Journal of Heat Transfer Engineering, 1999, 121, 118-127. `doi:10.1115/1.2825924 <http://doi.org/10.1115/1.2825924>`_
+
+Data collected for: R134a, beta=60deg, 2000<Re<8000.
+
+Returns
+-------
+dict of float : {"h", "f", "dpF"}
+    """
+    cdef HtResult r = _yanLin_tpEvap(flowIn, flowOut, N, geom, L, W, flowConfig, is_wf, geom2)
+    return {"h": r.h, "f": r.f, "dpF": r.dpF}
 
 
 # -----------------------------------------------------------------
@@ -291,21 +357,15 @@ dict of float : {"h", "f", "dpF"}
 # -----------------------------------------------------------------
 
 
-cpdef dict hanLeeKim_tpCond(FlowState flowIn,
-                            FlowState flowOut,
-                            int N,
-                            Geom geom,
-                            double L,
-                            double W,
-                            HxFlowConfig flowConfig,
-                            bint is_wf=True,
-                            Geom geom2=None):
-    r"""Two-phase condensation, heat and friction, valid for GeomHxPlateChevron.Data collected for: R410A and R22, with beta = 45, 35, 20deg. [Han2003]_ Han, D.-H.; Lee, K.-J. & Kim, Y.-H. The Characteristics of Condensation in Brazed Plate Heat Exchangers with Different Chevron Angles Korean Physical Society, 2003, 43, 66-73.
-
-Returns
---------
-dict of float : {"h", "f", "dpF"}
-    """
+cdef HtResult _hanLeeKim_tpCond(FlowState flowIn,
+                                FlowState flowOut,
+                                int N,
+                                Geom geom,
+                                double L,
+                                double W,
+                                HxFlowConfig flowConfig,
+                                bint is_wf,
+                                Geom geom2) except *:
     assert type(geom) == gms.GeomHxPlateChevron, _assertGeomErrMsg(
         geom, "hanLeeKim_tpCond")
     cdef double x_avg = 0.5 * (flowIn.x() + flowOut.x())
@@ -333,7 +393,25 @@ dict of float : {"h", "f", "dpF"}
     cdef double f = Ge3 * Re_eq**Ge4
     cdef double h = htc(Nu, avg.k(), Dh)
     cdef double dpF = f * L * N * G_eq**2 / Dh / avg.rho()
-    return {"h": h, "f": f, "dpF": dpF}
+    return HtResult(h=h, f=f, dpF=dpF)
+
+cpdef dict hanLeeKim_tpCond(FlowState flowIn,
+                            FlowState flowOut,
+                            int N,
+                            Geom geom,
+                            double L,
+                            double W,
+                            HxFlowConfig flowConfig,
+                            bint is_wf=True,
+                            Geom geom2=None):
+    r"""Two-phase condensation, heat and friction, valid for GeomHxPlateChevron.Data collected for: R410A and R22, with beta = 45, 35, 20deg. [Han2003]_ Han, D.-H.; Lee, K.-J. & Kim, Y.-H. The Characteristics of Condensation in Brazed Plate Heat Exchangers with Different Chevron Angles Korean Physical Society, 2003, 43, 66-73.
+
+Returns
+--------
+dict of float : {"h", "f", "dpF"}
+    """
+    cdef HtResult r = _hanLeeKim_tpCond(flowIn, flowOut, N, geom, L, W, flowConfig, is_wf, geom2)
+    return {"h": r.h, "f": r.f, "dpF": r.dpF}
 
 
 # -----------------------------------------------------------------
@@ -341,21 +419,15 @@ dict of float : {"h", "f", "dpF"}
 # -----------------------------------------------------------------
 
 
-cpdef dict manglikBergles_offset_sp(FlowState flowIn,
-                                    FlowState flowOut,
-                                    int N,
-                                    Geom geom,
-                                    double L,
-                                    double W,
-                                    HxFlowConfig flowConfig,
-                                    bint is_wf=True,
-                                    Geom geom2=None):
-    """Single-phase and two-phase (evaporation and condensation), heat and friction, valid for GeomHxPlateFinOffset. [Manglik1995]_ Manglik and Bergles, Heat transfer and pressure drop correlations for the rectangular offset strip fin compact heat exchanger, Experimental Thermal and Fluid Science, Elsevier, 1995, 10, pp. 171-180. `doi:10.1016/0894-1777(94)00096-Q <http://doi.org/10.1016/0894-1777(94)00096-Q>`_.
-
-Returns
--------
-dict of float : {"h", "f", "dpF"}
-    """
+cdef HtResult _manglikBergles_offset_sp(FlowState flowIn,
+                                        FlowState flowOut,
+                                        int N,
+                                        Geom geom,
+                                        double L,
+                                        double W,
+                                        HxFlowConfig flowConfig,
+                                        bint is_wf,
+                                        Geom geom2) except *:
     assert type(geom) == gms.GeomHxPlateFinOffset, _assertGeomErrMsg(
         geom, "manglikBergles_offset_sp")
     cdef double alpha = geom.s / geom.h
@@ -385,14 +457,9 @@ dict of float : {"h", "f", "dpF"}
     cdef double h = htc(Nu, avg.k(), Dh)
     # dpF = dpf(f, G, geom.l, Dh, avg.rho())
     cdef double dpF = dpf(f, G, L, Dh, avg.rho(), 1)
-    return {"h": h, "f": f, "dpF": dpF}
-
-
-# -----------------------------------------------------------------
-# single-phase relations, smooth parallel plates
-# -----------------------------------------------------------------
+    return HtResult(h=h, f=f, dpF=dpF)
 
-cpdef dict shibani_sp_h(FlowState flowIn,
+cpdef dict manglikBergles_offset_sp(FlowState flowIn,
                                     FlowState flowOut,
                                     int N,
                                     Geom geom,
@@ -401,12 +468,29 @@ cpdef dict shibani_sp_h(FlowState flowIn,
                                     HxFlowConfig flowConfig,
                                     bint is_wf=True,
                                     Geom geom2=None):
-    """Single-phase , heat, valid for GeomHxPlateSmootht. [Shibani1977]_ Shibani and Ozisik, "A solution to heat transfer in turbulent flow between parallel plates", International Journal of Heat and Mass Transfer, vol. 20-5, pp 565--573, 1977, Elsevier.
+    """Single-phase and two-phase (evaporation and condensation), heat and friction, valid for GeomHxPlateFinOffset. [Manglik1995]_ Manglik and Bergles, Heat transfer and pressure drop correlations for the rectangular offset strip fin compact heat exchanger, Experimental Thermal and Fluid Science, Elsevier, 1995, 10, pp. 171-180. `doi:10.1016/0894-1777(94)00096-Q <http://doi.org/10.1016/0894-1777(94)00096-Q>`_.
 
 Returns
 -------
-dict of float : {"h"}
+dict of float : {"h", "f", "dpF"}
     """
+    cdef HtResult r = _manglikBergles_offset_sp(flowIn, flowOut, N, geom, L, W, flowConfig, is_wf, geom2)
+    return {"h": r.h, "f": r.f, "dpF": r.dpF}
+
+
+# -----------------------------------------------------------------
+# single-phase relations, smooth parallel plates
+# -----------------------------------------------------------------
+
+cdef HtResult _shibani_sp_h(FlowState flowIn,
+                            FlowState flowOut,
+                            int N,
+                            Geom geom,
+                            double L,
+                            double W,
+                            HxFlowConfig flowConfig,
+                            bint is_wf,
+                            Geom geom2) except *:
     assert type(geom) == gms.GeomHxPlateSmooth, _assertGeomErrMsg(
         geom, "shibani_sp_h")
     cdef double De = 2*geom.b # equivalent diameter
@@ -423,9 +507,9 @@ dict of float : {"h"}
     else:
         Nu = 12 + 0.03*Re**(0.88-0.24/(3.6+Pr))*Pr**(0.33+0.5*exp(-0.6*Pr))
     cdef double h = htc(Nu, avg.k(), De)
-    return {"h": h}
+    return HtResult(h=h, f=nan, dpF=nan)
 
-cpdef dict rothfus_sp_f(FlowState flowIn,
+cpdef dict shibani_sp_h(FlowState flowIn,
                                     FlowState flowOut,
                                     int N,
                                     Geom geom,
@@ -434,14 +518,24 @@ cpdef dict rothfus_sp_f(FlowState flowIn,
                                     HxFlowConfig flowConfig,
                                     bint is_wf=True,
                                     Geom geom2=None):
-    """Single-phase , friction, valid for GeomHxPlateSmootht. [Rothfus1957]_ Rothfus, R. R., Archer, D. H., Klimas, I. C., & Sikchi, K. G. (1957). Simplified flow calculations for tubes and parallel plates. AIChE Journal, 3(2), pp 208--212.
-
-This correlation comes from data fitting Fig. 4 for the turbulent region, giving the curve: f = 10**(-0.206771314*log10(Re)-1.296108505). For Re<3000, the viscous region relation is used: f = 24/Re. The transitional region, for now, will be treated as the turbulent region.
+    """Single-phase , heat, valid for GeomHxPlateSmootht. [Shibani1977]_ Shibani and Ozisik, "A solution to heat transfer in turbulent flow between parallel plates", International Journal of Heat and Mass Transfer, vol. 20-5, pp 565--573, 1977, Elsevier.
 
 Returns
 -------
-dict of float : {"f", "dpF"}
+dict of float : {"h"}
     """
+    cdef HtResult r = _shibani_sp_h(flowIn, flowOut, N, geom, L, W, flowConfig, is_wf, geom2)
+    return {"h": r.h}
+
+cdef HtResult _rothfus_sp_f(FlowState flowIn,
+                            FlowState flowOut,
+                            int N,
+                            Geom geom,
+                            double L,
+                            double W,
+                            HxFlowConfig flowConfig,
+                            bint is_wf,
+                            Geom geom2) except *:
     assert type(geom) == gms.GeomHxPlateSmooth, _assertGeomErrMsg(
         geom, "shibani_sp_h")
     cdef double De = 2*geom.b # equivalent diameter
@@ -457,28 +551,42 @@ dict of float : {"f", "dpF"}
     else:
         f = 10**(-0.206771314*log10(Re)-1.296108505)
     cdef double dpF = dpf(f, G, L, De, avg.rho(), 1)
-    return {"f": f, "dpF": dpF}
-    
+    return HtResult(h=nan, f=f, dpF=dpF)
 
-# -----------------------------------------------------------------
-# Two-phase relations, smooth parallel plates
-# -----------------------------------------------------------------
+cpdef dict rothfus_sp_f(FlowState flowIn,
+                                    FlowState flowOut,
+                                    int N,
+                                    Geom geom,
+                                    double L,
+                                    double W,
+                                    HxFlowConfig flowConfig,
+                                    bint is_wf=True,
+                                    Geom geom2=None):
+    """Single-phase , friction, valid for GeomHxPlateSmootht. [Rothfus1957]_ Rothfus, R. R., Archer, D. H., Klimas, I. C., & Sikchi, K. G. (1957). Simplified flow calculations for tubes and parallel plates. AIChE Journal, 3(2), pp 208--212.
 
-cpdef dict huang_tpEvap_h(FlowState flowIn,
-                         FlowState flowOut,
-                         int N,
-                         Geom geom,
-                         double L,
-                         double W,
-                         HxFlowConfig flowConfig,
-                         bint is_wf=True,
-                         Geom geom2=None):
-    """Two-phase evaporation, heat, valid for GeomHxPlateSmooth. [Huang2012]_ Huang, Y. P., Huang, J., Ma, J., Wang, Y. L., Wang, J. F., & Wang, Q. W. (2012). Single and Two-Phase Heat Transfer Enhancement Using Longitudinal Vortex Generator in Narrow Rectangular Channel. In An Overview of Heat Transfer Phenomena. IntechOpen,`doi:10.5772/53713 <http://doi.org/10.5772/53713>`_
+This correlation comes from data fitting Fig. 4 for the turbulent region, giving the curve: f = 10**(-0.206771314*log10(Re)-1.296108505). For Re<3000, the viscous region relation is used: f = 24/Re. The transitional region, for now, will be treated as the turbulent region.
 
 Returns
 -------
-dict of float : {"h"}
+dict of float : {"f", "dpF"}
     """
+    cdef HtResult r = _rothfus_sp_f(flowIn, flowOut, N, geom, L, W, flowConfig, is_wf, geom2)
+    return {"f": r.f, "dpF": r.dpF}
+    
+
+# -----------------------------------------------------------------
+# Two-phase relations, smooth parallel plates
+# -----------------------------------------------------------------
+
+cdef HtResult _huang_tpEvap_h(FlowState flowIn,
+                              FlowState flowOut,
+                              int N,
+                              Geom geom,
+                              double L,
+                              double W,
+                              HxFlowConfig flowConfig,
+                              bint is_wf,
+                              Geom geom2) except *:
     assert type(geom) == gms.GeomHxPlateSmooth, _assertGeomErrMsg(
         geom, "huang_tpEvap_h")
     cdef double b = geom.b
@@ -496,16 +604,9 @@ dict of float : {"h"}
     cdef double q = m_channel * (flowOut.h() - flowIn.h()) / (W * L)
     cdef double Bo = abs(q / G / (vap.h() - liq.h()))
     cdef double h = 1.40*Re*Bo**0.349*avg.k()/Dh
-    return {"h": h}
-
-
-# -----------------------------------------------------------------
-# single-phase relations, circular smooth ducts
-# -----------------------------------------------------------------
-
+    return HtResult(h=h, f=nan, dpF=nan)
 
-
-cpdef dict gnielinski_sp(FlowState flowIn,
+cpdef dict huang_tpEvap_h(FlowState flowIn,
                          FlowState flowOut,
                          int N,
                          Geom geom,
@@ -514,12 +615,31 @@ cpdef dict gnielinski_sp(FlowState flowIn,
                          HxFlowConfig flowConfig,
                          bint is_wf=True,
                          Geom geom2=None):
-    """Single-phase, heat and friction, valid for GeomDuctCircular, GeomHxPlateSmooth. [Gnielinski1976]_ V. Gnielinski, "New Equations for Heat and Mass Transfer in Turbulent Pipe and Channel Flow," Int. Chem. Eng., (16): 359-368, 1976.
+    """Two-phase evaporation, heat, valid for GeomHxPlateSmooth. [Huang2012]_ Huang, Y. P., Huang, J., Ma, J., Wang, Y. L., Wang, J. F., & Wang, Q. W. (2012). Single and Two-Phase Heat Transfer Enhancement Using Longitudinal Vortex Generator in Narrow Rectangular Channel. In An Overview of Heat Transfer Phenomena. IntechOpen,`doi:10.5772/53713 <http://doi.org/10.5772/53713>`_
 
 Returns
 -------
-dict of float : {"h", "f", "dpF"}
+dict of float : {"h"}
     """
+    cdef HtResult r = _huang_tpEvap_h(flowIn, flowOut, N, geom, L, W, flowConfig, is_wf, geom2)
+    return {"h": r.h}
+
+
+# -----------------------------------------------------------------
+# single-phase relations, circular smooth ducts
+# -----------------------------------------------------------------
+
+
+
+cdef HtResult _gnielinski_sp(FlowState flowIn,
+                             FlowState flowOut,
+                             int N,
+                             Geom geom,
+                             double L,
+                             double W,
+                             HxFlowConfig flowConfig,
+                             bint is_wf,
+                             Geom geom2) except *:
     assert type(geom) in [gms.GeomHxPlateFinStraight], _assertGeomErrMsg(
         geom, "gnielinski_sp")
     cdef double Dh, De, Ac
@@ -552,23 +672,35 @@ dict of float : {"h", "f", "dpF"}
         Nu = f / 2 * (Re - 1000) * Pr / (1 + 12.7 * np.sqrt(f / 2) *
                                          (Pr**(2 / 3) - 1))
     cdef double h = htc(Nu, avg.k(), De)
-    return {"h": h, "f": f, "dpF": dpF}
+    return HtResult(h=h, f=f, dpF=dpF)
 
-cpdef dict bhattiShah_sp_f(FlowState flowIn,
-                              FlowState flowOut,
-                              int N,
-                              Geom geom,
-                              double L,
-                              double W,
-                              HxFlowConfig flowConfig,
-                              bint is_wf=True,
-                              Geom geom2=None):
-    """Single-phase, friction, valid for GeomHxPlateFinStraight, taken from Shah 2003 Fundamentals of Heat Exchanger Design.
+cpdef dict gnielinski_sp(FlowState flowIn,
+                         FlowState flowOut,
+                         int N,
+                         Geom geom,
+                         double L,
+                         double W,
+                         HxFlowConfig flowConfig,
+                         bint is_wf=True,
+                         Geom geom2=None):
+    """Single-phase, heat and friction, valid for GeomDuctCircular, GeomHxPlateSmooth. [Gnielinski1976]_ V. Gnielinski, "New Equations for Heat and Mass Transfer in Turbulent Pipe and Channel Flow," Int. Chem. Eng., (16): 359-368, 1976.
 
 Returns
 -------
-    dict of float : {'f', 'dpF'}
-"""
+dict of float : {"h", "f", "dpF"}
+    """
+    cdef HtResult r = _gnielinski_sp(flowIn, flowOut, N, geom, L, W, flowConfig, is_wf, geom2)
+    return {"h": r.h, "f": r.f, "dpF": r.dpF}
+
+cdef HtResult _bhattiShah_sp_f(FlowState flowIn,
+                               FlowState flowOut,
+                               int N,
+                               Geom geom,
+                               double L,
+                               double W,
+                               HxFlowConfig flowConfig,
+                               bint is_wf,
+                               Geom geom2) except *:
     assert type(geom) in [gms.GeomHxPlateFinStraight], _assertGeomErrMsg(
         geom, "bhattiShah_sp_f")
     cdef double Dh, De, Ac, a, b
@@ -589,9 +721,9 @@ Returns
     cdef double f = 0.00128 + 0.1143*Re_De**-0.311
     cdef double dpF = dpf(f, G, L, De, avg.rho(), 1)
     #print("f={},dpF={}, Ac={}, De={}, Re_De={}, G={}".format(f, dpF, Ac, De, Re_De, G))
-    return {"f": f, "dpF": dpF}
+    return HtResult(h=nan, f=f, dpF=dpF)
 
-cpdef dict petukhovPopov_sp_h(FlowState flowIn,
+cpdef dict bhattiShah_sp_f(FlowState flowIn,
                               FlowState flowOut,
                               int N,
                               Geom geom,
@@ -600,12 +732,24 @@ cpdef dict petukhovPopov_sp_h(FlowState flowIn,
                               HxFlowConfig flowConfig,
                               bint is_wf=True,
                               Geom geom2=None):
-    """Single-phase, heat, valid for GeomHxPlateFinStraight, taken from Shah 2003 Fundamentals of Heat Exchanger Design, using Bhatti & Shah relation for the friction factor.
+    """Single-phase, friction, valid for GeomHxPlateFinStraight, taken from Shah 2003 Fundamentals of Heat Exchanger Design.
 
 Returns
 -------
-dict of float : {"h"}
+    dict of float : {'f', 'dpF'}
 """
+    cdef HtResult r = _bhattiShah_sp_f(flowIn, flowOut, N, geom, L, W, flowConfig, is_wf, geom2)
+    return {"f": r.f, "dpF": r.dpF}
+
+cdef HtResult _petukhovPopov_sp_h(FlowState flowIn,
+                                  FlowState flowOut,
+                                  int N,
+                                  Geom geom,
+                                  double L,
+                                  double W,
+                                  HxFlowConfig flowConfig,
+                                  bint is_wf,
+                                  Geom geom2) except *:
     assert type(geom) in [gms.GeomHxPlateFinStraight], _assertGeomErrMsg(
         geom, "petukhovPopov_sp_h")
     cdef double Dh, Dl, Ac, a, b
@@ -627,9 +771,9 @@ dict of float : {"h"}
     cdef double f = 0.00128 + 0.1143*Re_De**-0.311
     cdef double Nu = (f/2*Re_Dh*Pr)/(1.07+900/Re_Dh-0.63/(1+10*Pr)+12.7*(f/2)**0.5*(Pr**(2./3)-1))
     cdef double h = htc(Nu, avg.k(), Dh)
-    return {"h": h}
+    return HtResult(h=h, f=nan, dpF=nan)
 
-cpdef dict dittusBoelter_sp_h(FlowState flowIn,
+cpdef dict petukhovPopov_sp_h(FlowState flowIn,
                               FlowState flowOut,
                               int N,
                               Geom geom,
@@ -638,12 +782,24 @@ cpdef dict dittusBoelter_sp_h(FlowState flowIn,
                               HxFlowConfig flowConfig,
                               bint is_wf=True,
                               Geom geom2=None):
-    """Single-phase, heat, valid for GeomDuctCircular, GeomHxPlateSmooth. [Kakaç1998]_ Kakaç, S. & Liu, H. Heat exchangers : selection, rating, and thermal design, CRC Press, 1998.
+    """Single-phase, heat, valid for GeomHxPlateFinStraight, taken from Shah 2003 Fundamentals of Heat Exchanger Design, using Bhatti & Shah relation for the friction factor.
 
 Returns
 -------
 dict of float : {"h"}
 """
+    cdef HtResult r = _petukhovPopov_sp_h(flowIn, flowOut, N, geom, L, W, flowConfig, is_wf, geom2)
+    return {"h": r.h}
+
+cdef HtResult _dittusBoelter_sp_h(FlowState flowIn,
+                                  FlowState flowOut,
+                                  int N,
+                                  Geom geom,
+                                  double L,
+                                  double W,
+                                  HxFlowConfig flowConfig,
+                                  bint is_wf,
+                                  Geom geom2) except *:
     assert type(geom) in [gms.GeomHxPlateFinStraight, gms.GeomHxPlateSmooth], _assertGeomErrMsg(
         geom, "dittusBoelter_sp_h")
     cdef double Dh, De, Ac, a, b
@@ -666,7 +822,25 @@ dict of float : {"h"}
     cdef double Re = G * Dh / avg.visc()
     cdef double Nu = 0.023 * Re**0.8 * avg.Pr()**0.4
     cdef double h = htc(Nu, avg.k(), De)
-    return {"h": h}
+    return HtResult(h=h, f=nan, dpF=nan)
+
+cpdef dict dittusBoelter_sp_h(FlowState flowIn,
+                              FlowState flowOut,
+                              int N,
+                              Geom geom,
+                              double L,
+                              double W,
+                              HxFlowConfig flowConfig,
+                              bint is_wf=True,
+                              Geom geom2=None):
+    """Single-phase, heat, valid for GeomDuctCircular, GeomHxPlateSmooth. [Kakaç1998]_ Kakaç, S. & Liu, H. Heat exchangers : selection, rating, and thermal design, CRC Press, 1998.
+
+Returns
+-------
+dict of float : {"h"}
+"""
+    cdef HtResult r = _dittusBoelter_sp_h(flowIn, flowOut, N, geom, L, W, flowConfig, is_wf, geom2)
+    return {"h": r.h}
 
 def shah_sp_h(flowIn,
               flowOut,
@@ -704,21 +878,15 @@ dict of float : {"h"}
     h = htc(Nu, avg.k(), De)
     return {"h": h}
 
-cpdef dict techo_sp_f(FlowState flowIn,
-                              FlowState flowOut,
-                              int N,
-                              Geom geom,
-                              double L,
-                              double W,
-                              HxFlowConfig flowConfig,
-                              bint is_wf=True,
-                              Geom geom2=None):
-    """Single-phase, friction, valid for GeomDuctCircular, GeomHxPlateFinStraight. [Techo1965]_ R. Techo, R. R. Tickner, and R. E. James, "An Accurate Equation for the Computation of the Friction Factor for Smooth Pipes from the Reynolds Number," J. Appl. Mech. (32): 443, 1965.
-
-Returns
--------
-dict of float : {"f", "dpF"}
-    """
+cdef HtResult _techo_sp_f(FlowState flowIn,
+                          FlowState flowOut,
+                          int N,
+                          Geom geom,
+                          double L,
+                          double W,
+                          HxFlowConfig flowConfig,
+                          bint is_wf,
+                          Geom geom2) except *:
     assert type(geom) == gms.GeomHxPlateFinStraight, _assertGeomErrMsg(
         geom, "techo_sp_f")
     cdef double Dh, Dl, Ac, a, b
@@ -737,7 +905,305 @@ dict of float : {"f", "dpF"}
     cdef double Re = G * De / avg.visc()
     cdef double f = (0.86859 * np.log(Re / (1.964 * np.log(Re) - 3.8215)))**-2
     cdef double dpF = dpf(f, G, L, De, avg.rho(), 1)
-    return {"f": f, "dpF": dpF}
+    return HtResult(h=nan, f=f, dpF=dpF)
+
+cpdef dict techo_sp_f(FlowState flowIn,
+                              FlowState flowOut,
+                              int N,
+                              Geom geom,
+                              double L,
+                              double W,
+                              HxFlowConfig flowConfig,
+                              bint is_wf=True,
+                              Geom geom2=None):
+    """Single-phase, friction, valid for GeomDuctCircular, GeomHxPlateFinStraight. [Techo1965]_ R. Techo, R. R. Tickner, and R. E. James, "An Accurate Equation for the Computation of the Friction Factor for Smooth Pipes from the Reynolds Number," J. Appl. Mech. (32): 443, 1965.
+
+Returns
+-------
+dict of float : {"f", "dpF"}
+    """
+    cdef HtResult r = _techo_sp_f(flowIn, flowOut, N, geom, L, W, flowConfig, is_wf, geom2)
+    return {"f": r.f, "dpF": r.dpF}
+
+cdef HtMethod getMethod(str method):
+    """HtMethod: C-level implementation of the named method, for calling without building a dict of results. Returns NULL if the method has none, in which case the method must be called through Python."""
+    if method == "chisholmWannairachchi_sp":
+        return _chisholmWannairachchi_sp
+    elif method == "savostinTikhonov_sp":
+        return _savostinTikhonov_sp
+    elif method == "muleyManglik_sp":
+        return _muleyManglik_sp
+    elif method == "yanLin_tpEvap":
+        return _yanLin_tpEvap
+    elif method == "hanLeeKim_tpCond":
+        return _hanLeeKim_tpCond
+    elif method == "manglikBergles_offset_sp":
+        return _manglikBergles_offset_sp
+    elif method == "shibani_sp_h":
+        return _shibani_sp_h
+    elif method == "rothfus_sp_f":
+        return _rothfus_sp_f
+    elif method == "huang_tpEvap_h":
+        return _huang_tpEvap_h
+    elif method == "gnielinski_sp":
+        return _gnielinski_sp
+    elif method == "bhattiShah_sp_f":
+        return _bhattiShah_sp_f
+    elif method == "petukhovPopov_sp_h":
+        return _petukhovPopov_sp_h
+    elif method == "dittusBoelter_sp_h":
+        return _dittusBoelter_sp_h
+    elif method == "techo_sp_f":
+        return _techo_sp_f
+    return NULL
+
+# -----------------------------------------------------------------
+# Vectorised relations
+# -----------------------------------------------------------------
+
+cdef tuple _propsSingle = ('D', 'V', 'L', 'Prandtl', 'C')
+cdef tuple _propsKeys = ('rho', 'visc', 'k', 'Pr', 'cp')
+
+
+cdef object _propsSI(FlowState flow, unsigned char inputPair, input1, input2):
+    """numpy.ndarray: Properties _propsSingle (columns) of the fluid of flow at each pair of inputs (rows), from one call of CoolProp's vectorised PropsSI for pure fluids, falling back to updating a copy of flow point by point."""
+    cdef Py_ssize_t i, n = input1.shape[0]
+    cdef FlowState f
+    out = None
+    if type(flow) is FlowState and not flow.isMixture():
+        try:
+            if inputPair == PT_INPUTS:
+                out = CP.CoolProp.PropsSI(list(_propsSingle), 'P', input1, 'T', input2, "{}::{}".format(flow.eos, flow.fluid))
+            elif inputPair == PQ_INPUTS:
+                out = CP.CoolProp.PropsSI(list(_propsSingle), 'P', input1, 'Q', input2, "{}::{}".format(flow.eos, flow.fluid))
+            elif inputPair == HmassP_INPUTS:
+                out = CP.CoolProp.PropsSI(list(_propsSingle), 'H', input1, 'P', input2, "{}::{}".format(flow.eos, flow.fluid))
+            out = np.asarray(out, dtype=np.float64).reshape(n, len(_propsSingle))
+        except Exception:
+            out = None
+    if out is None:
+        out = np.full((n, len(_propsSingle)), nan)
+    if not np.all(np.isfinite(out)):
+        f = flow.copyUpdateState(0, nan, nan)
+        for i in range(n):
+            if not np.all(np.isfinite(out[i])):
+                try:
+                    f.updateState(inputPair, input1[i], input2[i])
+                    out[i] = (f.rho(), f.visc(), f.k(), f._state.Prandtl(), f._state.cpmass())
+                except Exception:
+                    out[i] = nan
+    return out
+
+
+cpdef dict flowProperties(FlowState flow, unsigned char inputPair, input1, input2):
+    """dict of numpy.ndarray: Properties of the fluid of flow at arrays of states, for the vectorised relations; "rho", "visc", "k", "Pr" and "cp". Pure fluids are evaluated by one call of CoolProp's vectorised PropsSI per set of states.
+
+For PQ_INPUTS (two-phase states), the saturated liquid and vapour properties at each pressure are also returned as "rhoLiq", "rhoVap", "viscLiq", "viscVap", "kLiq", "PrLiq", "hLiq" and "hVap", and "Pr" and "cp" are interpolated linearly in quality between them, as by FlowState.Pr() and FlowState.cp().
+
+Parameters
+-----------
+flow : FlowState
+    FlowState of the fluid.
+inputPair : unsigned char
+    PT_INPUTS, PQ_INPUTS or HmassP_INPUTS.
+input1, input2 : array_like
+    Values of the inputs, in the order of inputPair, broadcast to the same length.
+    """
+    input1, input2 = np.broadcast_arrays(np.atleast_1d(np.asarray(input1, dtype=np.float64)), np.atleast_1d(np.asarray(input2, dtype=np.float64)))
+    cdef str msg
+    if inputPair != PT_INPUTS and inputPair != PQ_INPUTS and inputPair != HmassP_INPUTS:
+        msg = "flowProperties(): inputPair must be PT_INPUTS, PQ_INPUTS or HmassP_INPUTS (given: {})".format(inputPair)
+        raise ValueError(msg)
+    cdef dict props = dict(zip(_propsKeys, _propsSI(flow, inputPair, input1, input2).T))
+    if inputPair == PQ_INPUTS:
+        liq = _propsSI(flow, PQ_INPUTS, input1, np.zeros(input1.shape[0]))
+        vap = _propsSI(flow, PQ_INPUTS, input1, np.ones(input1.shape[0]))
+        props['x'] = input2
+        props['rhoLiq'] = liq[:, 0]
+        props['rhoVap'] = vap[:, 0]
+        props['viscLiq'] = liq[:, 1]
+        props['viscVap'] = vap[:, 1]
+        props['kLiq'] = liq[:, 2]
+        props['PrLiq'] = liq[:, 3]
+        props['Pr'] = liq[:, 3] + input2 * (vap[:, 3] - liq[:, 3])
+        props['cp'] = liq[:, 4] + input2 * (vap[:, 4] - liq[:, 4])
+        if type(flow) is FlowState and not flow.isMixture():
+            fluid = "{}::{}".format(flow.eos, flow.fluid)
+            props['hLiq'] = np.asarray(CP.CoolProp.PropsSI('H', 'P', input1, 'Q', 0, fluid), dtype=np.float64)
+            props['hVap'] = np.asarray(CP.CoolProp.PropsSI('H', 'P', input1, 'Q', 1, fluid), dtype=np.float64)
+        else:
+            props['hLiq'] = np.array([flow.copyUpdateState(PQ_INPUTS, p, 0).h() for p in input1])
+            props['hVap'] = np.array([flow.copyUpdateState(PQ_INPUTS, p, 1).h() for p in input1])
+    return props
+
+
+cpdef dict chisholmWannairachchi_sp_vec(dict props, int N, Geom geom, L, double W):
+    """Vectorised :meth:`chisholmWannairachchi_sp` for arrays of units; the correlation is evaluated by NumPy operations on arrays of properties.
+
+Parameters
+-----------
+props : dict of array_like
+    Mass flow rate "m" [kg/s] through all N channels and the properties "rho", "visc", "k" and "Pr" averaged over each unit (at the average pressure and temperature, see :meth:`flowProperties`).
+N : int
+    Number of parallel flow channels of the fluid.
+geom : Geom
+    Geometry of the channels.
+L : float or array_like
+    Length of each unit [m].
+W : float
+    Width of the units [m].
+
+Returns
+-------
+dict of numpy.ndarray : {"h", "f", "dpF"}
+    """
+    assert type(geom) == gms.GeomHxPlateChevron, _assertGeomErrMsg(
+        geom, "chisholmWannairachchi_sp_vec")
+    cdef double Dh = 2 * geom.b / geom.phi
+    G = np.asarray(props['m']) / N / (geom.b * W)
+    Re = G * Dh / props['visc']
+    Nu = 0.72 * Re**0.59 * props['Pr']**0.4 * geom.phi**0.41 * (geom.beta / 30)**0.66
+    f = 0.8 * Re**-0.25 * geom.phi**1.25 * (geom.beta / 30)**3.6
+    return {"h": Nu * props['k'] / Dh, "f": f, "dpF": f * 2 * G**2 * np.asarray(L) / Dh / props['rho']}
+
+
+cpdef dict savostinTikhonov_sp_vec(dict props, int N, Geom geom, L, double W):
+    """Vectorised :meth:`savostinTikhonov_sp` for arrays of units. Parameters as :meth:`chisholmWannairachchi_sp_vec`.
+
+Returns
+-------
+dict of numpy.ndarray : {"h", "f", "dpF"}
+    """
+    assert type(geom) == gms.GeomHxPlateChevron, _assertGeomErrMsg(
+        geom, "savostinTikhonov_sp_vec")
+    cdef double Dh = 2 * geom.b / geom.phi
+    cdef double psi = 2 * np.radians(geom.beta)
+    cdef double a1 = 0.22 * (1 + 1.1 * psi**1.5)
+    cdef double a2 = 0.53 * (0.58 + 0.42 * np.cos(1.87 * psi))
+    G = np.asarray(props['m']) / N / (geom.b * W)
+    Re = G * Dh / props['visc']
+    Pr3 = props['Pr']**(1. / 3)
+    laminar = Re / geom.phi < 600
+    f = np.where(laminar,
+                 6.25 * (1 + 0.95 * psi**1.72) * geom.phi**1.84 * Re**-0.84,
+                 0.95 * (0.62 + 0.38 * cos(2.6 * psi)) * geom.phi**(1 + a2) * Re**(-a2))
+    Nu = np.where(laminar,
+                  1.26 * ((0.62 + 0.38 * cos(2.3 * psi)) * geom.phi**(1 - a1) * Pr3 * Re**a1),
+                  0.072 * geom.phi**0.33 * Pr3 * Re**0.67 * exp(0.5 * psi + 0.17 * psi**2))
+    if np.any(Nu < 0.):
+        warn("savostinTikhonov_sp_vec calculated a negative Nu value")
+    return {"h": np.abs(Nu) * props['k'] / Dh, "f": f, "dpF": f * 2 * G**2 * np.asarray(L) / Dh / props['rho']}
+
+
+cpdef dict muleyManglik_sp_vec(dict props, int N, Geom geom, L, double W):
+    """Vectorised :meth:`muleyManglik_sp` for arrays of units. Parameters as :meth:`chisholmWannairachchi_sp_vec`.
+
+Returns
+-------
+dict of numpy.ndarray : {"h", "f", "dpF"}
+    """
+    assert type(geom) == gms.GeomHxPlateChevron, _assertGeomErrMsg(
+        geom, "muleyManglik_sp_vec")
+    cdef double Dh = 2 * geom.b / geom.phi
+    cdef double C0 = 90 - geom.beta
+    G = np.asarray(props['m']) / N / (geom.b * W)
+    Re = G * Dh / props['visc']
+    Nu = (0.2668-0.006967*C0+7.244e-5*C0**2)*(20.78-50.94*geom.phi+41.16*geom.phi**2-10.51*geom.phi**3)*Re**(0.728+0.0543*sin(pi*C0/45+3.7))*props['Pr']**(1./3)
+    f = (2.917-0.1277*C0+2.016e-3*C0**2)*(5.474-19.02*geom.phi+18.93*geom.phi**2-5.341*geom.phi**3)*Re**-(0.2+0.0577*sin(pi*C0/45+2.1))
+    return {"h": Nu * props['k'] / Dh, "f": f, "dpF": f * 2 * G**2 * np.asarray(L) / Dh / props['rho']}
+
+
+cpdef dict yanLin_tpEvap_vec(dict props, int N, Geom geom, L, double W):
+    """Vectorised :meth:`yanLin_tpEvap` for arrays of units. Parameters as :meth:`chisholmWannairachchi_sp_vec`, except props are at the average pressure and quality of each unit (PQ_INPUTS, see :meth:`flowProperties`) and must also include the change of specific enthalpy "dh" [J/kg] over each unit.
+
+Returns
+-------
+dict of numpy.ndarray : {"h", "f", "dpF"}
+    """
+    assert type(geom) == gms.GeomHxPlateChevron, _assertGeomErrMsg(
+        geom, "yanLin_tpEvap_vec")
+    cdef double Dh = 2 * geom.b / geom.phi
+    L = np.asarray(L)
+    x = props['x']
+    mChannel = np.asarray(props['m']) / N
+    G = mChannel / (geom.b * W)
+    G_eq = G * (1 - x + x * (props['rhoLiq'] / props['rhoVap'])**0.5)
+    Re = G * Dh / props['visc']
+    Re_eq = G_eq * Dh / props['visc']
+    q = mChannel * props['dh'] / (W * L)
+    Bo_eq = np.abs(q / G_eq / (props['hVap'] - props['hLiq']))
+    h = 1.926 * Re_eq / (props['PrLiq']**(-1. / 3) * Re**0.5 * Bo_eq**-0.3 * Dh / props['kLiq'])
+    f = np.where(Re_eq < 6000, 6.947e5 * Re_eq**-1.109 / Re**0.5, 31.21 * Re_eq**0.04557 / Re**0.5)
+    return {"h": h, "f": f, "dpF": f * 2 * G**2 * L / Dh / props['rho']}
+
+
+cpdef dict hanLeeKim_tpCond_vec(dict props, int N, Geom geom, L, double W):
+    """Vectorised :meth:`hanLeeKim_tpCond` for arrays of units. Parameters as :meth:`chisholmWannairachchi_sp_vec`, except props are at the average pressure and quality of each unit (PQ_INPUTS, see :meth:`flowProperties`).
+
+Returns
+-------
+dict of numpy.ndarray : {"h", "f", "dpF"}
+    """
+    assert type(geom) == gms.GeomHxPlateChevron, _assertGeomErrMsg(
+        geom, "hanLeeKim_tpCond_vec")
+    cdef double beta = np.radians(geom.beta)
+    cdef double Dh = 2 * geom.b / geom.phi
+    cdef double X1 = geom.pitch / Dh
+    cdef double X2 = np.pi / 2 - beta
+    cdef double Ge1 = 11.22 * X1**-2.83 * X2**-4.5
+    cdef double Ge2 = 0.35 * X1**0.23 * X2**1.48
+    cdef double Ge3 = 3521.1 * X1**4.17 * X2**-7.75
+    cdef double Ge4 = -1.024 * X1**0.0925 * X2**-1.3
+    x = props['x']
+    G = np.asarray(props['m']) / N / (geom.b * W)
+    G_eq = G * (1 - x + x * (props['rhoLiq'] / props['rhoVap'])**0.5)
+    Re_eq = G_eq * Dh / props['viscLiq']
+    Nu = Ge1 * (Re_eq**Ge2) * (props['Pr']**(1. / 3))
+    f = Ge3 * Re_eq**Ge4
+    return {"h": Nu * props['k'] / Dh, "f": f, "dpF": f * np.asarray(L) * N * G_eq**2 / Dh / props['rho']}
+
+
+cpdef dict manglikBergles_offset_sp_vec(dict props, int N, Geom geom, L, double W):
+    """Vectorised :meth:`manglikBergles_offset_sp` for arrays of units. Parameters as :meth:`chisholmWannairachchi_sp_vec`, except props are at the average pressure and specific enthalpy of each unit (HmassP_INPUTS, see :meth:`flowProperties`).
+
+Returns
+-------
+dict of numpy.ndarray : {"h", "f", "dpF"}
+    """
+    assert type(geom) == gms.GeomHxPlateFinOffset, _assertGeomErrMsg(
+        geom, "manglikBergles_offset_sp_vec")
+    cdef double alpha = geom.s / geom.h
+    cdef double delta = geom.t / geom.l
+    cdef double gamma = geom.t / geom.s
+    cdef double Dh = 4 * geom.s * geom.h * geom.l / (
+        2 * (geom.s * geom.l + geom.h * geom.l + geom.t * geom.h
+             ) + geom.t * geom.s)
+    cdef double Nfin = W / (geom.s + geom.t)
+    G = np.asarray(props['m']) / N / Nfin / (geom.s * geom.h)
+    Re = G * Dh / props['visc']
+    f = 9.6243 * (Re**-0.7422) * (alpha**-0.1856) * (delta**0.3053) * (
+        gamma**-0.2656) * (1 + 7.669e-8 * (Re**4.429) * (alpha**0.920) *
+                           (delta**3.767) * (gamma**0.236))**0.1
+    j = 0.6522 * (Re**-0.5403) * (alpha**-0.1541) * (delta**0.1499) * (
+        gamma**-0.0678) * (1 + 5.269e-5 * (Re**1.340) * (alpha**0.504) *
+                           (delta**0.456) * (gamma**-1.055))**0.1
+    Nu = j * Re * (props['Pr']**(1 / 3))
+    return {"h": Nu * props['k'] / Dh, "f": f, "dpF": f * 2 * G**2 * np.asarray(L) / Dh / props['rho']}
+
+
+cdef dict _vectorised = {
+    "chisholmWannairachchi_sp": (chisholmWannairachchi_sp_vec, PT_INPUTS),
+    "savostinTikhonov_sp": (savostinTikhonov_sp_vec, PT_INPUTS),
+    "muleyManglik_sp": (muleyManglik_sp_vec, PT_INPUTS),
+    "yanLin_tpEvap": (yanLin_tpEvap_vec, PQ_INPUTS),
+    "hanLeeKim_tpCond": (hanLeeKim_tpCond_vec, PQ_INPUTS),
+    "manglikBergles_offset_sp": (manglikBergles_offset_sp_vec, HmassP_INPUTS)
+}
+
+
+cpdef tuple getVectorised(str method):
+    """tuple: Vectorised counterpart of the named method and the input pair its averaged properties are evaluated at (see :meth:`flowProperties`), or None if the method has none."""
+    return _vectorised.get(method)
 
 # -----------------------------------------------------------------
 # 2-phase boiling relations, circular smooth ducts
@@ -1,4 +1,5 @@
 from .compressible_flow_relations import *
 from .conversions import *
+from .pinch import *
 from .saturation_curves import *
 from .standard_atmospheres import *
@@ -0,0 +1,258 @@
+"""Pinch analysis of heat exchangers: hot and cold composite curves evaluated on a dense grid of heat duty in one vectorised pass, and the working fluid mass flow rate that gives a target pinch-point temperature difference."""
+from .._constants cimport *
+from ..logger import log
+from ..bases.flowstate cimport FlowState
+from ..bases.solvers cimport Residual, find_root
+from math import nan, isnan
+import CoolProp.CoolProp as CP
+import numpy as np
+
+cdef str msg
+
+
+cpdef temperatures(FlowState flow, h, p):
+    """numpy.ndarray: Temperatures [K] of the fluid of flow at the enthalpies h [J/kg] and pressures p [Pa]. Pure fluids are evaluated by one call of CoolProp's vectorised PropsSI; mixtures, other FlowState types and any failed evaluation fall back to updating a copy of flow point by point.
+
+Parameters
+-----------
+flow : FlowState
+    FlowState of the fluid.
+h : array_like
+    Specific enthalpies [J/kg].
+p : float or array_like
+    Static pressure [Pa], either common to or one for each of h.
+    """
+    h = np.asarray(h, dtype=np.float64)
+    p = np.broadcast_to(np.asarray(p, dtype=np.float64), h.shape)
+    cdef FlowState f
+    cdef Py_ssize_t i
+    T = None
+    if type(flow) is FlowState and not flow.isMixture():
+        try:
+            T = np.asarray(CP.PropsSI('T', 'H', h, 'P', p, "{}::{}".format(flow.eos, flow.fluid)), dtype=np.float64)
+        except Exception:
+            T = None
+    if T is None:
+        T = np.full(h.shape[0], nan)
+    if not np.all(np.isfinite(T)):
+        f = flow.copyUpdateState(0, nan, nan)
+        for i in range(h.shape[0]):
+            if not np.isfinite(T[i]):
+                try:
+                    f.updateState(HmassP_INPUTS, h[i], p[i])
+                    T[i] = f.T()
+                except Exception:
+                    T[i] = nan
+    return T
+
+
+cdef list _kneeFractions(FlowState flow, double hStart, double hEnd):
+    """list: Fractions of the enthalpy change hStart to hEnd at which flow meets its saturation curve."""
+    cdef list fractions = []
+    cdef double hSat
+    cdef unsigned char q
+    if hEnd == hStart:
+        return fractions
+    for q in range(2):
+        try:
+            hSat = flow.copyUpdateState(PQ_INPUTS, flow.p(), q).h()
+        except Exception:
+            continue
+        if 0 < (hSat - hStart) / (hEnd - hStart) < 1:
+            fractions.append((hSat - hStart) / (hEnd - hStart))
+    return fractions
+
+
+cdef _grid(unsigned int N, list knees):
+    """numpy.ndarray: N evenly spaced fractions of heat duty from 0 to 1, with the saturation knees inserted."""
+    return np.unique(np.concatenate((np.linspace(0, 1, N), np.asarray(knees, dtype=np.float64))))
+
+
+cdef dict _curves(fraction, hHot, THot, hCold, TCold, double QTotal):
+    """dict: Composite curves and their pinch from temperatures on a grid of fractions of heat duty."""
+    dT = THot - TCold
+    cdef Py_ssize_t iPinch = int(np.nanargmin(dT)) if np.any(np.isfinite(dT)) else 0
+    Q = fraction * QTotal
+    return {
+        'Q': Q,
+        'hHot': hHot,
+        'THot': THot,
+        'hCold': hCold,
+        'TCold': TCold,
+        'dT': dT,
+        'pinch': dT[iPinch],
+        'iPinch': iPinch,
+        'QPinch': Q[iPinch]
+    }
+
+
+cpdef dict compositeCurves(FlowState flowInHot, FlowState flowOutHot, FlowState flowInCold, FlowState flowOutCold, unsigned char sense=COUNTERFLOW, unsigned int N=201):
+    """dict: Hot and cold composite curves of a heat exchanger between the given incoming and outgoing FlowStates. The temperatures of both flows are evaluated at N fractions of the heat duty, plus the fractions at which either flow meets its saturation curve, so the minimum temperature difference found is the true pinch rather than its value at a few known states. The enthalpy of each flow varies linearly with heat duty, so heat losses (different hot and cold duties) are accounted for.
+
+Returns a dict with:
+
+- 'Q': heat duty [W] absorbed by the cold flow, measured from the end at which the cold flow enters.
+- 'hHot', 'THot', 'hCold', 'TCold': specific enthalpies [J/kg] and temperatures [K] of the flows along Q.
+- 'dT': temperature difference THot - TCold [K] along Q.
+- 'pinch', 'iPinch', 'QPinch': minimum of dT [K], its index and the heat duty at which it occurs [W].
+
+Parameters
+-----------
+flowInHot, flowOutHot : FlowState
+    Incoming and outgoing hot flows.
+flowInCold, flowOutCold : FlowState
+    Incoming and outgoing cold flows. The mass flow rate of flowInCold sets Q.
+sense : unsigned char, optional
+    Flow sense, COUNTERFLOW or PARALLELFLOW. Defaults to COUNTERFLOW.
+N : int, optional
+    Number of evenly spaced grid points. Defaults to 201.
+    """
+    cdef double hInHot = flowInHot.h(), hOutHot = flowOutHot.h(), hInCold = flowInCold.h(), hOutCold = flowOutCold.h()
+    cdef list knees = _kneeFractions(flowInCold, hInCold, hOutCold)
+    if sense == COUNTERFLOW:
+        knees += _kneeFractions(flowInHot, hOutHot, hInHot)
+    elif sense == PARALLELFLOW:
+        knees += _kneeFractions(flowInHot, hInHot, hOutHot)
+    else:
+        msg = "compositeCurves(): flow sense must be COUNTERFLOW or PARALLELFLOW (given: {})".format(sense)
+        log("error", msg)
+        raise ValueError(msg)
+    fraction = _grid(N, knees)
+    hCold = hInCold + fraction * (hOutCold - hInCold)
+    if sense == COUNTERFLOW:
+        hHot = hOutHot + fraction * (hInHot - hOutHot)
+    else:
+        hHot = hInHot + fraction * (hOutHot - hInHot)
+    return _curves(fraction, hHot, temperatures(flowInHot, hHot, flowInHot.p()),
+                   hCold, temperatures(flowInCold, hCold, flowInCold.p()),
+                   flowInCold.m * (hOutCold - hInCold))
+
+
+cpdef dict hxCompositeCurves(hx, unsigned int N=201):
+    """dict: Composite curves of a heat exchanger with a secondary flow, eg; HxBasic, from its incoming and outgoing FlowStates (see :meth:`compositeCurves`). The hot flow is the secondary fluid if the Hx is an evaporator.
+
+Parameters
+-----------
+hx : HxBasic
+    Heat exchanger that has been run or sized.
+N : int, optional
+    Number of evenly spaced grid points. Defaults to 201.
+    """
+    if hx.isEvap():
+        return compositeCurves(hx.flowsIn[1], hx.flowsOut[1], hx.flowsIn[0], hx.flowsOut[0], hx.flowConfig.sense, N)
+    else:
+        return compositeCurves(hx.flowsIn[0], hx.flowsOut[0], hx.flowsIn[1], hx.flowsOut[1], hx.flowConfig.sense, N)
+
+
+cdef class _PinchWf:
+    """Composite curve of the working fluid on a fixed grid, shared by every mass flow rate tried by :meth:`solveMassPinch`."""
+    cdef FlowState flowInSf
+    cdef bint isEvap
+    cdef unsigned char sense
+    cdef double hInWf, hOutWf, hInSf, efficiencyFactorWf, efficiencyFactorSf
+    cdef object fraction, hWf, TWf
+
+    def __init__(self, FlowState flowInWf, FlowState flowOutWf, FlowState flowInSf, unsigned char sense, double efficiencyFactorWf, double efficiencyFactorSf, unsigned int N):
+        if sense != COUNTERFLOW and sense != PARALLELFLOW:
+            msg = "flow sense must be COUNTERFLOW or PARALLELFLOW (given: {})".format(sense)
+            log("error", msg)
+            raise ValueError(msg)
+        self.flowInSf = flowInSf
+        self.isEvap = flowInSf.T() > flowInWf.T()
+        self.sense = sense
+        self.hInWf = flowInWf.h()
+        self.hOutWf = flowOutWf.h()
+        self.hInSf = flowInSf.h()
+        self.efficiencyFactorWf = efficiencyFactorWf
+        self.efficiencyFactorSf = efficiencyFactorSf
+        self.fraction = _grid(N, _kneeFractions(flowInWf, self.hInWf, self.hOutWf))
+        self.hWf = self.hInWf + self.fraction * (self.hOutWf - self.hInWf)
+        self.TWf = temperatures(flowInWf, self.hWf, flowInWf.p())
+
+    cdef double hOutSf(self, double mWf):
+        """float: Outgoing secondary fluid enthalpy for the working fluid mass flow rate mWf."""
+        return self.hInSf - mWf * self.efficiencyFactorWf * (self.hOutWf - self.hInWf) / self.flowInSf.m / self.efficiencyFactorSf
+
+    cdef dict curves(self, double mWf):
+        cdef double hOutSf = self.hOutSf(mWf)
+        if self.sense == COUNTERFLOW:
+            # secondary fluid leaves at the end the working fluid enters
+            hSf = hOutSf + self.fraction * (self.hInSf - hOutSf)
+        else:
+            hSf = self.hInSf + self.fraction * (hOutSf - self.hInSf)
+        TSf = temperatures(self.flowInSf, hSf, self.flowInSf.p())
+        if self.isEvap:
+            return _curves(self.fraction, hSf, TSf, self.hWf, self.TWf, mWf * (self.hOutWf - self.hInWf))
+        elif self.sense == PARALLELFLOW:
+            return _curves(self.fraction, self.hWf, self.TWf, hSf, TSf, self.flowInSf.m * (hOutSf - self.hInSf))
+        else:
+            # measure Q from the end the secondary fluid enters
+            return _curves(1 - self.fraction[::-1], self.hWf[::-1], self.TWf[::-1], hSf[::-1], TSf[::-1], self.flowInSf.m * (hOutSf - self.hInSf))
+
+
+cdef class _PinchResidual(Residual):
+    cdef _PinchWf wf
+    cdef double pinch
+
+    def __init__(self, _PinchWf wf, double pinch):
+        self.wf = wf
+        self.pinch = pinch
+
+    cdef double f(self, double x) except *:
+        return self.wf.curves(x)['pinch'] - self.pinch
+
+
+cpdef dict matchedCompositeCurves(FlowState flowInWf, FlowState flowOutWf, FlowState flowInSf, double mWf, unsigned char sense=COUNTERFLOW, double efficiencyFactorWf=1, double efficiencyFactorSf=1, unsigned int N=201):
+    """dict: Composite curves (see :meth:`compositeCurves`) of a heat exchanger between the given working fluid states, with the outgoing secondary fluid found by energy balance for the working fluid mass flow rate mWf. Suited to cycles, whose secondary flows are only known once the cycle has been run. The Hx is an evaporator if flowInSf is hotter than flowInWf.
+
+Parameters
+-----------
+flowInWf, flowOutWf : FlowState
+    Incoming and outgoing working fluid.
+flowInSf : FlowState
+    Incoming secondary fluid, with its mass flow rate.
+mWf : float
+    Working fluid mass flow rate [kg/s].
+sense : unsigned char, optional
+    Flow sense, COUNTERFLOW or PARALLELFLOW. Defaults to COUNTERFLOW.
+efficiencyFactorWf, efficiencyFactorSf : float, optional
+    Efficiency factors of the working and secondary fluid heat duties, as HxBasic._efficiencyFactorWf() and _efficiencyFactorSf(). Default to 1.
+N : int, optional
+    Number of evenly spaced grid points. Defaults to 201.
+    """
+    return _PinchWf(flowInWf, flowOutWf, flowInSf, sense, efficiencyFactorWf, efficiencyFactorSf, N).curves(mWf)
+
+
+cpdef double solveMassPinch(FlowState flowInWf, FlowState flowOutWf, FlowState flowInSf, double pinch, unsigned char sense=COUNTERFLOW, double efficiencyFactorWf=1, double efficiencyFactorSf=1, unsigned int N=201, double mGuess=nan, double rtol=1e-10, double xtol=1e-12) except *:
+    """float: Working fluid mass flow rate [kg/s] at which the pinch of the composite curves (see :meth:`matchedCompositeCurves`) equals pinch. The pinch decreases monotonically with the working fluid mass flow rate, so the root is bracketed by :meth:`bracket_root` between 0 and the mass flow rate at which the outgoing secondary fluid reaches the incoming working fluid temperature, neither of which is evaluated, and solved by :meth:`brentq`. The working fluid composite curve is evaluated once and shared by every mass flow rate tried. Raises ValueError if pinch cannot be reached, eg; if it exceeds the temperature difference at a vanishing mass flow rate.
+
+Parameters
+-----------
+flowInWf, flowOutWf : FlowState
+    Incoming and outgoing working fluid.
+flowInSf : FlowState
+    Incoming secondary fluid, with its mass flow rate.
+pinch : float
+    Target pinch-point temperature difference [K].
+sense : unsigned char, optional
+    Flow sense, COUNTERFLOW or PARALLELFLOW. Defaults to COUNTERFLOW.
+efficiencyFactorWf, efficiencyFactorSf : float, optional
+    Efficiency factors of the working and secondary fluid heat duties. Default to 1.
+N : int, optional
+    Number of evenly spaced grid points. Defaults to 201.
+mGuess : float, optional
+    Estimate of the solution, used as the bracket hint. If nan, the hint is a quarter and a half of the upper limit. Defaults to nan.
+rtol, xtol : float, optional
+    Relative and absolute tolerances of the solution. Default to 1e-10 and 1e-12.
+    """
+    cdef _PinchWf wf = _PinchWf(flowInWf, flowOutWf, flowInSf, sense, efficiencyFactorWf, efficiencyFactorSf, N)
+    cdef double hSfLimit = flowInSf.copyUpdateState(PT_INPUTS, flowInSf.p(), flowInWf.T()).h()
+    cdef double mMax = flowInSf.m * efficiencyFactorSf * (wf.hInSf - hSfLimit) / efficiencyFactorWf / (wf.hOutWf - wf.hInWf)
+    if not mMax > 0:
+        msg = "solveMassPinch(): working fluid states and secondary fluid do not allow heat transfer (upper limit of mass flow rate: {})".format(mMax)
+        log("error", msg)
+        raise ValueError(msg)
+    if isnan(mGuess) or not 0 < mGuess < mMax:
+        mGuess = 0.25 * mMax
+        return find_root(_PinchResidual(wf, pinch), mGuess, 2 * mGuess, (), 0, mMax, rtol, xtol)
+    return find_root(_PinchResidual(wf, pinch), 0.9 * mGuess, min(1.1 * mGuess, 0.5 * (mGuess + mMax)), (), 0, mMax, rtol, xtol)
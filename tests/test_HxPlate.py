@@ -1,5 +1,7 @@
 import unittest
 import mcycle as mc
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from math import nan
 
 
 class TestHxPlate(unittest.TestCase):
@@ -41,6 +43,42 @@ class TestHxPlate(unittest.TestCase):
         })
         self.hx.unitise()
 
+    def test_0_unitise_phases(self):
+        self.hx.update({
+            'flowInWf': self.flowInWf,
+            'flowInSf': self.flowInSf,
+            'flowOutWf': self.flowOutWf,
+            'flowOutSf': self.flowOutSf
+        })
+        self.hx.unitise()
+        for unit in self.hx._units:
+            self.assertEqual(unit._unitPhaseWf,
+                             mc.get_unitPhase(unit.flowInWf, unit.flowOutWf))
+            self.assertEqual(unit._unitPhaseSf,
+                             mc.get_unitPhase(unit.flowInSf, unit.flowOutSf))
+
+    def test_0_unitise_methods(self):
+        self.hx.update({
+            'flowInWf': self.flowInWf,
+            'flowInSf': self.flowInSf,
+            'flowOutWf': self.flowOutWf,
+            'flowOutSf': self.flowOutSf
+        })
+        self.hx.unitise()
+        for unit in self.hx._units:
+            ret = getattr(mc.methods.heat_transfer, unit._methodHeatWf)(
+                flowIn=unit.flowInWf,
+                flowOut=unit.flowOutWf,
+                N=unit._NWf(),
+                geom=unit.geomWf,
+                L=unit.L,
+                W=unit.W,
+                flowConfig=unit.flowConfig,
+                is_wf=False,
+                geom2=unit.geomSf)
+            self.assertEqual(unit._hWf(), ret["h"])
+            self.assertEqual(unit._dpFWf(), ret["dpF"])
+
     def test_1_size_L(self):
         self.hx.update({
             'L': 269e-3,
@@ -88,6 +126,232 @@ class TestHxPlate(unittest.TestCase):
         self.hx.size()
         self.assertEqual(self.hx.NPlate, 23)
 
+    def test_1_size_NPlate_wide_bounds(self):
+        self.hx.update({
+            'L': 0.268278920236407,
+            'NPlate': 23,
+            'geomWf.b': 1.096e-3,
+            'W': 95e-3
+        })
+        self.hx.update({'sizeAttr': 'NPlate', 'sizeBounds': [3, 100]})
+        self.hx.size()
+        self.assertEqual(self.hx.NPlate, 23)
+        self.assertAlmostEqual(
+            abs(self.hx.L - 0.268278920236407) / 0.268278920236407, 0, 2)
+
+    def test_1_size_NPlate_hint(self):
+        self.hx.update({
+            'L': 0.268278920236407,
+            'NPlate': 23,
+            'geomWf.b': 1.096e-3,
+            'W': 95e-3
+        })
+        self.hx.update({'sizeAttr': 'NPlate', 'sizeBounds': [3, 100]})
+        self.hx.size()
+        hint = self.hx.sizeHint()
+        lo, hi = hint['brackets']['NPlate']
+        self.assertTrue(lo <= 23 <= hi <= lo + 1)
+        self.assertEqual(len(hint['sizeUnits']), len(self.hx._units))
+        hx = self.hx.copy()
+        hx.update({'NPlate': 40, 'L': 0.268278920236407})
+        hx.setSizeHint(hint)
+        hx.size()
+        self.assertEqual(hx.NPlate, 23)
+        self.assertEqual(hx._brackets['NPlate'], (lo, hi))
+
+    def test_1_size_L_executor(self):
+        self.hx.update({
+            'L': 269e-3,
+            'NPlate': 23,
+            'geomWf.b': 1.096e-3,
+            'W': 95e-3,
+            'sizeAttr': 'L',
+            'sizeBounds': [0.005, 0.5]
+        })
+        self.hx.size()
+        L = self.hx.L
+        for executor in [ThreadPoolExecutor(2), ProcessPoolExecutor(2)]:
+            with executor:
+                self.hx.config.executor = executor
+                try:
+                    self.hx.size()
+                finally:
+                    self.hx.config.executor = None
+            self.assertAlmostEqual(self.hx.L, L, 10)
+
+    def test_1_size_L_warm_start(self):
+        self.hx.update({
+            'L': 269e-3,
+            'NPlate': 23,
+            'geomWf.b': 1.096e-3,
+            'W': 95e-3,
+            'sizeAttr': 'L',
+            'sizeBounds': [0.005, 0.5]
+        })
+        self.hx.size()
+        L = self.hx.L
+        for unit in self.hx._units:
+            self.assertEqual(unit._sizeUnitsLast, unit.L)
+        self.hx.unitise()
+        self.hx.size()
+        self.assertAlmostEqual(self.hx.L, L, 6)
+
+    def test_1_size_L_divAdaptive(self):
+        self.hx.update({
+            'L': 269e-3,
+            'NPlate': 23,
+            'geomWf.b': 1.096e-3,
+            'W': 95e-3,
+            'flowInWf': self.flowInWf,
+            'flowInSf': self.flowInSf,
+            'flowOutWf': self.flowOutWf,
+            'flowOutSf': self.flowOutSf
+        })
+        config = self.hx.config
+        divT, divX = config.divT, config.divX
+        try:
+            config.update({'divT': 0.2, 'divX': 0.01})
+            self.hx.unitise()
+            L_fine = self.hx.size_L()
+            config.update({'divT': divT, 'divX': divX})
+            self.hx.unitise()
+            NUnits_uniform = len(self.hx._units)
+            L_uniform = self.hx.size_L()
+            config.divAdaptive = True
+            self.hx.unitise()
+            NUnits_adaptive = len(self.hx._units)
+            L_adaptive = self.hx.size_L()
+        finally:
+            config.update({'divT': divT, 'divX': divX, 'divAdaptive': False})
+            self.hx.unitise()
+        self.assertLessEqual(NUnits_adaptive, NUnits_uniform)
+        self.assertLess(
+            abs(L_adaptive - L_fine), 0.5 * abs(L_uniform - L_fine))
+        self.assertAlmostEqual(abs(L_adaptive - L_fine) / L_fine, 0, 3)
+
+    def test_1_sweep(self):
+        self.hx.update({
+            'L': 269e-3,
+            'NPlate': 23,
+            'geomWf.b': 1.096e-3,
+            'W': 95e-3,
+            'flowInWf': self.flowInWf,
+            'flowInSf': self.flowInSf,
+            'flowOutWf': self.flowOutWf,
+            'flowOutSf': self.flowOutSf
+        })
+        ret = self.hx.sweep({'NPlate': [21, 23], 'W': [95e-3, 0.1]})
+        self.assertEqual(ret['L'].shape, (2, 2))
+        self.assertAlmostEqual(abs(ret['L'][1, 0] - 269e-3) / 269e-3, 0, 2)
+        self.assertGreater(ret['L'][0, 0], ret['L'][1, 0])
+        self.assertGreater(ret['mass'][1, 0], 0)
+        self.assertEqual(self.hx.NPlate, 23)
+
+    def test_1_unitCorrelations(self):
+        self.hx.update({
+            'L': 269e-3,
+            'NPlate': 23,
+            'geomWf.b': 1.096e-3,
+            'W': 95e-3,
+            'flowInWf': self.flowInWf,
+            'flowInSf': self.flowInSf,
+            'flowOutWf': self.flowOutWf,
+            'flowOutSf': self.flowOutSf,
+            'sizeAttr': 'L',
+            'sizeBounds': [0.005, 0.5]
+        })
+        self.hx.size()
+        for wf in [True, False]:
+            ret = self.hx.unitCorrelations(wf)
+            for i, unit in enumerate(self.hx.units()):
+                h = unit._hWf() if wf else unit._hSf()
+                dpF = unit._dpFWf() if wf else unit._dpFSf()
+                self.assertAlmostEqual(ret['h'][i] / h, 1, 10)
+                self.assertAlmostEqual(ret['dpF'][i] / dpF, 1, 10)
+
+    def test_1_size_L_dpF_stored(self):
+        self.hx.update({
+            'L': 269e-3,
+            'NPlate': 23,
+            'geomWf.b': 1.096e-3,
+            'W': 95e-3,
+            'sizeAttr': 'L',
+            'sizeBounds': [0.005, 0.5]
+        })
+        self.hx.size()
+        dpWf = self.hx.dpWf()
+        self.assertEqual(self.hx.dpWf(), dpWf)
+        self.hx.update({'geomWf.b': 1.0e-3})
+        self.assertGreater(self.hx.dpWf(), dpWf)
+        self.hx.update({'geomWf.b': 1.096e-3})
+        self.assertAlmostEqual(self.hx.dpWf(), dpWf, 7)
+        self.hx.geomWf.b = 1.0e-3
+        try:
+            self.assertGreater(self.hx.dpWf(), dpWf)
+        finally:
+            self.hx.geomWf.b = 1.096e-3
+        self.assertAlmostEqual(self.hx.dpWf(), dpWf, 7)
+
+    def test_1_copy_twophase_units(self):
+        self.hx.update({
+            'L': 269e-3,
+            'NPlate': 23,
+            'geomWf.b': 1.096e-3,
+            'W': 95e-3,
+            'flowInWf': self.flowInWf,
+            'flowInSf': self.flowInSf,
+            'flowOutWf': self.flowOutWf,
+            'flowOutSf': self.flowOutSf
+        })
+        self.hx.unitise()
+        L = self.hx.size_L()
+        copy = self.hx.copy()
+        self.assertIn(mc.UNITPHASE_TWOPHASE_EVAPORATING,
+                      [unit._unitPhaseWf for unit in copy._units])
+        for attr in ('_unitPhaseWf', '_unitPhaseSf', '_methodHeatWf',
+                     '_methodHeatSf', '_methodFrictionWf',
+                     '_methodFrictionSf'):
+            self.assertEqual([getattr(unit, attr) for unit in copy._units],
+                             [getattr(unit, attr) for unit in self.hx._units])
+        self.assertAlmostEqual(copy.size_L(), L, 7)
+
+    def test_1_compactUnits(self):
+        self.hx.update({
+            'L': 269e-3,
+            'NPlate': 23,
+            'geomWf.b': 1.096e-3,
+            'W': 95e-3,
+            'sizeAttr': 'L',
+            'sizeBounds': [0.005, 0.5]
+        })
+        self.hx.size()
+        L = [unit.L for unit in self.hx._units]
+        dpFWf = self.hx.dpFWf()
+        self.hx.compactUnits()
+        self.assertEqual(self.hx._units, [])
+        self.assertEqual(len(self.hx._unitArrays), len(L))
+        self.assertAlmostEqual(self.hx._unitArrays.dpFWf.sum(), dpFWf, 7)
+        self.assertAlmostEqual(self.hx.dpFWf() / dpFWf, 1, 9)
+        self.assertIsNone(self.hx._unitArrays)
+        for i in range(len(L)):
+            self.assertAlmostEqual(self.hx._units[i].L, L[i], 10)
+
+    def test_1_size_multi(self):
+        self.hx.update({
+            'L': 269e-3,
+            'NPlate': 23,
+            'geomWf.b': 1.0e-3,
+            'W': 0.1
+        })
+        self.hx.size_multi(['W', 'geomWf.b'], {
+            'L': 0.268279,
+            'dpWf': 39607.27
+        })
+        self.assertAlmostEqual(abs(self.hx.W - 95e-3) / 95e-3, 0, 4)
+        self.assertAlmostEqual(
+            abs(self.hx.geomWf.b - 1.096e-3) / 1.096e-3, 0, 4)
+        self.hx.update({'geomWf.b': 1.096e-3, 'W': 95e-3})
+
     def test_1_size_L_solution_not_in_bounds_Exception(self):
         self.hx.update({'sizeAttr': 'L', 'sizeBounds': [0.5, 5.]})
         self.hx.size()
@@ -135,6 +399,108 @@ class TestHxPlate(unittest.TestCase):
         #self.hx.summary(flowKeys='all')
         self.assertAlmostEqual(self.hx.flowOutWf.T(), 643.66, 2)
 
+    def test_run1_no_bounds(self):
+        flowInWf = mc.FlowState("R245fa", 2, mc.PT_INPUTS, 2e5, 300.)
+        flowInSf = mc.FlowState("water", 5., mc.PT_INPUTS, 1e5, 600.)
+        self.hx.update({
+            'L': 0.269,
+            'NPlate': 5,
+            'geomWf.b': 1.096e-3,
+            'W': 95e-3,
+            'flowInWf': flowInWf,
+            'flowInSf': flowInSf,
+            'sizeUnitsBounds': [1e-5, 1.],
+            'runBounds': [nan, nan]
+        })
+        self.hx.run()
+        self.assertAlmostEqual(self.hx.flowOutWf.T(), 318.22, 2)
+        self.assertIn('run', self.hx._brackets)
+
+    def test_run_batch(self):
+        flowInWf = mc.FlowState("R245fa", 2, mc.PT_INPUTS, 2e5, 300.)
+        flowsInSf = [
+            mc.FlowState("water", 5., mc.PT_INPUTS, 1e5, T)
+            for T in [620., 600., 580.]
+        ]
+        self.hx.update({
+            'L': 0.269,
+            'NPlate': 5,
+            'geomWf.b': 1.096e-3,
+            'W': 95e-3,
+            'flowInWf': flowInWf,
+            'flowInSf': flowsInSf[1],
+            'sizeUnitsBounds': [1e-5, 1.],
+            'runBounds': [nan, nan]
+        })
+        self.hx.run()
+        ret = self.hx.run_batch(flowInWf, flowsInSf)
+        self.assertAlmostEqual(ret['flowOutWf'][1].T(), self.hx.flowOutWf.T(), 5)
+        self.assertGreater(ret['Q'][0], ret['Q'][1])
+        self.assertGreater(ret['Q'][1], ret['Q'][2])
+        self.assertEqual(ret['dpWf'].shape, (3, ))
+        self.assertIs(self.hx.flowInSf, flowsInSf[1])
+
+    def test_run_quasi(self):
+        self.hx.update({
+            'L': 269e-3,
+            'NPlate': 23,
+            'geomWf.b': 1.096e-3,
+            'W': 95e-3,
+            'flowInWf': self.flowInWf,
+            'flowInSf': self.flowInSf,
+            'flowOutWf': self.flowOutWf,
+            'flowOutSf': self.flowOutSf,
+            'sizeAttr': 'L',
+            'sizeBounds': [0.005, 0.5],
+            'runBounds': [nan, nan]
+        })
+        self.hx.unitise()
+        self.hx.size()
+        self.hx.captureUA()
+        self.hx.update({'flowInSf': self.flowInSf.copyUpdate({'m': 0.108})})
+        self.hx.run_quasi(fallback=False)
+        self.assertAlmostEqual(self.hx.Q() / 99921.4, 1, 2)
+        self.hx.update({'flowInSf': self.flowInSf})
+
+    def test_run_marching(self):
+        flowInWf = mc.FlowState("R245fa", 2, mc.PT_INPUTS, 2e5, 300.)
+        flowInSf = mc.FlowState("water", 5., mc.PT_INPUTS, 1e5, 600.)
+
+        hLowerBound = flowInWf.h() * 1.01
+        hUpperBound = flowInWf.copyUpdateState(mc.PT_INPUTS, 2e5, 350.).h()
+
+        self.hx.update({
+            'L': 0.269,
+            'NPlate': 5,
+            'geomWf.b': 1.096e-3,
+            'W': 95e-3,
+            'flowInWf': flowInWf,
+            'flowInSf': flowInSf,
+            'sizeUnitsBounds': [1e-5, 1.],
+            'runBounds': [hLowerBound, hUpperBound]
+        })
+        self.hx.run_marching()
+        self.assertAlmostEqual(self.hx.flowOutWf.T(), 318.22, 2)
+        self.assertAlmostEqual(sum(unit.L for unit in self.hx._units), 0.269, 7)
+
+    def test_run_marching_no_bounds(self):
+        flowInWf = mc.FlowState("R245fa", 2, mc.PT_INPUTS, 2e5, 300.)
+        flowInSf = mc.FlowState("water", 5., mc.PT_INPUTS, 1e5, 600.)
+
+        self.hx.update({
+            'L': 0.269,
+            'NPlate': 5,
+            'geomWf.b': 1.096e-3,
+            'W': 95e-3,
+            'flowInWf': flowInWf,
+            'flowInSf': flowInSf,
+            'sizeUnitsBounds': [1e-5, 1.],
+            'runBounds': [nan, nan]
+        })
+        self.hx.run_marching()
+        self.assertAlmostEqual(self.hx.flowOutWf.T(), 318.22, 2)
+        self.assertAlmostEqual(sum(unit.L for unit in self.hx._units), 0.269, 7)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import mcycle as mc
+
+
+class TestHxPlateSurrogate(unittest.TestCase):
+    config = mc.Config()
+    config.update({'dpAcc': False, 'dpPort': False, 'dpHead': False})
+    config.set_method("savostinTikhonov_sp", "GeomHxPlateChevron",
+                      mc.TRANSFER_ALL, mc.UNITPHASE_ALL, mc.SECONDARY_FLUID)
+    hx = mc.HxPlateSurrogate(
+        flowConfig=mc.HxFlowConfig(mc.COUNTERFLOW, 1, '', True, True),
+        RfWf=0,
+        RfSf=0,
+        plate=mc.library.stainlessSteel_316(573.15),
+        tPlate=0.424e-3,
+        geomWf=mc.GeomHxPlateChevron(1.096e-3, 60, 10e-3, 1.117),
+        geomSf=mc.GeomHxPlateChevron(1.096e-3, 60, 10e-3, 1.117),
+        L=269e-3,
+        W=95e-3,
+        portWf=mc.Port(d=0.0125),
+        portSf=mc.Port(d=0.0125),
+        NPlate=23,
+        coeffs_LPlate=[0.056, 1],
+        coeffs_WPlate=[0, 1],
+        efficiencyThermal=1.0,
+        flowInWf=mc.FlowState("R123", 0.34307814292524513, mc.PT_INPUTS,
+                              1000000., 300.57890653991603),
+        flowOutWf=mc.FlowState("R123", 0.34307814292524513, mc.PT_INPUTS,
+                               1000000., 414.30198149532583),
+        flowInSf=mc.FlowState("Air", 0.09, mc.PT_INPUTS, 111600., 1170.),
+        flowOutSf=mc.FlowState("Air", 0.09, mc.PT_INPUTS, 111600.,
+                               310.57890653991603),
+        sizeAttr='L',
+        sizeBounds=[0.005, 0.5],
+        config=config)
+
+    def test_0_untrained(self):
+        hx = self.hx.copy()
+        self.assertFalse(hx.inDomain())
+        hx.unitise()
+        self.assertAlmostEqual(
+            abs(hx.size_L() - 0.268279) / 0.268279, 0, 4)
+
+    def test_1_train_size_L(self):
+        self.hx.train({
+            'W': [0.09, 0.1],
+            'geomWf.b': [1.0e-3, 1.1e-3],
+            'NPlate': [19, 27]
+        }, 30)
+        self.assertLess(self.hx.errorL, 0.01)
+        self.hx.update({'W': 95e-3, 'geomWf.b': 1.096e-3, 'NPlate': 23})
+        self.assertTrue(self.hx.inDomain())
+        self.hx.size()
+        self.assertAlmostEqual(abs(self.hx.L - 0.268279) / 0.268279, 0, 2)
+
+    def test_2_outside_domain(self):
+        self.hx.update({'W': 95e-3, 'geomWf.b': 1.096e-3, 'NPlate': 23})
+        self.hx.update({'flowInSf': self.hx.flowInSf.copyUpdateState(mc.PT_INPUTS, 111600., 1171.)})
+        self.assertFalse(self.hx.inDomain())
+        self.hx.update({'flowInSf': mc.FlowState("Air", 0.09, mc.PT_INPUTS, 111600., 1170.)})
+        self.hx.update({'W': 0.12})
+        self.assertFalse(self.hx.inDomain())
+        self.hx.unitise()
+        L = self.hx.size_L()
+        hx = self.hx.copy()
+        hx.unitise()
+        self.assertAlmostEqual(L / hx.size_L(), 1, 6)
+
+    def test_3_non_box_input_changed(self):
+        self.hx.update({'W': 95e-3, 'geomWf.b': 1.096e-3, 'NPlate': 23})
+        self.assertTrue(self.hx.inDomain())
+        self.hx.update({'geomSf.b': 3e-3, 'tPlate': 3e-3})
+        try:
+            self.assertFalse(self.hx.inDomain())
+            self.hx.unitise()
+            L = self.hx.size_L()
+            hx = self.hx.copy()
+            hx.unitise()
+            self.assertAlmostEqual(L / hx.size_L(), 1, 6)
+        finally:
+            self.hx.update({'geomSf.b': 1.096e-3, 'tPlate': 0.424e-3})
+        self.assertTrue(self.hx.inDomain())
+        self.hx.config.divT += 1
+        try:
+            self.assertFalse(self.hx.inDomain())
+        finally:
+            self.hx.config.divT -= 1
+        self.assertTrue(self.hx.inDomain())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+import mcycle as mc
+
+
+class TestHxSimple(unittest.TestCase):
+    wf = mc.FlowState("R123", 0.5, mc.PT_INPUTS, 10.e5, 300.)
+    sf = mc.FlowState("Air", 1.0, mc.PT_INPUTS, 1.116e5, 500.)
+    hx = mc.HxSimple(U=200., A=2., efficiencyThermal=0.95, flowInWf=wf, flowInSf=sf)
+
+    def test_run(self):
+        self.hx.run()
+        self.assertAlmostEqual(self.hx.Q() / self.hx.Q_lmtd(), 1., 7)
+        self.assertAlmostEqual(self.hx.flowsOut[0].h(), 331685.6275518836, 2)
+        self.assertTrue(0 < self.hx.flowsOut[0].x() < 1)
+
+    def test_run_batch(self):
+        flowsInWf = [self.wf.copyUpdateState(mc.PT_INPUTS, p, 300.) for p in (8.e5, 10.e5, 12.e5)]
+        flowsInWf[0].m = 0.3
+        ret = self.hx.run_batch(flowsInWf, self.sf)
+        hx = self.hx.copy()
+        for i in range(3):
+            hx.update({'flowInWf': flowsInWf[i]})
+            hx.run()
+            self.assertAlmostEqual(ret['Q'][i] / hx.Q(), 1., 7)
+            self.assertAlmostEqual(ret['flowOutSf'][i].T(), hx.flowsOut[1].T(), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
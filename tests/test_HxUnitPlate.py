@@ -27,6 +27,24 @@ class TestHxUnitPlateCorrChevron(unittest.TestCase):
     hxUnit._methodHeatSf = "savostinTikhonov_sp"
     hxUnit._methodFrictionSf = "savostinTikhonov_sp"
 
+    def test_run_liq(self):
+        flowInWf = mc.FlowState("R123", 0.34307814292524513, mc.PT_INPUTS,
+                                1000000., 300.57890653991495)
+        flowInSf = mc.FlowState("Air", 0.09, mc.PT_INPUTS, 111600.,
+                                330.77794902610714)
+        self.hxUnit.update({
+            'flowInWf': flowInWf,
+            'flowInSf': flowInSf,
+            'L': 0.0636564105282744,
+            'W': 95e-3,
+            'geomWf.b': 1.096e-3
+        })
+        self.hxUnit._methodHeatWf = "chisholmWannairachchi_sp"
+        self.hxUnit._methodFrictionWf = "chisholmWannairachchi_sp"
+        self.hxUnit.run()
+        self.assertAlmostEqual(self.hxUnit.flowOutWf.T(), 305.79345550292123, 3)
+        self.assertAlmostEqual(self.hxUnit.flowOutSf.T(), 310.57890653991586, 2)
+
     def test_size_liq(self):
         flowInWf = mc.FlowState("R123", 0.34307814292524513, mc.PT_INPUTS,
                                 1000000., 300.57890653991495)
@@ -93,6 +93,21 @@ class TestRankineBasic(unittest.TestCase):
         self.assertAlmostEqual(
             abs(self.cycle.state3.T() / (self.cycle.TEvap + 30)) - 1, 0, 3)
 
+    def test_2_cached_efficiencyExergy(self):
+        self.cycle.update({"config.dpEvap": False, "evap.L": 0.269})
+        self.cycle.size()
+        efficiencyExergy = self.cycle.efficiencyExergy()
+        self.assertEqual(self.cycle._cache['efficiencyExergy'][1],
+                         efficiencyExergy)
+        sourceIn = self.cycle.sourceIn
+        sourceIn.updateState(mc.PT_INPUTS, sourceIn.p(), 1000.)
+        updated = self.cycle.efficiencyExergy()
+        self.assertNotAlmostEqual(updated, efficiencyExergy, 3)
+        self.cycle.clearCache()
+        self.assertEqual(self.cycle.efficiencyExergy(), updated)
+        sourceIn.updateState(mc.PT_INPUTS, sourceIn.p(), 1170.)
+        self.assertEqual(self.cycle.efficiencyExergy(), efficiencyExergy)
+
     '''
     def test_1_run_from_comp_dpEvap_True(self):
         self.cycle.update({
@@ -0,0 +1,44 @@
+import unittest
+import mcycle as mc
+
+
+class TestSolidMaterial(unittest.TestCase):
+    def test_k_stored_until_T_or_data_change(self):
+        mat = mc.library.stainlessSteel_316(573.15)
+        self.assertAlmostEqual(mat.k(), 17., 10)
+        mat.T = 673.15
+        self.assertAlmostEqual(mat.k(), 19., 10)
+        mat.update({'data': {'T': [273.15, 873.15], 'k': [10., 16.]}})
+        self.assertAlmostEqual(mat.k(), 14., 10)
+        mat.update({'deg': 1})
+        self.assertAlmostEqual(mat.k(), 14., 10)
+
+    def test_k_after_nested_update(self):
+        mat = mc.library.stainlessSteel_316(573.15)
+        mat.update({'data': {'T': [273.15, 873.15], 'k': [10., 16.]}})
+        self.assertAlmostEqual(mat.k(), 13., 10)
+        mat.update({'data.k': [20., 26.]})
+        self.assertAlmostEqual(mat.k(), 23., 10)
+
+    def test_library_data_editable(self):
+        mat = mc.library.stainlessSteel_316(573.15)
+        mat.data['k'][0] = mat.data['k'][0] + 1.
+        mat.populate_c()
+        self.assertIsInstance(mat.data['k'], list)
+        self.assertAlmostEqual(
+            mc.library.stainlessSteel_316(573.15).k(), 17., 10)
+
+    def test_library_shares_definition(self):
+        mat0 = mc.library.stainlessSteel_316(573.15)
+        mat1 = mc.library.stainlessSteel_316()
+        self.assertIsNot(mat0, mat1)
+        self.assertEqual(mat1.T, 293.15)
+        self.assertEqual(mat0.data['k'], mat1.data['k'])
+        self.assertIs(mat0.config, mc.defaults.CONFIG)
+        mat0.update({'data': {'T': [273.15, 873.15], 'k': [10., 16.]}})
+        self.assertAlmostEqual(
+            mc.library.stainlessSteel_316(573.15).k(), 17., 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
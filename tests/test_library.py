@@ -0,0 +1,50 @@
+import unittest
+import tempfile
+import os
+import mcycle as mc
+
+
+class TestLibrary(unittest.TestCase):
+    config = mc.Config()
+    config.update({'dpEvap': False})
+    config.set_method("savostinTikhonov_sp", "GeomHxPlateChevron",
+                      mc.TRANSFER_ALL, mc.UNITPHASE_ALL, mc.SECONDARY_FLUID)
+    cacheDir = tempfile.mkdtemp()
+
+    wfIn = mc.FlowState("R123", 0.343, mc.PT_INPUTS, 10.e5, 300.58)
+    wfOut = mc.FlowState("R123", 0.343, mc.PT_INPUTS, 10.e5, 414.3)
+    sfIn = mc.FlowState("Air", 0.09, mc.PT_INPUTS, 1.116e5, 1170.)
+    sfOut = sfIn.copyUpdateState(
+        mc.HmassP_INPUTS,
+        sfIn.h() - wfIn.m * (wfOut.h() - wfIn.h()) / sfIn.m, sfIn.p())
+
+    def hx(self):
+        hx = mc.library.alfaLaval_AC30EQ(
+            flowInWf=self.wfIn,
+            flowOutWf=self.wfOut,
+            flowInSf=self.sfIn,
+            flowOutSf=self.sfOut)
+        hx.update({'plate.T': 573.15, 'config': self.config})
+        return hx
+
+    def test_sizeCached(self):
+        hx = self.hx()
+        mc.library.sizeCached(hx, self.cacheDir)
+        self.assertEqual(len(os.listdir(self.cacheDir)), 1)
+        mc.library.heat_exchangers._designs.clear()
+        stored = self.hx()
+        mc.library.sizeCached(stored, self.cacheDir)
+        self.assertEqual(stored.NPlate, hx.NPlate)
+        self.assertAlmostEqual(stored.L, hx.L, 10)
+        self.assertEqual(len(stored.units()), len(hx.units()))
+        self.assertAlmostEqual(
+            sum(stored.unitArrays().A) / sum(hx.unitArrays().A), 1., 7)
+        other = self.hx()
+        other.update({'flowInSf.m': 0.1})
+        self.assertNotEqual(
+            mc.library.heat_exchangers._designKey(other),
+            mc.library.heat_exchangers._designKey(stored))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import pickle
 import mcycle as mc
 
 
@@ -31,6 +32,7 @@ class TestMethods(unittest.TestCase):
             mc.WORKING_FLUID] = {
                 mc.UNITPHASE_TWOPHASE_EVAPORATING: "yanLin_tpEvap"
             }
+        self.configTest.compileMethods()
         self.assertEqual(
             self.configTest.lookupMethod(
                 "HxPlate",
@@ -44,6 +46,7 @@ class TestMethods(unittest.TestCase):
             mc.WORKING_FLUID] = {
                 mc.UNITPHASE_ALL_TWOPHASE: "yanLin_tpEvap"
             }
+        self.configTest.compileMethods()
         self.assertEqual(
             self.configTest.lookupMethod(
                 "HxPlate",
@@ -57,6 +60,7 @@ class TestMethods(unittest.TestCase):
             mc.WORKING_FLUID] = {
                 mc.UNITPHASE_ALL: "yanLin_tpEvap"
             }
+        self.configTest.compileMethods()
         self.assertEqual(
             self.configTest.lookupMethod(
                 "HxPlate",
@@ -69,6 +73,7 @@ class TestMethods(unittest.TestCase):
         self.methods['GeomHxPlateChevron'][mc.TRANSFER_HEAT] = {
             mc.UNITPHASE_ALL_SINGLEPHASE: "yanLin_tpEvap"
         }
+        self.configTest.compileMethods()
         self.assertEqual(
             self.configTest.lookupMethod(
                 "HxPlate", ("GeomHxPlateChevron", mc.TRANSFER_HEAT,
@@ -79,6 +84,7 @@ class TestMethods(unittest.TestCase):
     def test_Methods_lookupMethod_HxPlateChevron_Error_method_is_None(
             self):
         self.methods['GeomHxPlateChevron'][mc.TRANSFER_FRICTION] = {}
+        self.configTest.compileMethods()
         with self.assertRaises(KeyError):
             self.configTest.lookupMethod(
                 "HxPlate",
@@ -103,12 +109,54 @@ class TestMethods(unittest.TestCase):
                 mc.UNITPHASE_LIQUID: "manglikBergles_offset_sp",
                 mc.UNITPHASE_VAPOUR: "manglikBergles_offset_sp"
             }
+        self.configTest.compileMethods()
         self.assertEqual(
             self.configTest.lookupMethod(
                 "HxPlate", ("GeomHxPlateFinOffset", mc.TRANSFER_FRICTION,
                             mc.UNITPHASE_LIQUID, mc.SECONDARY_FLUID)),
             "manglikBergles_offset_sp")
 
+    def test_Methods_lookupMethod_after_set_method(self):
+        config = mc.Config()
+        self.assertEqual(
+            config.lookupMethod(
+                "HxPlate", ("GeomHxPlateChevron", mc.TRANSFER_HEAT,
+                            mc.UNITPHASE_LIQUID, mc.WORKING_FLUID)),
+            "chisholmWannairachchi_sp")
+        config.set_method("savostinTikhonov_sp", "GeomHxPlateChevron",
+                          mc.TRANSFER_ALL, mc.UNITPHASE_ALL,
+                          mc.WORKING_FLUID)
+        self.assertEqual(
+            config.lookupMethod(
+                "HxPlate", ("GeomHxPlateChevron", mc.TRANSFER_HEAT,
+                            mc.UNITPHASE_LIQUID, mc.WORKING_FLUID)),
+            "savostinTikhonov_sp")
+
+    def test_Methods_lookupMethod_after_edit_in_place(self):
+        config = mc.Config()
+        self.assertEqual(
+            config.lookupMethod(
+                "HxPlate", ("GeomHxPlateChevron", mc.TRANSFER_HEAT,
+                            mc.UNITPHASE_LIQUID, mc.WORKING_FLUID)),
+            "chisholmWannairachchi_sp")
+        config.methods['GeomHxPlateChevron'][mc.TRANSFER_HEAT][
+            mc.UNITPHASE_ALL_SINGLEPHASE] = "savostinTikhonov_sp"
+        config.compileMethods()
+        self.assertEqual(
+            config.lookupMethod(
+                "HxPlate", ("GeomHxPlateChevron", mc.TRANSFER_HEAT,
+                            mc.UNITPHASE_LIQUID, mc.WORKING_FLUID)),
+            "savostinTikhonov_sp")
+
+
+    def test_Config_copy_and_pickle_keep_inputs(self):
+        config = mc.Config(maxWalls=7, gravity=9.7, maxIterComponent=11,
+                           maxIterCycle=13, divT=3., name="cfg")
+        for other in (config.copy(), pickle.loads(pickle.dumps(config))):
+            for k in config._inputs:
+                if k != 'executor':
+                    self.assertEqual(getattr(other, k), getattr(config, k), k)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+import mcycle as mc
+
+
+class TestPinch(unittest.TestCase):
+    wfIn = mc.FlowState("R123", mc.nan, mc.PT_INPUTS, 10.e5, 300.)
+    wfOut = mc.FlowState("R123", mc.nan, mc.PQ_INPUTS, 10.e5, 1.)
+    sfIn = mc.FlowState("Air", 1.0, mc.PT_INPUTS, 1.116e5, 500.)
+
+    def test_solveMassPinch(self):
+        m = mc.solveMassPinch(self.wfIn, self.wfOut, self.sfIn, 10.)
+        self.assertAlmostEqual(m, 0.8512590710309318, 7)
+        curves = mc.matchedCompositeCurves(self.wfIn, self.wfOut, self.sfIn, m)
+        self.assertAlmostEqual(curves['pinch'], 10., 7)
+        # pinch is at the bubble point, not at either end
+        self.assertAlmostEqual(
+            curves['TCold'][curves['iPinch']],
+            self.wfIn.copyUpdateState(mc.PQ_INPUTS, 10.e5, 0).T(), 7)
+        self.assertGreater(curves['dT'][0], 10.)
+        self.assertGreater(curves['dT'][len(curves['dT']) - 1], 10.)
+
+    def test_compositeCurves(self):
+        m = mc.solveMassPinch(self.wfIn, self.wfOut, self.sfIn, 10.)
+        wfIn = self.wfIn.copy()
+        wfIn.m = m
+        matched = mc.matchedCompositeCurves(wfIn, self.wfOut, self.sfIn, m)
+        sfOut = self.sfIn.copyUpdateState(mc.HmassP_INPUTS, matched['hHot'][0],
+                                          self.sfIn.p())
+        curves = mc.compositeCurves(self.sfIn, sfOut, wfIn, self.wfOut)
+        self.assertAlmostEqual(curves['pinch'], 10., 7)
+        self.assertAlmostEqual(curves['QPinch'], matched['QPinch'], 4)
+        self.assertAlmostEqual(curves['Q'][len(curves['Q']) - 1],
+                               m * (self.wfOut.h() - wfIn.h()), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
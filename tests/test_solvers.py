@@ -0,0 +1,54 @@
+import logging
+import unittest
+import mcycle as mc
+from math import nan
+
+
+class TestSolvers(unittest.TestCase):
+    def test_brentq(self):
+        self.assertAlmostEqual(
+            mc.brentq(lambda x, c: x**2 - c, 0., 3., (2., )), 2**0.5, 10)
+        self.assertAlmostEqual(
+            mc.brentq(mc.PyResidual(lambda x: x**3 - 8.), 0., 3.), 2., 10)
+        with self.assertRaises(ValueError):
+            mc.brentq(lambda x: x**2 + 1., -1., 1.)
+
+    def test_brentq_raises_residual_error(self):
+        def f(x):
+            if x > 1.5:
+                raise ZeroDivisionError
+            return x - 2.
+
+        with self.assertRaises(ZeroDivisionError):
+            mc.brentq(f, 0., 3.)
+
+    def test_secant(self):
+        self.assertAlmostEqual(mc.secant(lambda x: x**2 - 2., 1.), 2**0.5, 7)
+
+    def test_bracket_root_limits(self):
+        def f(x):
+            if x >= 4.:
+                return nan
+            return x - 3.5
+
+        a, b = mc.bracket_root(f, 0., 1., lower=-1., upper=10.)
+        self.assertTrue(a <= 3.5 <= b < 4.)
+        cache = {}
+        self.assertAlmostEqual(
+            mc.find_root(f, 0., 1., upper=10., cache=cache, key='x'), 3.5, 7)
+        self.assertEqual(cache['x'], (a, b))
+
+    def test_find_root_stale_cache_not_logged_as_error(self):
+        cache = {'x': (-3., -2.)}
+        with self.assertLogs(level='DEBUG') as cm:
+            self.assertAlmostEqual(
+                mc.find_root(lambda x: nan if x < 0. else x - 3.5, 0., 1.,
+                             lower=-5., upper=10., cache=cache, key='x'),
+                3.5, 7)
+        self.assertTrue(cm.records)
+        self.assertFalse(
+            [r for r in cm.records if r.levelno >= logging.ERROR])
+
+
+if __name__ == "__main__":
+    unittest.main()